@@ -4,11 +4,17 @@ Maximize API Usage Script
 Fetches news from all categories throughout the day to find the best content
 """
 
+import asyncio
+import os
 import requests
+import sys
 import time
 import random
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crisis-display', 'src'))
+from jobs.job_queue import job_outcome, wait_for_job
+
 class APIMaximizer:
     def __init__(self):
         self.base_url = "http://localhost:5000"
@@ -35,6 +41,16 @@ class APIMaximizer:
         except:
             return False
     
+    def wait_for_job(self, response, timeout=120):
+        """Follow a queued /refresh-news job until it finishes; returns its result"""
+        data = response.json()
+        if response.status_code != 202:
+            return data
+        return job_outcome(wait_for_job(self.get_job, data['job_id'], timeout))
+    
+    def get_job(self, job_id):
+        return requests.get(f"{self.base_url}/api/jobs/{job_id}", timeout=10).json()
+    
     def fetch_category_news(self, category):
         """Fetch news for specific category"""
         try:
@@ -42,10 +58,10 @@ class APIMaximizer:
             if category:
                 url += f"?category={category}"
                 
-            response = requests.get(url, timeout=30)
+            response = requests.get(url, timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code in (200, 202):
+                data = self.wait_for_job(response)
                 self.log(f"✅ {category}: {data.get('message', 'Success')}")
                 return data.get('success', False)
             else:
@@ -56,6 +72,27 @@ class APIMaximizer:
             self.log(f"❌ {category}: Error - {str(e)}")
             return False
     
+    def fetch_categories_news(self, categories):
+        """Fetch several categories in one request; the server fans them out in parallel"""
+        label = ", ".join(categories)
+        try:
+            url = f"{self.base_url}/refresh-news?categories={','.join(categories)}"
+            response = requests.get(url, timeout=10)
+            
+            if response.status_code in (200, 202):
+                data = self.wait_for_job(response)
+                self.log(f"✅ {label}: {data.get('message', 'Success')}")
+                for category, seconds in data.get('timings', {}).items():
+                    self.log(f"   ⏱️  {category}: {seconds}s")
+                return data.get('success', False)
+            else:
+                self.log(f"❌ {label}: HTTP {response.status_code}")
+                return False
+                
+        except Exception as e:
+            self.log(f"❌ {label}: Error - {str(e)}")
+            return False
+    
     def run_continuous_mode(self):
         """Run continuously to maximize API usage"""
         self.log("🚀 Starting API Maximizer - Continuous Mode")
@@ -69,40 +106,73 @@ class APIMaximizer:
             shuffled_categories = self.categories.copy()
             random.shuffle(shuffled_categories)
             
-            success_count = 0
-            for category in shuffled_categories:
-                if self.fetch_category_news(category):
-                    success_count += 1
-                
-                # Small delay between requests
-                time.sleep(2)
+            success = self.fetch_categories_news(shuffled_categories)
             
-            self.log(f"📈 Cycle {cycle_count} complete: {success_count}/{len(shuffled_categories)} successful")
+            self.log(f"📈 Cycle {cycle_count} complete: {'successful' if success else 'failed'}")
             
             # Wait before next cycle (10 minutes)
             self.log("⏳ Waiting 10 minutes before next cycle...")
             time.sleep(600)
     
+    def run_async_mode(self):
+        """Continuous mode on the async ingestion engine (no Flask server needed).
+        
+        All category and hot-topic queries run at once under the API key's
+        concurrency cap and rate limit, and each one is satirized and archived
+        as soon as it returns.
+        """
+        from api.async_newsdata import AsyncNewsDataAPI, ingest_stream
+        from api.disk_cache import DiskResponseCache
+        from generation.satire_engine import SatireEngine
+        from generation.fingerprint import StoryDeduplicator
+        from storage.factory import open_archive
+        
+        self.log("🚀 Starting API Maximizer - Async Continuous Mode")
+        # Same on-disk response cache as the Flask app, so both share fetched queries
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crisis-display', 'data', 'http_cache')
+        api = AsyncNewsDataAPI(cache=DiskResponseCache(cache_dir))
+        engine = SatireEngine()
+        # Same store the app reads (ARCHIVE_BACKEND), always shared: the server writes to it too,
+        # and an unshared compaction there would drop what this process appended
+        archive = open_archive(shared=True)
+        dedup = StoryDeduplicator(os.path.join(archive.storage_path, 'seen_stories.json'))
+        
+        async def run_cycle(queries):
+            added = 0
+            async for result in ingest_stream(api, queries, engine, archive, deduplicator=dedup):
+                if result['error']:
+                    self.log(f"❌ {result['query']}: {result['error']} ({result['seconds']}s)")
+                else:
+                    self.log(f"✅ {result['query']}: {result['added']} new from {result['stories']} stories ({result['seconds']}s)")
+                added += result['added']
+            return added
+        
+        cycle_count = 0
+        while True:
+            cycle_count += 1
+            queries = [{'category': c} for c in self.categories]
+            queries += [{'q': topic} for topic in random.sample(self.hot_topics, 3)]
+            self.log(f"\n📊 Cycle {cycle_count} - {len(queries)} queries in flight")
+            
+            added = asyncio.run(run_cycle(queries))
+            self.log(f"📈 Cycle {cycle_count} complete: {added} new articles (archive: {archive.get_article_count()})")
+            
+            self.log("⏳ Waiting 10 minutes before next cycle...")
+            time.sleep(600)
+    
     def run_burst_mode(self):
         """Run burst mode to quickly generate content"""
         self.log("⚡ Starting API Maximizer - Burst Mode")
         
-        # Fetch from all categories once
-        success_count = 0
-        for category in self.categories:
-            if self.fetch_category_news(category):
-                success_count += 1
-            time.sleep(1)  # Quick burst
+        # Fetch from all categories at once
+        success = self.fetch_categories_news(self.categories)
         
-        self.log(f"🎯 Burst complete: {success_count}/{len(self.categories)} successful")
+        self.log(f"🎯 Burst complete: {'successful' if success else 'failed'}")
         
         # Fetch hot topics (multiple rounds)
         for round_num in range(3):
             self.log(f"🔥 Hot Topics Round {round_num + 1}")
-            for category in ['politics', 'world', 'entertainment']:
-                if self.fetch_category_news(category):
-                    success_count += 1
-                time.sleep(1)
+            self.fetch_categories_news(['politics', 'world', 'entertainment'])
     
     def run_smart_mode(self):
         """Smart mode - focus on high-value categories"""
@@ -114,38 +184,33 @@ class APIMaximizer:
         # Multiple rounds for priority categories
         for round_num in range(3):
             self.log(f"🎯 Priority Round {round_num + 1}")
-            for category in priority_categories:
-                if self.fetch_category_news(category):
-                    success_count += 1
-                time.sleep(2)
+            self.fetch_categories_news(priority_categories)
         
         # One round of other categories
         self.log("📰 Standard Categories")
         other_categories = ['technology', 'science', 'health', 'finance', 'lifestyle']
-        for category in other_categories:
-            if self.fetch_category_news(category):
-                success_count += 1
-            time.sleep(2)
+        self.fetch_categories_news(other_categories)
 
 if __name__ == "__main__":
-    import sys
-    
-    if not requests.get("http://localhost:5000/").ok:
-        print("❌ Server not running! Please start the Flask server first.")
-        sys.exit(1)
-    
     maximizer = APIMaximizer()
     
     mode = sys.argv[1] if len(sys.argv) > 1 else "smart"
     
-    if mode == "continuous":
+    if mode != "async" and not maximizer.check_server():
+        print("❌ Server not running! Please start the Flask server first.")
+        sys.exit(1)
+    
+    if mode == "async":
+        maximizer.run_async_mode()
+    elif mode == "continuous":
         maximizer.run_continuous_mode()
     elif mode == "burst":
         maximizer.run_burst_mode()
     elif mode == "smart":
         maximizer.run_smart_mode()
     else:
-        print("Usage: python api_maximizer.py [continuous|burst|smart]")
+        print("Usage: python api_maximizer.py [continuous|async|burst|smart]")
         print("  continuous - Run continuously (10 min cycles)")
+        print("  async      - Continuous mode on the async engine, archiving as results stream in")
         print("  burst      - Quick burst of all categories")
         print("  smart      - Focus on high-value categories (default)")
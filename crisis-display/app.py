@@ -1,41 +1,334 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, current_app, has_app_context, render_template, request, jsonify, send_from_directory
+from flask.cli import with_appcontext
+from werkzeug.local import LocalProxy
+import click
+from datetime import datetime
+from functools import wraps
+import hashlib
 import sys
 import os
+import threading
+import time
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
-    from storage.archive import ArchiveManager
+    from storage.factory import open_archive
     from generation.satire_engine import SatireEngine
+    from generation.fingerprint import StoryDeduplicator
+    from generation.cache import GenerationCache
+    from pipeline.ingest import IngestRun
+    from jobs.job_queue import JobQueue, JobWorker
     from api.newsdata import NewsDataAPI
-    
-    # Initialize components
-    archive_manager = ArchiveManager()
-    satire_engine = SatireEngine()
-    news_api = NewsDataAPI()
-    comic_generator = None  # Not using comic generator for now
-    
-    # Auto-generate some satire content if archive is empty
-    if archive_manager.get_article_count() == 0:
-        print("Generating initial satire content...")
-        real_news = news_api.fetch_latest_news(limit=5)
-        if real_news:
-            satire_articles = satire_engine.batch_generate_satire(real_news)
-            for article in satire_articles:
-                archive_manager.add_article(article)
-            print(f"Generated {len(satire_articles)} satire articles")
-    
+    from api.disk_cache import DiskResponseCache
+    from api.cursors import CursorStore
+    from cache.page_cache import PageCache
+    MODULES_AVAILABLE = True
 except ImportError as e:
     print(f"Could not import modules: {e}")
-    archive_manager = None
-    satire_engine = None
-    news_api = None
-    comic_generator = None
+    MODULES_AVAILABLE = False
+    PageCache = None
+
+# Articles, caches and queues live here; point DATA_DIR elsewhere for another deployment or a benchmark
+DATA_DIR = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+
+_UNBUILT = object()
+
+def component(build):
+    """Property that builds a component on first use, once, even under concurrent requests.
+    
+    A component that can't be built is None, like one whose module is missing.
+    """
+    name = build.__name__
+    
+    def get(self):
+        value = self.__dict__.get(name, _UNBUILT)
+        if value is _UNBUILT:
+            with self._lock:
+                value = self.__dict__.get(name, _UNBUILT)
+                if value is _UNBUILT:
+                    value = None
+                    if self.available:
+                        started = time.perf_counter()
+                        try:
+                            value = build(self)
+                        except Exception as e:
+                            print(f"Could not initialize {name}: {e}")
+                        self.timings[name] = round(time.perf_counter() - started, 3)
+                    self.__dict__[name] = value
+        return value
+    return property(get, doc=build.__doc__)
+
+class Components:
+    """The long-lived objects behind the routes, configured from the environment.
+    
+    Nothing is constructed up front: importing the app does no file or
+    network I/O, and each component is built the first time it is needed
+    (or by the background warm-up).
+    """
+    
+    def __init__(self, data_dir: str = DATA_DIR, available: bool = MODULES_AVAILABLE):
+        self.data_dir = data_dir
+        self.available = available
+        self.timings = {}
+        self.comic_generator = None  # Not using comic generator for now
+        # GENERATION_WORKERS > 1 spreads the pipeline's satirize batches over a process pool
+        self.generation_workers = int(os.environ.get('GENERATION_WORKERS', '0')) or None
+        # Stage report of the most recent ingestion pipeline run
+        self.last_pipeline_report = None
+        self._lock = threading.RLock()
+    
+    def is_built(self, name: str) -> bool:
+        return name in self.__dict__
+    
+    @component
+    def archive_manager(self):
+        """ARCHIVE_BACKEND=sqlite switches to the SQLite archive, ARCHIVE_BACKEND=mmap to the
+        memory-mapped pack; ARCHIVE_SHARED=1 lets several worker processes share the file archive."""
+        return open_archive(self.data_dir)
+    
+    @component
+    def generation_cache(self):
+        """Generated articles are memoized per source story (in memory, plus on disk across restarts)"""
+        return GenerationCache(
+            maxsize=int(os.environ.get('GENERATION_CACHE_SIZE', '1024')),
+            directory=os.path.join(self.data_dir, 'generation_cache')
+        )
+    
+    @component
+    def satire_engine(self):
+        """SATIRE_DETERMINISTIC=1 makes the same story always produce the same article.
+        Otherwise the engine is only seeded when SATIRE_SEED is set, so workers don't all
+        replay the same random sequence."""
+        deterministic = os.environ.get('SATIRE_DETERMINISTIC') == '1'
+        return SatireEngine(seed=os.environ.get('SATIRE_SEED', '0' if deterministic else None),
+                            deterministic=deterministic,
+                            cache=self.generation_cache)
+    
+    @component
+    def story_dedup(self):
+        """Seen-set of source stories, so syndicated or re-fetched copies are never re-satirized"""
+        return StoryDeduplicator(os.path.join(self.data_dir, 'seen_stories.json'))
+    
+    @component
+    def response_cache(self):
+        """Upstream responses are cached on disk so repeated queries cost no API credits;
+        NEWS_CACHE_OFFLINE=1 replays cached responses without touching the network"""
+        return DiskResponseCache(
+            os.environ.get('NEWS_CACHE_DIR', os.path.join(self.data_dir, 'http_cache')),
+            ttl=float(os.environ.get('NEWS_CACHE_TTL', '900')),
+            max_entries=int(os.environ.get('NEWS_CACHE_MAX_ENTRIES', '500')),
+            offline=os.environ.get('NEWS_CACHE_OFFLINE') == '1'
+        )
+    
+    @component
+    def ingest_cursors(self):
+        """Per-category cursors so refreshes only pull stories newer than the last run"""
+        return CursorStore(os.path.join(self.data_dir, 'cursors.json'))
+    
+    @component
+    def news_api(self):
+        return NewsDataAPI(pool_size=int(os.environ.get('NEWS_API_POOL_SIZE', '10')),
+                           cache=self.response_cache, cursors=self.ingest_cursors)
+    
+    @component
+    def job_queue(self):
+        """Refreshes run as background jobs; the queue survives restarts"""
+        return JobQueue(os.path.join(self.data_dir, 'jobs.db'))
+    
+    @component
+    def job_worker(self):
+        worker = JobWorker(self.job_queue, {
+            'refresh': lambda params, report_progress: run_refresh_job(self, params, report_progress)
+        })
+        worker.start()
+        return worker
+    
+    def warm_up(self) -> None:
+        """Build everything a refresh needs and start the job worker.
+        
+        An empty archive gets a refresh job instead of blocking startup on the network.
+        """
+        started = time.perf_counter()
+        archive_manager = self.archive_manager
+        self.satire_engine
+        self.news_api
+        if self.job_queue is not None and self.job_worker is not None:
+            if archive_manager is not None and archive_manager.get_article_count() == 0:
+                print("Archive is empty, queueing initial satire content...")
+                self.job_queue.enqueue('refresh', {'categories': []}, key='refresh:all')
+        print(f"✅ Warm-up finished in {time.perf_counter() - started:.2f}s")
+
+def current_components() -> Components:
+    """Components of the app handling this request (of the module-level app outside one)"""
+    if has_app_context():
+        return current_app.extensions['components']
+    return app.extensions['components']
+
+# Route code uses these like plain module globals; each resolves to the current app's component
+archive_manager = LocalProxy(lambda: current_components().archive_manager)
+satire_engine = LocalProxy(lambda: current_components().satire_engine)
+news_api = LocalProxy(lambda: current_components().news_api)
+job_queue = LocalProxy(lambda: current_components().job_queue)
+comic_generator = LocalProxy(lambda: current_components().comic_generator)
+page_cache = LocalProxy(lambda: current_app.extensions['page_cache'])
+
+# Routes are recorded here and registered on every app create_app builds
+_routes = []
+
+def route(rule, **options):
+    """Like app.route, for the apps create_app builds; endpoint names stay the function names."""
+    def decorator(view):
+        _routes.append((rule, view, options))
+        return view
+    return decorator
+
+def run_refresh_job(components, params, report_progress):
+    """Job handler: stream fetch → dedupe → satirize → archive for the given categories."""
+    categories = params.get('categories') or []
+    archive_manager = components.archive_manager
+    run = IngestRun(components.news_api, components.satire_engine, archive_manager,
+                    deduplicator=components.story_dedup,
+                    generation_workers=components.generation_workers)
+    added_count = processed = 0
+    for result in run.run(categories or [None]):
+        processed += 1
+        added_count += 1 if result['added'] else 0
+        report_progress({'processed': processed, 'added': added_count, 'latest': result.get('headline')})
+    report = run.report()
+    components.last_pipeline_report = report
+    
+    stages = {stage['stage']: stage for stage in report['stages']}
+    fetched_count = stages['fetch']['items_out']
+    fresh_count = stages['dedupe']['items_out']
+    
+    if fresh_count:
+        result = {
+            'success': True,
+            'message': f'Generated {added_count} new satire articles from {fetched_count} real news stories',
+            'duplicates_skipped': fetched_count - fresh_count,
+            'total_articles': archive_manager.get_article_count(),
+            'pipeline_seconds': report['seconds']
+        }
+        if len(categories) > 1:
+            result['timings'] = report['fetch_timings']
+        return result
+    elif not report['fetch_errors']:
+        return {
+            'success': True,
+            'message': 'No new stories since the last refresh',
+            'duplicates_skipped': fetched_count,
+            'total_articles': archive_manager.get_article_count()
+        }
+    return {
+        'success': False,
+        'message': 'Could not fetch real news'
+    }
+
+def refresh_archive():
+    """Pick up articles other worker processes wrote, so no worker serves stale pages."""
+    # An archive that hasn't been loaded yet can't be stale
+    if current_components().is_built('archive_manager') and archive_manager:
+        archive_manager.refresh()
+
+def archive_generation():
+    """Current archive write generation (0 when running on sample data)."""
+    return archive_manager.generation if archive_manager else 0
+
+def cached_page(view):
+    """Serve a rendered page from the page cache, keyed by route and arguments."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not page_cache:
+            return view(*args, **kwargs)
+        
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        generation = archive_generation()
+        cached = page_cache.get(key, generation)
+        if cached is not None:
+            body, status, headers = cached
+            response = current_app.response_class(body, status=status, headers=headers)
+            response.headers['X-Cache'] = 'HIT'
+            return response
+        
+        response = current_app.make_response(view(*args, **kwargs))
+        if response.status_code in (200, 404):
+            page_cache.set(key, generation, (response.get_data(), response.status_code, list(response.headers)))
+        response.headers['X-Cache'] = 'MISS'
+        return response
+    return wrapper
+
+def page_validators(articles):
+    """Strong ETag from the content of the articles shown, plus Last-Modified.
+    
+    Stored articles never change, so id, timestamp and headline pin down what
+    the page shows; every worker computes the same ETag for the same page.
+    """
+    digest = hashlib.sha1()
+    for a in articles:
+        digest.update(f"{a.get('id')}\x1f{a.get('timestamp')}\x1f{a.get('headline')}\x1e".encode('utf-8'))
+    etag = digest.hexdigest()
+    
+    last_modified = None
+    timestamps = [a.get('timestamp') for a in articles if a.get('timestamp')]
+    if timestamps:
+        try:
+            newest = datetime.fromisoformat(max(timestamps).replace('Z', '+00:00'))
+            # Naive timestamps come from datetime.now(), i.e. server local time
+            last_modified = newest.astimezone().replace(microsecond=0)
+        except ValueError:
+            last_modified = None
+    return etag, last_modified
 
-app = Flask(__name__, static_folder='static')
+def is_not_modified(etag, last_modified):
+    """True when the client's cached copy is still current."""
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since and last_modified:
+        return last_modified <= request.if_modified_since
+    return False
 
-@app.route('/')
+def conditional_get(articles_for):
+    """Answer If-None-Match / If-Modified-Since with 304 before rendering anything.
+    
+    articles_for receives the view arguments and returns the articles the page
+    shows, or None when validators can't be computed (e.g. unknown article).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            articles = articles_for(*args, **kwargs) if archive_manager else None
+            if articles is None:
+                return view(*args, **kwargs)
+            
+            etag, last_modified = page_validators(articles)
+            if is_not_modified(etag, last_modified):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag)
+            if last_modified:
+                response.last_modified = last_modified
+            return response
+        return wrapper
+    return decorator
+
+def article_page_articles(article_id):
+    """The article plus its related articles, or None if it doesn't exist."""
+    article = archive_manager.get_article_by_id(article_id)
+    if not article:
+        return None
+    return [article] + archive_manager.get_related_articles(article, limit=3)
+
+@route('/')
+@conditional_get(lambda: archive_manager.search_articles("", limit=6))
+@cached_page
 def home():
     """Homepage with latest articles."""
     # Get latest articles
@@ -113,18 +406,21 @@ def home():
     # If no article has an image, use the first one
     if not featured_article and latest_articles:
         featured_article = latest_articles[0]
-        # Ensure it has an image
-        if not featured_article.get('image_url'):
-            featured_article['image_url'] = "https://picsum.photos/800/400?random=999&blur=1"
     
     # Get remaining articles (excluding featured)
-    other_articles = [a for a in latest_articles if a != featured_article]
+    other_articles = [a for a in latest_articles if a is not featured_article]
+    
+    # Ensure it has an image; on a copy, since archive articles are shared and never modified
+    if featured_article and not featured_article.get('image_url'):
+        featured_article = dict(featured_article, image_url="https://picsum.photos/800/400?random=999&blur=1")
     
     return render_template('index.html', 
                         featured_article=featured_article,
                         other_articles=other_articles)
 
-@app.route('/article/<path:article_id>')
+@route('/article/<path:article_id>')
+@conditional_get(article_page_articles)
+@cached_page
 def article(article_id):
     """Individual article page."""
     if archive_manager:
@@ -207,7 +503,9 @@ def article(article_id):
                         article=article,
                         related_articles=related_articles)
 
-@app.route('/category/<category>')
+@route('/category/<category>')
+@conditional_get(lambda category: archive_manager.search_articles("", category=category, limit=12))
+@cached_page
 def category(category):
     """Category page."""
     if archive_manager:
@@ -279,7 +577,8 @@ def category(category):
                         category=category,
                         articles=articles)
 
-@app.route('/opinion')
+@route('/opinion')
+@cached_page
 def opinion():
     """Opinion page with dynamic editorials and reader letters."""
     if archive_manager and satire_engine:
@@ -322,75 +621,83 @@ def opinion():
         # Fallback to static content
         return render_template('opinion.html')
 
-@app.route('/ask-gabby')
+@route('/ask-gabby')
 def ask_gabby():
     """Ask Gabby advice column."""
     return render_template('ask_gabby.html')
 
-@app.route('/ask-guy')
+@route('/ask-guy')
 def ask_guy():
     """Ask Guy advice column."""
     return render_template('ask_guy.html')
 
-@app.route('/what-women-want')
+@route('/what-women-want')
 def what_women_want():
     """What Women Want editorial."""
     return render_template('what_women_want.html')
 
-@app.route('/about')
+@route('/about')
 def about():
     """About page."""
     return render_template('about.html')
 
-@app.route('/refresh-news')
+@route('/refresh-news')
 def refresh_news():
-    """Refresh news content and generate new satire articles."""
-    if news_api and satire_engine and archive_manager:
-        try:
-            # Get category from query parameter
-            category = request.args.get('category', None)
-            
-            # Fetch latest real news
-            real_news = news_api.fetch_latest_news(category=category, limit=10)
-            
-            if real_news:
-                # Generate satire articles
-                new_articles = satire_engine.batch_generate_satire(real_news)
-                
-                # Add to archive
-                added_count = 0
-                for article in new_articles:
-                    if archive_manager.add_article(article):
-                        added_count += 1
-                
-                return jsonify({
-                    'success': True,
-                    'message': f'Generated {added_count} new satire articles from {len(real_news)} real news stories',
-                    'total_articles': archive_manager.get_article_count()
-                })
-            else:
-                return jsonify({
-                    'success': False,
-                    'message': 'Could not fetch real news'
-                })
-                
-        except Exception as e:
+    """Queue a news refresh; poll /api/jobs/<id> for progress and the result."""
+    if not (news_api and satire_engine and archive_manager and job_queue):
+        return jsonify({
+            'success': False,
+            'message': 'News generation components not available'
+        })
+    
+    try:
+        # Get category (or comma-separated categories) from query parameters
+        category = request.args.get('category', None)
+        categories = [c.strip() for c in request.args.get('categories', '').split(',') if c.strip()]
+        categories = sorted(set(categories)) or ([category] if category else [])
+        
+        # The worker starts with the first refresh (or with the warm-up)
+        current_components().job_worker
+        
+        # A refresh for the same categories that is already queued or running absorbs this one
+        job, created = job_queue.enqueue('refresh', {'categories': categories},
+                                         key=f"refresh:{','.join(categories) or 'all'}")
+        
+        # ?wait=N blocks up to N seconds for the result, for callers that want the old behaviour
+        wait = min(float(request.args.get('wait', 0) or 0), 120)
+        if wait > 0:
+            job = job_queue.wait(job['id'], wait)
+        
+        if job['status'] == 'done':
+            return jsonify(dict(job['result'], job_id=job['id']))
+        if job['status'] == 'failed':
             return jsonify({
                 'success': False,
-                'message': f'Error refreshing news: {str(e)}'
+                'job_id': job['id'],
+                'message': f"Error refreshing news: {job['error']}"
             })
-    else:
+        return jsonify({
+            'success': True,
+            'job_id': job['id'],
+            'status': job['status'],
+            'coalesced': not created,
+            'message': 'Refresh queued' if created else 'Refresh already in progress',
+            'status_url': f"/api/jobs/{job['id']}"
+        }), 202
+    
+    except Exception as e:
         return jsonify({
             'success': False,
-            'message': 'News generation components not available'
+            'message': f'Error refreshing news: {str(e)}'
         })
 
-@app.route('/luxury')
+@route('/luxury')
 def luxury():
     """Ultra luxury landing page."""
     return render_template('luxury.html')
 
-@app.route('/api/latest')
+@route('/api/latest')
+@conditional_get(lambda: archive_manager.search_articles("", limit=10))
 def api_latest():
     """API endpoint for latest articles."""
     if archive_manager:
@@ -425,7 +732,78 @@ def api_latest():
         ]
     return jsonify(articles)
 
-@app.route('/api/create-comic', methods=['POST'])
+def run_search(query, category=None, limit=20):
+    """Run a full-text search and time it."""
+    started = time.perf_counter()
+    results = archive_manager.search_articles(query, category=category, limit=limit) if (archive_manager and query) else []
+    took_ms = round((time.perf_counter() - started) * 1000, 3)
+    return results, took_ms
+
+@route('/search')
+def search():
+    """Full-text search results page."""
+    query = request.args.get('q', '').strip()
+    category = request.args.get('category') or None
+    results, took_ms = run_search(query, category=category)
+    
+    response = current_app.make_response(render_template('search.html',
+                                                 query=query,
+                                                 articles=results,
+                                                 took_ms=took_ms))
+    response.headers['X-Search-Time-Ms'] = str(took_ms)
+    return response
+
+@route('/api/search')
+def api_search():
+    """API endpoint for full-text search."""
+    query = request.args.get('q', '').strip()
+    category = request.args.get('category') or None
+    limit = request.args.get('limit', 10, type=int)
+    results, took_ms = run_search(query, category=category, limit=limit)
+    
+    return jsonify({
+        'query': query,
+        'count': len(results),
+        'took_ms': took_ms,
+        'results': results
+    })
+
+@route('/api/cache-stats')
+def api_cache_stats():
+    """Page cache hit/miss counters."""
+    return jsonify({
+        'generation': archive_generation(),
+        'page_cache': page_cache.stats() if page_cache else None,
+        'generation_cache': satire_engine.cache.stats() if satire_engine and satire_engine.cache else None,
+        'startup_timings': current_components().timings
+    })
+
+@route('/api/pipeline-stats')
+def api_pipeline_stats():
+    """Per-stage throughput and latency of the last ingestion run."""
+    report = current_components().last_pipeline_report
+    if report is None:
+        return jsonify({'error': 'No ingestion run yet'}), 404
+    return jsonify(report)
+
+@route('/api/jobs/<job_id>')
+def api_job(job_id):
+    """Status, progress and result of a background job."""
+    if not job_queue:
+        return jsonify({'error': 'Job queue not available'}), 503
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@route('/api/upstream-health')
+def api_upstream_health():
+    """NewsData.io latency, retries and circuit breaker state."""
+    if not news_api:
+        return jsonify({'error': 'News API not available'}), 503
+    return jsonify(news_api.get_metrics())
+
+@route('/api/create-comic', methods=['POST'])
 def api_create_comic():
     """API endpoint to create custom comic."""
     data = request.get_json()
@@ -454,10 +832,57 @@ def api_create_comic():
     return jsonify(comic_metadata)
 
 # Serve static files including logo
-@app.route('/static/<path:filename>')
+@route('/static/<path:filename>')
 def serve_static(filename):
     """Serve static files including logo.png."""
-    return send_from_directory(app.static_folder, filename)
+    return send_from_directory(current_app.static_folder, filename)
+
+@click.command('build-static')
+@click.option('--out', default=None, help='Output directory (default: build/)')
+@click.option('--force', is_flag=True, help='Re-render every page')
+@with_appcontext
+def build_static_command(out, force):
+    """Pre-render every route to static HTML for deployment."""
+    from build_static import build_site, DEFAULT_OUT
+    
+    result = build_site(current_app, current_components().archive_manager, out or DEFAULT_OUT, force=force)
+    print(f"✅ Built {result['pages']} pages in {result['seconds']}s "
+          f"({result['rendered']} rendered, {result['skipped']} unchanged, {result['removed']} removed)")
+    if result['failed']:
+        raise click.ClickException(f"Failed to render: {', '.join(result['failed'])}")
+
+def start_warm_up(flask_app):
+    """Build the app's components in a background thread so the first request doesn't pay for it."""
+    thread = threading.Thread(target=flask_app.extensions['components'].warm_up, name='warm-up', daemon=True)
+    thread.start()
+    return thread
+
+def create_app(data_dir: str = None, warm_up: bool = None):
+    """Application factory. Cheap and side-effect free unless warm_up is on.
+    
+    warm_up (default: APP_WARM_UP=1) builds the components and starts the job
+    worker in the background right away; otherwise each is built on first use.
+    """
+    flask_app = Flask(__name__, static_folder='static')
+    flask_app.extensions['components'] = Components(data_dir or DATA_DIR)
+    # Rendered-page cache; entries die when the archive generation changes
+    flask_app.extensions['page_cache'] = PageCache(
+        maxsize=int(os.environ.get('PAGE_CACHE_SIZE', 256)),
+        ttl=float(os.environ.get('PAGE_CACHE_TTL', 300))
+    ) if PageCache else None
+    
+    for rule, view, options in _routes:
+        flask_app.add_url_rule(rule, view_func=view, **options)
+    flask_app.before_request(refresh_archive)
+    flask_app.cli.add_command(build_static_command)
+    
+    if warm_up if warm_up is not None else os.environ.get('APP_WARM_UP') == '1':
+        start_warm_up(flask_app)
+    return flask_app
+
+# For `flask run`, gunicorn app:app and scripts that import the module
+app = create_app()
 
 if __name__ == '__main__':
+    start_warm_up(app)
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: homepage/category/latest reads with pre-sorted views
+versus the old sort-on-every-request approach
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from storage.archive import ArchiveManager
+
+CATEGORIES = ['politics', 'technology', 'science', 'sports', 'entertainment',
+              'business', 'finance', 'health', 'world', 'lifestyle']
+
+
+def make_articles(count):
+    """Synthetic articles with shuffled timestamps"""
+    start = datetime(2024, 1, 1)
+    articles = []
+    for i in range(count):
+        articles.append({
+            'id': f"bench-{i}",
+            'headline': f"Benchmark Headline {i}",
+            'opening_paragraph': "Officials announced plans to consider thinking about it.",
+            'category': random.choice(CATEGORIES),
+            'byline': 'Bench Writer',
+            'timestamp': (start + timedelta(seconds=random.randint(0, 10_000_000))).isoformat()
+        })
+    return articles
+
+
+def sorted_top_n(articles, category=None, limit=10):
+    """The pre-view read path: filter, sort the whole list, slice"""
+    filtered = articles
+    if category:
+        filtered = [a for a in filtered if a.get('category', '').lower() == category.lower()]
+    return sorted(filtered, key=lambda x: x.get('timestamp', ''), reverse=True)[:limit]
+
+
+def time_per_call(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def run(size, repeat):
+    storage = tempfile.mkdtemp(prefix='bench-archive-')
+    try:
+        articles = make_articles(size)
+        with open(os.path.join(storage, 'articles.json'), 'w', encoding='utf-8') as f:
+            json.dump(articles, f)
+
+        archive = ArchiveManager(storage)
+        reads = [
+            ('home (limit 6)', lambda: archive.search_articles("", limit=6),
+             lambda: sorted_top_n(archive.articles, limit=6)),
+            ('category (limit 12)', lambda: archive.search_articles("", category='sports', limit=12),
+             lambda: sorted_top_n(archive.articles, category='sports', limit=12)),
+            ('api_latest (limit 10)', lambda: archive.search_articles("", limit=10),
+             lambda: sorted_top_n(archive.articles, limit=10)),
+        ]
+
+        for name, view_read, sort_read in reads:
+            assert view_read() == sort_read()
+            sort_us = time_per_call(sort_read, repeat)
+            view_us = time_per_call(view_read, repeat)
+            print(f"{size:>8} | {name:<22} | {sort_us:>12.1f} | {view_us:>10.1f} | {sort_us / view_us:>8.0f}x")
+    finally:
+        shutil.rmtree(storage, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pre-sorted archive views")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated archive sizes")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per measurement")
+
+    args = parser.parse_args()
+    random.seed(42)
+
+    print(f"{'articles':>8} | {'read':<22} | {'sort (us)':>12} | {'view (us)':>10} | {'speedup':>9}")
+    print("-" * 74)
+    for size in [int(s) for s in args.sizes.split(',')]:
+        run(size, args.repeat)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: time from `import app` to the first response, in a
+fresh interpreter, against a generated archive (100k articles by default),
+for the JSON and memory-mapped (ARCHIVE_BACKEND=mmap) archive backends.
+Also reports each child's peak RSS. Exits non-zero when the total goes
+over --budget.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.insert(0, BASE_DIR)
+
+sys.path.insert(0, os.path.join(BASE_DIR, 'src'))
+
+from bench_archive import make_articles
+from storage.mmap_store import write_pack
+
+# Runs in the child interpreter; prints its timings as JSON on the last line
+CHILD = """
+import json, resource, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+flask_app = app.create_app(warm_up=WARM_UP)
+created = time.perf_counter()
+client = flask_app.test_client()
+response = client.get(PATH)
+first = time.perf_counter()
+assert response.status_code == 200, response.status_code
+client.get(PATH)
+second = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'create_app': created - imported,
+    'first_request': first - created,
+    'second_request': second - first,
+    'total': first - started,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'components': flask_app.extensions['components'].timings
+}))
+"""
+
+
+def make_archive(directory, count):
+    articles = make_articles(count)
+    for article in articles:
+        article['body_paragraphs'] = ["Sources close to the matter confirmed the matter was close to sources."] * 3
+        article['expert_quotes'] = [{'expert': 'Dr. Bench', 'affiliation': 'Institute of Timing',
+                                     'quote': 'It is faster than it was, which is something.'}]
+    with open(os.path.join(directory, 'articles.json'), 'w', encoding='utf-8') as f:
+        json.dump(articles, f)
+    # Built up front so the mmap runs don't time the one-off import from articles.json
+    write_pack(os.path.join(directory, 'articles.pack'), articles)
+
+
+def measure(data_dir, path, warm_up, backend):
+    env = dict(os.environ, DATA_DIR=data_dir, NEWS_CACHE_OFFLINE='1', ARCHIVE_BACKEND=backend,
+               NEWS_CACHE_DIR=os.path.join(data_dir, 'http_cache'))
+    code = CHILD.replace('WARM_UP', repr(warm_up)).replace('PATH', repr(path))
+    result = subprocess.run([sys.executable, '-c', code], cwd=BASE_DIR, env=env,
+                            check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark import-to-first-request time")
+    parser.add_argument("--articles", type=int, default=100000, help="Archive size")
+    parser.add_argument("--path", default="/", help="Route for the first request")
+    parser.add_argument("--runs", type=int, default=3, help="Cold starts to average")
+    parser.add_argument("--backends", nargs="+", default=['json', 'mmap'], choices=['json', 'mmap'],
+                        help="Archive backends to compare")
+    parser.add_argument("--budget", type=float, default=3.0, help="Max seconds from import to first response")
+
+    args = parser.parse_args()
+    random.seed(42)
+
+    data_dir = tempfile.mkdtemp(prefix='bench-startup-')
+    try:
+        make_archive(data_dir, args.articles)
+        print(f"{args.articles:,} articles, first request to {args.path}\n")
+        print(f"{'backend':<8} | {'mode':<8} | {'import':>8} | {'create_app':>10} | {'1st req':>8} | "
+              f"{'2nd req':>8} | {'total':>8} | {'peak RSS':>9}")
+        print("-" * 89)
+        worst = 0.0
+        for backend in args.backends:
+            for warm_up in (False, True):
+                runs = [measure(data_dir, args.path, warm_up, backend) for _ in range(args.runs)]
+                avg = {key: sum(run[key] for run in runs) / len(runs)
+                       for key in ('import', 'create_app', 'first_request', 'second_request', 'total', 'peak_rss_mb')}
+                worst = max(worst, max(run['total'] for run in runs))
+                mode = 'warm-up' if warm_up else 'lazy'
+                print(f"{backend:<8} | {mode:<8} | {avg['import']:>7.3f}s | {avg['create_app']:>9.3f}s | "
+                      f"{avg['first_request']:>7.3f}s | {avg['second_request']:>7.3f}s | {avg['total']:>7.3f}s | "
+                      f"{avg['peak_rss_mb']:>6.0f} MB")
+        print(f"\nComponent build times (last run): {runs[-1]['components']}")
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    if worst > args.budget:
+        print(f"❌ Slowest cold start {worst:.2f}s is over the {args.budget:.2f}s budget")
+        sys.exit(1)
+    print(f"✅ Slowest cold start {worst:.2f}s is within the {args.budget:.2f}s budget")
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Static site pre-renderer for OK Crisis
+Renders every route straight to disk through the Flask test client, so a
+deploy needs no running server. Only pages whose inputs changed since the
+last build are re-rendered (tracked in a content-hash manifest).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT = os.path.join(BASE_DIR, 'build')
+MANIFEST_NAME = '.build-manifest.json'
+
+# Pages that only depend on their template
+STATIC_ROUTES = ['/ask-gabby', '/ask-guy', '/what-women-want', '/about', '/luxury']
+
+# Category links in the site navigation, rendered even when still empty
+NAV_CATEGORIES = ['world-news', 'national-news', 'entertainment', 'sports',
+                  'lifestyle-culture', 'politics', 'technology', 'science']
+
+
+def hash_content(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def code_fingerprint() -> str:
+    """Hash of app.py and all templates; any change forces a full rebuild"""
+    digest = hashlib.sha256()
+    paths = [os.path.join(BASE_DIR, 'app.py')]
+    template_dir = os.path.join(BASE_DIR, 'templates')
+    paths += sorted(os.path.join(template_dir, name) for name in os.listdir(template_dir))
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def output_file(route: str) -> str:
+    """Map a route to a file that static hosts serve for it"""
+    if route == '/':
+        return 'index.html'
+    return os.path.join(route.strip('/'), 'index.html')
+
+
+def collect_pages(archive):
+    """Yield (route, articles the page depends on) for every page on the site"""
+    if archive is None:
+        # Sample-data mode: nothing to track, always render
+        for route in ['/', '/opinion'] + STATIC_ROUTES:
+            yield route, None
+        return
+
+    yield '/', archive.search_articles("", limit=6)
+    yield '/opinion', (archive.search_articles("", category="politics", limit=3) +
+                       archive.search_articles("", category="advice", limit=3))
+    for route in STATIC_ROUTES:
+        yield route, []
+
+    for category in sorted(set(archive.get_categories()) | set(NAV_CATEGORIES)):
+        yield f'/category/{category}', archive.search_articles("", category=category, limit=12)
+
+    for article in archive.search_articles("", limit=archive.get_article_count()):
+        related = archive.get_related_articles(article, limit=3)
+        yield f"/article/{article.get('id')}", [article] + related
+
+
+def load_manifest(out_dir: str) -> dict:
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def write_file(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def build_site(flask_app, archive, out_dir: str = DEFAULT_OUT, force: bool = False) -> dict:
+    """Render the site into out_dir and return a build summary"""
+    started = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+
+    # app.archive_manager is a LocalProxy, which is never None itself even in sample-data mode
+    if hasattr(archive, '_get_current_object'):
+        with flask_app.app_context():
+            archive = archive._get_current_object()
+
+    old_manifest = {} if force else load_manifest(out_dir)
+    new_manifest = {}
+    fingerprint = code_fingerprint()
+    summary = {'rendered': 0, 'skipped': 0, 'removed': 0, 'failed': []}
+
+    # Hash every page's inputs before rendering anything, since views may touch articles
+    pages = [(route, hash_content(fingerprint, route, articles) if articles is not None else None)
+             for route, articles in collect_pages(archive)]
+
+    client = flask_app.test_client()
+    for route, page_hash in pages:
+        filename = output_file(route)
+        target = os.path.join(out_dir, filename)
+
+        previous = old_manifest.get(route)
+        if page_hash and previous and previous['hash'] == page_hash and os.path.exists(target):
+            new_manifest[route] = previous
+            summary['skipped'] += 1
+            continue
+
+        response = client.get(route)
+        if response.status_code != 200:
+            print(f"❌ {route}: HTTP {response.status_code}")
+            summary['failed'].append(route)
+            continue
+
+        write_file(target, response.get_data())
+        new_manifest[route] = {'hash': page_hash, 'file': filename}
+        summary['rendered'] += 1
+
+    # 404 page for static hosts
+    with flask_app.test_request_context():
+        from flask import render_template
+        write_file(os.path.join(out_dir, '404.html'), render_template('404.html').encode('utf-8'))
+
+    # Drop pages that no longer exist (e.g. deleted articles)
+    for route, entry in old_manifest.items():
+        if route not in new_manifest:
+            stale = os.path.join(out_dir, entry['file'])
+            if os.path.exists(stale):
+                os.remove(stale)
+                summary['removed'] += 1
+
+    shutil.copytree(flask_app.static_folder, os.path.join(out_dir, 'static'), dirs_exist_ok=True)
+
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(new_manifest, f, indent=2, sort_keys=True)
+
+    summary['pages'] = len(new_manifest)
+    summary['seconds'] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render the OK Crisis site to static HTML")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="Output directory")
+    parser.add_argument("--force", action="store_true", help="Re-render every page")
+
+    args = parser.parse_args()
+
+    sys.path.insert(0, BASE_DIR)
+    import app as site
+
+    result = build_site(site.app, site.app.extensions['components'].archive_manager, args.out, force=args.force)
+    print(f"✅ Built {result['pages']} pages in {result['seconds']}s "
+          f"({result['rendered']} rendered, {result['skipped']} unchanged, {result['removed']} removed)")
+    if result['failed']:
+        print(f"❌ Failed: {', '.join(result['failed'])}")
+        sys.exit(1)
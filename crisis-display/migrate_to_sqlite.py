@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+One-shot migration of data/articles.json (plus any journal) into SQLite
+"""
+
+import argparse
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from storage.archive import ArchiveManager
+from storage.sqlite_archive import SQLiteArchiveManager, migrate_json_archive
+
+if __name__ == "__main__":
+    default_data = os.path.join(os.path.dirname(__file__), 'data')
+
+    parser = argparse.ArgumentParser(description="Import the JSON article archive into SQLite")
+    parser.add_argument("--data-dir", default=default_data, help="Directory holding articles.json")
+    parser.add_argument("--db-file", default="articles.db", help="SQLite file name inside --data-dir")
+
+    args = parser.parse_args()
+
+    source = ArchiveManager(args.data_dir)
+    target = SQLiteArchiveManager(args.data_dir, db_file=args.db_file)
+
+    print(f"📦 Migrating {source.get_article_count()} articles into {target.db_path}...")
+    summary = migrate_json_archive(source.articles, target)
+    print(f"✅ Imported {summary['imported']} articles ({summary['skipped']} already present or invalid)")
+    print(f"📊 SQLite archive now holds {target.get_article_count()} articles")
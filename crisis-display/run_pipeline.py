@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Run one streaming ingestion pass (fetch → normalize → dedupe → satirize →
+enrich_image → persist) and print a per-stage throughput/latency report
+"""
+
+import argparse
+import json
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(BASE_DIR, 'src'))
+
+from storage.factory import open_archive
+from generation.satire_engine import SatireEngine
+from generation.fingerprint import StoryDeduplicator
+from generation.cache import GenerationCache
+from pipeline.ingest import IngestRun
+from api.newsdata import NewsDataAPI
+from api.disk_cache import DiskResponseCache
+from api.cursors import CursorStore
+
+DEFAULT_CATEGORIES = ['politics', 'technology', 'science', 'business', 'world']
+
+
+def build_run(args):
+    """Wire up the same components app.py uses"""
+    archive_manager = open_archive(DATA_DIR)
+    # Only seeded when asked to, like the app
+    deterministic = os.environ.get('SATIRE_DETERMINISTIC') == '1'
+    satire_engine = SatireEngine(
+        seed=os.environ.get('SATIRE_SEED', '0' if deterministic else None),
+        deterministic=deterministic,
+        cache=GenerationCache(directory=os.path.join(DATA_DIR, 'generation_cache'))
+    )
+    response_cache = DiskResponseCache(
+        os.environ.get('NEWS_CACHE_DIR', os.path.join(DATA_DIR, 'http_cache')),
+        ttl=float(os.environ.get('NEWS_CACHE_TTL', '900')),
+        offline=os.environ.get('NEWS_CACHE_OFFLINE') == '1'
+    )
+    news_api = NewsDataAPI(cache=response_cache, cursors=CursorStore(os.path.join(DATA_DIR, 'cursors.json')))
+    deduplicator = StoryDeduplicator(os.path.join(DATA_DIR, 'seen_stories.json'))
+    return IngestRun(news_api, satire_engine, archive_manager, deduplicator=deduplicator,
+                     new_only=not args.all, limit=args.limit, queue_size=args.queue_size,
+                     generation_workers=int(os.environ.get('GENERATION_WORKERS', '0')) or None)
+
+
+def print_report(report):
+    print(f"\n{'stage':<14} | {'in':>5} | {'out':>5} | {'err':>4} | {'avg ms':>9} | {'max ms':>9} | {'out/s':>8}")
+    print("-" * 72)
+    for stage in report['stages']:
+        print(f"{stage['stage']:<14} | {stage['items_in']:>5} | {stage['items_out']:>5} | {stage['errors']:>4} | "
+              f"{stage['avg_latency_ms']:>9.2f} | {stage['max_latency_ms']:>9.2f} | {stage['throughput_per_s']:>8.1f}")
+    print(f"\nTotal: {report['seconds']:.2f}s")
+    for category, error in report['fetch_errors'].items():
+        print(f"⚠️ {category}: {error}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the streaming ingestion pipeline once")
+    parser.add_argument("--categories", nargs="+", default=DEFAULT_CATEGORIES, help="Categories to fetch")
+    parser.add_argument("--limit", type=int, default=10, help="Stories per category")
+    parser.add_argument("--queue-size", type=int, default=16, help="Bound on each inter-stage queue")
+    parser.add_argument("--all", action="store_true", help="Ignore cursors and fetch the latest page")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+    run = build_run(args)
+
+    added = 0
+    for result in run.run(args.categories):
+        if result['added']:
+            added += 1
+            if not args.json:
+                print(f"📰 [{result['category']}] {result['headline']}")
+
+    if args.json:
+        print(json.dumps(dict(run.report(), added=added), indent=2))
+    else:
+        print_report(run.report())
+        print(f"✅ Archived {added} new articles")
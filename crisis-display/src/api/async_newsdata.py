@@ -0,0 +1,229 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List
+
+try:
+    import httpx
+except ImportError:  # optional dependency, only needed for async ingestion
+    httpx = None
+
+from .newsdata import NewsDataAPI
+from .resilience import CircuitOpenError
+
+
+class TokenBucket:
+    """Async token bucket: refills `rate` tokens per second up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it"""
+        # Check-and-take has no await in between, so it is atomic on the event loop
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncNewsDataAPI(NewsDataAPI):
+    """Asynchronous NewsDataAPI that runs many category/keyword queries at once.
+
+    Concurrency per API key is capped by a semaphore, and every upstream
+    request (cache hits excluded) takes a token from a bucket sized to the
+    plan quota (default: the newsdata.io free plan's 30 requests per 15 minutes).
+    """
+
+    def __init__(self, api_key=None, base_url=None, max_concurrency: int = 4,
+                 max_requests: int = 30, per_seconds: float = 900, timeout: float = 10, cache=None):
+        if httpx is None:
+            raise ImportError("AsyncNewsDataAPI requires httpx (pip install httpx)")
+        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout, cache=cache)
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = TokenBucket(rate=max_requests / per_seconds, capacity=max_requests)
+
+    def query_params(self, query: Dict[str, Any], country: str, limit: int) -> Dict[str, Any]:
+        """Build request params for {'category': ...} and/or {'q': ...} queries"""
+        params = {
+            'apikey': self.api_key,
+            'country': country,
+            'language': 'en',
+            'size': limit
+        }
+        if query.get('category'):
+            params['category'] = query['category']
+        if query.get('q'):
+            params['q'] = query['q']
+        return params
+
+    async def _get_payload_async(self, client, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Async twin of NewsDataAPI._get_payload, sharing the disk cache.
+
+        Cache reads and writes are blocking file I/O, so they run in a thread.
+        """
+        payload, entry = await asyncio.to_thread(self.cache_lookup, params)
+        if payload is not None:
+            return payload
+        try:
+            response = await self._get_async(client, params, headers=self.revalidation_headers(entry))
+        except Exception as e:
+            if entry:
+                print(f"Serving stale cached response: {e}")
+                return entry['payload']
+            raise
+        return await asyncio.to_thread(self.store_response, params, response, entry)
+
+    async def _get_async(self, client, params: Dict[str, Any], headers: Dict[str, str] = None):
+        """Async twin of NewsDataAPI._get sharing its retry policy, breaker and metrics"""
+        if not self.circuit_breaker.allow_request():
+            self.metrics.increment('short_circuited')
+            raise CircuitOpenError("Upstream circuit open, skipping request")
+
+        attempt = 0
+        while True:
+            # Every attempt, retries included, spends quota; cache hits never get here
+            await self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = await client.get(self.base_url, params=params, headers=headers)
+                status_code, error = response.status_code, None
+            except httpx.HTTPError as e:
+                response, status_code, error = None, None, e
+            self.metrics.record_attempt(time.perf_counter() - started, status_code)
+
+            if status_code in (200, 304):
+                self.circuit_breaker.record_success()
+                self.metrics.increment('successes')
+                return response
+
+            message = (str(error) or type(error).__name__) if error else f"API Error: {status_code}"
+            retryable = self.retry_policy.should_retry(status_code)
+            delay = None
+            if retryable and attempt < self.retry_policy.max_retries:
+                retry_after = response.headers.get('Retry-After') if response is not None else None
+                delay = self.retry_policy.delay(attempt, retry_after)
+
+            if delay is None:
+                if retryable:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.release_probe()
+                self.metrics.increment('failures', error=message)
+                raise RuntimeError(message)
+
+            self.metrics.increment('retries')
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _fetch(self, client, semaphore: asyncio.Semaphore, query: Dict[str, Any],
+                     country: str, limit: int) -> Dict[str, Any]:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                payload = await self._get_payload_async(client, self.query_params(query, country, limit))
+                articles = self.format_articles(payload.get('results', []))
+                error = None
+            except Exception as e:
+                articles, error = [], str(e) or type(e).__name__
+            return {
+                'query': query,
+                'articles': articles,
+                'error': error,
+                'seconds': round(time.perf_counter() - started, 3)
+            }
+
+    async def stream(self, queries: List[Dict[str, Any]], country: str = 'us',
+                     limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Yield {'query', 'articles', 'error', 'seconds'} as each query finishes"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limits = httpx.Limits(max_connections=self.max_concurrency)
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            tasks = [asyncio.create_task(self._fetch(client, semaphore, query, country, limit))
+                     for query in queries]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def fetch_many_async(self, queries: List[Dict[str, Any]], country: str = 'us',
+                               limit: int = 10) -> Dict[str, Any]:
+        """Gather every query; same result shape as NewsDataAPI.fetch_many"""
+        merged, seen_links, timings, errors = [], set(), {}, {}
+        async for result in self.stream(queries, country=country, limit=limit):
+            name = query_label(result['query'])
+            timings[name] = result['seconds']
+            if result['error']:
+                errors[name] = result['error']
+            for article in result['articles']:
+                link = article.get('url')
+                if link and link in seen_links:
+                    continue
+                seen_links.add(link)
+                merged.append(article)
+        return {'articles': merged, 'timings': timings, 'errors': errors}
+
+
+def query_label(query: Dict[str, Any]) -> str:
+    if query.get('q'):
+        return f"q:{query['q']}"
+    return query.get('category') or 'all'
+
+
+async def ingest_stream(api: AsyncNewsDataAPI, queries: List[Dict[str, Any]], satire_engine,
+                        archive_manager=None, country: str = 'us', limit: int = 10,
+                        deduplicator=None) -> AsyncIterator[Dict[str, Any]]:
+    """Satirize (and archive) each query's stories as soon as they arrive.
+
+    Yields one summary per query, so one slow category never holds back the rest.
+    With a StoryDeduplicator, stories seen on earlier runs are skipped.
+    """
+    seen_links = set()
+    loop = asyncio.get_running_loop()
+    async for result in api.stream(queries, country=country, limit=limit):
+        stories = []
+        for article in result['articles']:
+            link = article.get('url')
+            if link and link in seen_links:
+                continue
+            seen_links.add(link)
+            stories.append(article)
+        if deduplicator is not None:
+            stories = deduplicator.filter(stories)
+
+        added = 0
+        if stories:
+            # Generation and file writes are blocking; keep them off the event loop
+            generated = await loop.run_in_executor(None, satire_engine.generate_batch, stories)
+            # Stories whose generation failed have no article; keep each article with its own story
+            pairs = [(story, article) for story, article in zip(stories, generated) if article is not None]
+            for i, (_, article) in enumerate(pairs):
+                # Same rule as batch_generate_satire: only the first article gets an image
+                article['image_url'] = (satire_engine.generate_featured_image(article['headline'], article['category'])
+                                        if i == 0 else None)
+            if archive_manager is not None and pairs:
+                results = await loop.run_in_executor(None, archive_manager.add_articles,
+                                                     [article for _, article in pairs])
+                added = sum(1 for r in results if r['added'])
+                if deduplicator is not None:
+                    kept = [story for (story, _), r in zip(pairs, results) if r['added']]
+                    await loop.run_in_executor(None, deduplicator.remember, kept)
+
+        yield {
+            'query': query_label(result['query']),
+            'stories': len(stories),
+            'added': added,
+            'error': result['error'],
+            'seconds': result['seconds']
+        }
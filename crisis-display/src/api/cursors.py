@@ -0,0 +1,90 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class CursorStore:
+    """Per-query ingestion cursors persisted to a JSON file.
+
+    Each cursor holds a boundary: the newest `pubDate` everything up to which
+    has been ingested, and the links of the stories at exactly that time.
+    If a run ran out of pages before reaching the boundary, it also holds the
+    `nextPage` token it stopped at and the boundary to move to (`head_*`, the
+    newest story of that run) once the next run closes the gap.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.cursors = self.load()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading cursors: {e}")
+            return {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cursor = self.cursors.get(key)
+            return dict(cursor) if cursor else None
+
+    def set(self, key: str, cursor: Dict[str, Any]) -> None:
+        """Store a cursor ({'last_pub_date', 'last_links', 'next_page', 'head_pub_date', 'head_links'})"""
+        with self._lock:
+            self.cursors[key] = dict(cursor, updated_at=datetime.now().isoformat())
+            self._save()
+
+    def reset(self, key: str = None) -> None:
+        with self._lock:
+            if key is None:
+                self.cursors = {}
+            else:
+                self.cursors.pop(key, None)
+            self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.cursors, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving cursors: {e}")
+
+
+def boundary_links(cursor: Dict[str, Any]) -> List[str]:
+    # Cursors written before last_links only remember the single newest link
+    links = cursor.get('last_links')
+    if links is None:
+        links = [cursor['last_link']] if cursor.get('last_link') else []
+    return links
+
+
+def is_known(article: Dict[str, Any], cursor: Optional[Dict[str, Any]]) -> bool:
+    """True if the story is at or before the cursor's boundary, i.e. was ingested already.
+
+    Stories published in the same second as the boundary are told apart by link.
+    """
+    if not cursor:
+        return False
+    link = article.get('url')
+    if link and link in boundary_links(cursor):
+        return True
+    pub_date = article.get('published_date') or ''
+    last_pub_date = cursor.get('last_pub_date') or ''
+    return bool(pub_date and last_pub_date and pub_date < last_pub_date)
+
+
+def boundary(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Boundary after ingesting `articles` (newest first): the newest pubDate and the links at it"""
+    pub_date = max((a.get('published_date') or '' for a in articles), default='')
+    links = [a['url'] for a in articles if a.get('url') and (a.get('published_date') or '') == pub_date]
+    return {'pub_date': pub_date, 'links': links}
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Params that identify the caller rather than the query
+IGNORED_PARAMS = {'apikey'}
+
+# Params upstream treats case-insensitively; anything else (e.g. the opaque page token) is kept as-is
+CASE_INSENSITIVE_PARAMS = {'category', 'country', 'language'}
+
+
+def cache_key(params: Dict[str, Any]) -> str:
+    """Stable hash of the query params, independent of order and API key"""
+    normalized = {}
+    for k, v in params.items():
+        if k in IGNORED_PARAMS or v is None or v == '':
+            continue
+        value = str(v).strip()
+        normalized[k] = value.lower() if k in CASE_INSENSITIVE_PARAMS else value
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class DiskResponseCache:
+    """Upstream JSON responses on disk, one file per normalized query.
+
+    Entries younger than `ttl` are served without touching the network; older
+    ones are revalidated with their ETag/Last-Modified. The directory holds at
+    most `max_entries` files, evicting the least recently used (by mtime).
+    With offline=True the cache never expires, for replaying fixtures.
+    """
+
+    def __init__(self, directory: str, ttl: float = 900, max_entries: int = 500, offline: bool = False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, params: Dict[str, Any]) -> str:
+        return os.path.join(self.directory, f"{cache_key(params)}.json")
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Stored entry {'stored_at', 'etag', 'last_modified', 'payload'} or None"""
+        path = self._path(params)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)  # mark as recently used
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Error reading cached response: {e}")
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return self.offline or time.time() - entry.get('stored_at', 0) < self.ttl
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def set(self, params: Dict[str, Any], payload: Any, etag: str = None, last_modified: str = None) -> None:
+        entry = {
+            'stored_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'payload': payload
+        }
+        path = self._path(params)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error caching response: {e}")
+            return
+        self._evict()
+
+    def refresh(self, params: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        """Upstream confirmed the entry is unchanged (304): restart its TTL"""
+        self.set(params, entry['payload'], entry.get('etag'), entry.get('last_modified'))
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    path = os.path.join(self.directory, name)
+                    try:
+                        entries.append((os.path.getmtime(path), path))
+                    except OSError:
+                        continue
+            if len(entries) <= self.max_entries:
+                return
+            entries.sort()
+            for _, path in entries[:len(entries) - self.max_entries]:
+                try:
+                    os.remove(path)
+                    self.evictions += 1
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'evictions': self.evictions,
+            'ttl': self.ttl,
+            'max_entries': self.max_entries,
+            'offline': self.offline
+        }
@@ -1,39 +1,288 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 
+from .cursors import boundary, boundary_links, is_known
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, UpstreamMetrics
+
 class NewsDataAPI:
-    def __init__(self):
-        self.api_key = 'pub_39e106ccf96046c5bfe5d6dd1d9f6bed'
-        self.base_url = 'https://newsdata.io/api/1/news'
+    def __init__(self, api_key=None, base_url=None, pool_size=10, timeout=10,
+                 retry_policy=None, circuit_breaker=None, cache=None, cursors=None):
+        self.api_key = api_key or 'pub_39e106ccf96046c5bfe5d6dd1d9f6bed'
+        self.base_url = base_url or 'https://newsdata.io/api/1/news'
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.metrics = UpstreamMetrics()
+        # Optional DiskResponseCache: repeated queries within its TTL cost no API credits
+        self.cache = cache
+        # Optional CursorStore: lets fetch_new stop at stories seen on the previous run
+        self.cursors = cursors
+        
+        # Shared keep-alive session so concurrent fetches reuse pooled connections;
+        # retries are handled in _get so they can honor Retry-After and feed the breaker
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def fetch_latest_news(self, category=None, country='us', limit=10):
-        """Fetch latest news articles"""
-        try:
-            params = {
-                'apikey': self.api_key,
-                'country': country,
-                'language': 'en',
-                'size': limit
-            }
+    def _get(self, params, headers=None):
+        """GET the news endpoint with retry/backoff and circuit breaking"""
+        if not self.circuit_breaker.allow_request():
+            self.metrics.increment('short_circuited')
+            raise CircuitOpenError("Upstream circuit open, skipping request")
+        
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.session.get(self.base_url, params=params, headers=headers,
+                                            timeout=self.timeout)
+                status_code, error = response.status_code, None
+            except requests.RequestException as e:
+                response, status_code, error = None, None, e
+            self.metrics.record_attempt(time.perf_counter() - started, status_code)
             
-            if category:
-                params['category'] = category
+            if status_code in (200, 304):
+                self.circuit_breaker.record_success()
+                self.metrics.increment('successes')
+                return response
             
-            response = requests.get(self.base_url, params=params, timeout=10)
+            message = str(error) if error else f"API Error: {status_code}"
+            retryable = self.retry_policy.should_retry(status_code)
+            delay = None
+            if retryable and attempt < self.retry_policy.max_retries:
+                retry_after = response.headers.get('Retry-After') if response is not None else None
+                delay = self.retry_policy.delay(attempt, retry_after)
             
-            if response.status_code == 200:
-                data = response.json()
-                return self.format_articles(data.get('results', []))
+            if delay is None:
+                # Only throttling, server and network errors say anything about upstream health
+                if retryable:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.release_probe()
+                self.metrics.increment('failures', error=message)
+                if error:
+                    raise error
+                raise RuntimeError(message)
+            
+            self.metrics.increment('retries')
+            time.sleep(delay)
+            attempt += 1
+    
+    def cache_lookup(self, params):
+        """Return (fresh payload or None, stored entry or None) from the disk cache"""
+        if not self.cache:
+            return None, None
+        entry = self.cache.get(params)
+        if entry and self.cache.is_fresh(entry):
+            self.cache.record('hits')
+            return entry['payload'], entry
+        self.cache.record('misses')
+        if self.cache.offline:
+            raise RuntimeError("Offline mode: no cached response for this query")
+        return None, entry
+    
+    def revalidation_headers(self, entry):
+        """Conditional request headers for a stale cache entry"""
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def store_response(self, params, response, entry):
+        """Payload from a 200 (cached for next time) or a 304 against `entry`"""
+        if response.status_code == 304 and entry:
+            self.cache.record('revalidated')
+            self.cache.refresh(params, entry)
+            return entry['payload']
+        payload = response.json()
+        if self.cache:
+            self.cache.set(params, payload, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return payload
+    
+    def _get_payload(self, params):
+        """Raw JSON for `params`, from the disk cache when fresh, else from upstream"""
+        payload, entry = self.cache_lookup(params)
+        if payload is not None:
+            return payload
+        try:
+            response = self._get(params, headers=self.revalidation_headers(entry))
+        except Exception as e:
+            if entry:
+                # Stale data beats no data while upstream is failing
+                print(f"Serving stale cached response: {e}")
+                return entry['payload']
+            raise
+        return self.store_response(params, response, entry)
+    
+    def get_metrics(self):
+        """Upstream latency, retry and circuit breaker state"""
+        metrics = self.metrics.snapshot()
+        metrics['circuit_state'] = self.circuit_breaker.state
+        metrics['consecutive_failures'] = self.circuit_breaker.failures
+        metrics['cache'] = self.cache.stats() if self.cache else None
+        return metrics
+    
+    def category_params(self, category=None, country='us', limit=10, page=None):
+        params = {
+            'apikey': self.api_key,
+            'country': country,
+            'language': 'en',
+            'size': limit
+        }
+        
+        if category:
+            params['category'] = category
+        if page:
+            params['page'] = page
+        return params
+    
+    def fetch_category(self, category=None, country='us', limit=10):
+        """Fetch one category, raising on HTTP or network errors"""
+        data = self._get_payload(self.category_params(category, country, limit))
+        return self.format_articles(data.get('results', []))
+    
+    def fetch_new(self, category=None, country='us', limit=10, max_pages=3):
+        """Fetch only stories newer than the last run, raising on errors.
+        
+        The cursor moves on right away; callers that only want it to move once
+        the stories are safely stored use fetch_new_pending.
+        """
+        articles, pending = self.fetch_new_pending(category, country=country, limit=limit, max_pages=max_pages)
+        self.commit_cursor(pending)
+        return articles
+    
+    def commit_cursor(self, pending):
+        """Store a cursor returned by fetch_new_pending (None: nothing to store)"""
+        if pending:
+            self.cursors.set(pending['key'], pending['cursor'])
+    
+    def fetch_new_pending(self, category=None, country='us', limit=10, max_pages=3):
+        """Stories newer than the last run plus the cursor to store once they are handled.
+        
+        Returns (articles, pending); pass `pending` to commit_cursor after the
+        stories are archived. Until then the next fetch sees them again, so a
+        failed or interrupted run loses nothing.
+        
+        Results come newest first, so pages are followed via `nextPage` until a
+        story at or before the stored cursor shows up. If a run runs out of
+        pages first, the cursor keeps its old boundary plus the token it
+        stopped at, and the next run resumes from there before reading the top
+        again, so no story in between is skipped. The first run for a category
+        (no cursor yet) reads a single page.
+        """
+        if not self.cursors:
+            return self.fetch_category(category, country=country, limit=limit), None
+        
+        key = f"{country}:{category or 'all'}"
+        stored = cursor = self.cursors.get(key) or {}
+        budget = max_pages if cursor else 1
+        gap_articles, head_articles = [], []
+        
+        # Cursors from before head_* was recorded can't tell where their gap ends
+        if cursor.get('next_page') and 'head_pub_date' in cursor:
+            gap_articles, page, reached, used = self._page_until(category, country, limit,
+                                                                 cursor['next_page'], cursor, budget)
+            budget -= used
+            if reached or not page:
+                # Gap closed: everything up to the earlier run's newest story is in
+                cursor = {'last_pub_date': cursor['head_pub_date'], 'last_links': cursor['head_links']}
             else:
-                print(f"API Error: {response.status_code}")
-                return []
-                
+                cursor = dict(cursor, next_page=page)
+                budget = 0
+        elif cursor.get('next_page'):
+            cursor = dict(cursor, next_page=None)
+        
+        if budget:
+            head_articles, page, reached, _ = self._page_until(category, country, limit, None, cursor, budget)
+            if head_articles:
+                head = boundary(head_articles)
+                if reached or not page or not cursor.get('last_pub_date'):
+                    links = head['links']
+                    if head['pub_date'] == cursor.get('last_pub_date'):
+                        links = boundary_links(cursor) + links
+                    cursor = {'last_pub_date': head['pub_date'], 'last_links': links}
+                else:
+                    # Out of pages before reaching the boundary: keep it, remember where to resume
+                    cursor = dict(cursor, next_page=page, head_pub_date=head['pub_date'], head_links=head['links'])
+        
+        pending = {'key': key, 'cursor': cursor} if cursor is not stored else None
+        return head_articles + gap_articles, pending
+    
+    def _page_until(self, category, country, limit, page, cursor, max_pages):
+        """Read pages from `page` until known content; returns (new stories, next token, reached, pages read)"""
+        stories = []
+        reached = False
+        used = 0
+        while used < max_pages:
+            used += 1
+            data = self._get_payload(self.category_params(category, country, limit, page))
+            for article in self.format_articles(data.get('results', [])):
+                # The rest of the page is older still, but keep going for same-second stories
+                if is_known(article, cursor):
+                    reached = True
+                else:
+                    stories.append(article)
+            page = data.get('nextPage')
+            if reached or not page:
+                break
+        return stories, page, reached, used
+    
+    def fetch_latest_news(self, category=None, country='us', limit=10, new_only=False):
+        """Fetch latest news articles (only unseen ones with new_only=True)"""
+        try:
+            if new_only:
+                return self.fetch_new(category, country=country, limit=limit)
+            return self.fetch_category(category, country=country, limit=limit)
         except Exception as e:
             print(f"Error fetching news: {e}")
             return []
     
+    def fetch_many(self, categories, country='us', limit=10, max_workers=10, new_only=False):
+        """Fetch several categories concurrently over a bounded thread pool.
+        
+        Returns {'articles', 'timings', 'errors'}: articles merged in category
+        order with duplicate links dropped, and per-category seconds/errors.
+        """
+        categories = list(categories)
+        fetch = self.fetch_new if new_only else self.fetch_category
+        
+        def timed_fetch(category):
+            started = time.perf_counter()
+            try:
+                return fetch(category, country=country, limit=limit), None, time.perf_counter() - started
+            except Exception as e:
+                return [], str(e), time.perf_counter() - started
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(categories)))) as pool:
+            outcomes = list(pool.map(timed_fetch, categories))
+        
+        merged = []
+        seen_links = set()
+        timings = {}
+        errors = {}
+        for category, (articles, error, seconds) in zip(categories, outcomes):
+            name = category or 'all'
+            timings[name] = round(seconds, 3)
+            if error:
+                print(f"Error fetching {name} news: {error}")
+                errors[name] = error
+            for article in articles:
+                link = article.get('url')
+                if link and link in seen_links:
+                    continue
+                seen_links.add(link)
+                merged.append(article)
+        
+        return {'articles': merged, 'timings': timings, 'errors': errors}
+    
     def format_articles(self, raw_articles):
         """Format raw news articles into our format"""
         formatted = []
@@ -0,0 +1,161 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker is refusing upstream calls"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for 429 and 5xx responses"""
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30,
+                 retry_statuses=(429, 500, 502, 503, 504)):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = set(retry_statuses)
+
+    def should_retry(self, status_code: Optional[int]) -> bool:
+        """Network errors (no status) and throttling/server errors are retryable"""
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Seconds to sleep before retry number `attempt` (0-based), or None to give up"""
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            # Honor the server, but don't park a request thread beyond our own cap
+            return server_delay if server_delay <= self.backoff_max else None
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Stops calling upstream after repeated failures, probing again after a cool-down.
+
+    Half-open lets exactly one caller through as the probe; the others are
+    refused until it reports back. A probe that never reports (its caller
+    died) is given up on after another `reset_timeout`.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        # When the half-open probe was let through, or None if none is out
+        self.probe_started_at = None
+        self._state = self.CLOSED
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Closed: allow. Open: refuse. Half-open: allow one probe at a time"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.OPEN:
+                return False
+            now = time.monotonic()
+            if self.probe_started_at is not None and now - self.probe_started_at < self.reset_timeout:
+                return False
+            self.probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self.opened_at = None
+            self.probe_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._current_state() == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self.opened_at = time.monotonic()
+            self.probe_started_at = None
+
+    def release_probe(self) -> None:
+        """A call ended without telling us anything about upstream health (e.g. a 4xx): let another probe"""
+        with self._lock:
+            self.probe_started_at = None
+
+
+class UpstreamMetrics:
+    """Thread-safe counters for upstream calls"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.short_circuited = 0
+        self.status_counts: Dict[str, int] = {}
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.last_error = None
+
+    def record_attempt(self, seconds: float, status_code: Optional[int]) -> None:
+        with self._lock:
+            self.requests += 1
+            self.latency_total += seconds
+            self.latency_max = max(self.latency_max, seconds)
+            key = str(status_code) if status_code is not None else 'network_error'
+            self.status_counts[key] = self.status_counts.get(key, 0) + 1
+
+    def increment(self, counter: str, error: str = None) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            if error:
+                self.last_error = error
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'successes': self.successes,
+                'failures': self.failures,
+                'retries': self.retries,
+                'short_circuited': self.short_circuited,
+                'status_counts': dict(self.status_counts),
+                'latency_avg_ms': round(self.latency_total / self.requests * 1000, 1) if self.requests else 0.0,
+                'latency_max_ms': round(self.latency_max * 1000, 1),
+                'last_error': self.last_error
+            }
@@ -0,0 +1,144 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .fingerprint import normalize_text, story_fingerprint
+from .templates import TEMPLATE_VERSION
+
+
+def generation_key(story: Dict[str, Any], engine) -> str:
+    """Cache key: template version, engine seed (if deterministic) and the source story"""
+    parts = [
+        TEMPLATE_VERSION,
+        type(engine).__name__,
+        engine.seed if engine.deterministic else None,
+        story_fingerprint(story),
+        normalize_text(story.get('title', '')),
+        (story.get('category') or 'general').lower()
+    ]
+    return hashlib.sha256(json.dumps(parts, default=str).encode('utf-8')).hexdigest()
+
+
+class GenerationCache:
+    """LRU of generated satire articles, with an optional on-disk tier.
+
+    Memory holds at most `maxsize` articles; with `directory` set, every
+    article is also written there (up to `max_disk_entries`, oldest evicted
+    first) so repeat stories stay cheap across restarts. Values are copied
+    on the way in and out, since callers mutate articles.
+    """
+
+    def __init__(self, maxsize: int = 1024, directory: str = None, max_disk_entries: int = 10000):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._disk_writes = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            article = self._entries.get(key)
+            if article is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(article)
+
+        article = self._read_disk(key)
+        with self._lock:
+            if article is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, article)
+        return copy.deepcopy(article)
+
+    def set(self, key: str, article: Dict[str, Any]) -> None:
+        article = copy.deepcopy(article)
+        with self._lock:
+            self._remember(key, article)
+        self._write_disk(key, article)
+
+    def _remember(self, key: str, article: Dict[str, Any]) -> None:
+        self._entries[key] = article
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                article = json.load(f)
+            os.utime(path)  # mark as recently used
+            return article
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Error reading cached generation: {e}")
+            return None
+
+    def _write_disk(self, key: str, article: Dict[str, Any]) -> None:
+        if not self.directory:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(article, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error caching generation: {e}")
+            return
+
+        # Listing the directory is O(entries), so only trim it every so often
+        with self._lock:
+            self._disk_writes += 1
+            if self._disk_writes % 100:
+                return
+        names = [name for name in os.listdir(self.directory) if name.endswith('.json')]
+        if len(names) > self.max_disk_entries:
+            paths = sorted((os.path.join(self.directory, name) for name in names), key=os.path.getmtime)
+            for stale in paths[:len(paths) - self.max_disk_entries]:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'disk': self.directory is not None
+            }
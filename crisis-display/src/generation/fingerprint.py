@@ -0,0 +1,292 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query params that only track the click, not the story
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'cmpid', 'ocid'}
+
+# newsdata.io free plan puts this in place of the article body
+PAID_PLAN_PLACEHOLDER = 'ONLY AVAILABLE IN PAID PLANS'
+
+# Below this many words a title (or a title with no body) is too generic to identify a story
+MIN_SPECIFIC_WORDS = 8
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a story link: no scheme/www/fragment/tracking params"""
+    if not url:
+        return ''
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = [(k, v) for k, v in parse_qsl(parts.query)
+             if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS]
+    path = parts.path.rstrip('/')
+    return urlunsplit(('', host, path, urlencode(sorted(query)), '')).lstrip('/')
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase words only, single-spaced"""
+    return ' '.join(re.findall(r'[a-z0-9]+', (text or '').lower()))
+
+
+def story_content(story: Dict[str, Any]) -> str:
+    """Normalized body, or '' for the paid-plan placeholder"""
+    content = story.get('content') or ''
+    if content.strip().upper().startswith(PAID_PLAN_PLACEHOLDER):
+        return ''
+    return normalize_text(content)
+
+
+def story_text(story: Dict[str, Any]) -> str:
+    """Title plus content, ignoring the paid-plan placeholder body"""
+    return normalize_text(f"{story.get('title', '')} {story_content(story)}")
+
+
+def _sha1(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def exact_keys(story: Dict[str, Any]) -> List[str]:
+    """Exact-match keys for a formatted story.
+
+    Its normalized url, and its title together with its body. Without a body
+    the title alone only counts if it is long enough to be specific, so
+    stories that merely share a generic headline ("Live updates") are kept.
+    """
+    keys = []
+    url = normalize_url(story.get('url', ''))
+    if url:
+        keys.append('url:' + _sha1(url))
+    title = normalize_text(story.get('title', ''))
+    content = story_content(story)
+    if title and content:
+        keys.append('story:' + _sha1(f"{title}\n{content}"))
+    elif len(title.split()) >= MIN_SPECIFIC_WORDS:
+        keys.append('title:' + _sha1(title))
+    return keys
+
+
+def story_fingerprint(story: Dict[str, Any]) -> str:
+    """Stable id of the underlying story (url if present, else title)"""
+    basis = normalize_url(story.get('url', '')) or normalize_text(story.get('title', '')) or story_text(story)
+    return _sha1(basis)
+
+
+def shingles(text: str, size: int = 3) -> set:
+    words = text.split()
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """MinHash signatures over word shingles using seeded universal hashing"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        self.num_perm = num_perm
+        digest = hashlib.sha256(str(seed).encode('utf-8')).digest()
+        params = []
+        for i in range(num_perm):
+            block = hashlib.sha256(digest + i.to_bytes(4, 'big')).digest()
+            a = int.from_bytes(block[:8], 'big') % (MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(block[8:16], 'big') % MERSENNE_PRIME
+            params.append((a, b))
+        self.params = params
+
+    def signature(self, text: str) -> Optional[List[int]]:
+        """None when the text is too short for similarity to mean anything"""
+        if len(text.split()) < MIN_SPECIFIC_WORDS:
+            return None
+        tokens = shingles(text)
+        hashes = [int.from_bytes(hashlib.blake2b(t.encode('utf-8'), digest_size=4).digest(), 'big')
+                  for t in tokens]
+        return [min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes) for a, b in self.params]
+
+
+def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+class StoryDeduplicator:
+    """Drops stories already seen (exact url/title) or near-duplicates (MinHash/LSH).
+
+    Signatures are split into `bands` LSH buckets so only stories sharing a
+    band are compared. The seen-set is capped at `max_entries`, forgetting
+    the oldest stories first. It is persisted to `path` as JSON lines, one
+    {"entries": [...]} line per remember() call, and compacted once the file
+    holds twice the cap.
+    """
+
+    def __init__(self, path: str = None, threshold: float = 0.7, num_perm: int = 64,
+                 bands: int = 16, max_entries: int = 5000):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.hasher = MinHasher(num_perm)
+        self._lock = threading.Lock()
+        self.entries = deque()
+        # Entries in the file, including ones trimmed from memory since the last compaction
+        self._disk_entries = 0
+        self.load()
+
+    def load(self) -> None:
+        entries = []
+        clean = True
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, 'rb') as f:
+                    for line in f:
+                        # A file from before JSON lines is a single {"version": 1, "entries": [...]} object
+                        clean = clean and line.endswith(b'\n')
+                        try:
+                            entries.extend(json.loads(line.decode('utf-8')).get('entries', []))
+                        except ValueError:
+                            # A torn final line from a crash mid-append
+                            clean = False
+                            break
+            except OSError as e:
+                print(f"Error loading seen stories: {e}")
+        self.entries = deque()
+        self.exact = {}
+        self.buckets = {}
+        for entry in entries[-self.max_entries:]:
+            self.entries.append(entry)
+            self._index(entry)
+        self._disk_entries = len(entries)
+        if entries and not clean:
+            # Rewrite so appends start on a fresh line
+            self.save()
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple]:
+        return [(band,) + tuple(signature[band * self.rows:(band + 1) * self.rows])
+                for band in range(self.bands)]
+
+    def _index(self, entry: Dict[str, Any], exact: Dict = None, buckets: Dict = None) -> None:
+        exact = self.exact if exact is None else exact
+        buckets = self.buckets if buckets is None else buckets
+        for key in entry['keys']:
+            exact[key] = entry
+        if entry.get('signature'):
+            for band_key in self._band_keys(entry['signature']):
+                buckets.setdefault(band_key, []).append(entry)
+
+    def _forget(self, entry: Dict[str, Any]) -> None:
+        """Drop the oldest entry from the indexes (it is first in each of its buckets)"""
+        for key in entry['keys']:
+            if self.exact.get(key) is entry:
+                del self.exact[key]
+        if entry.get('signature'):
+            for band_key in self._band_keys(entry['signature']):
+                bucket = self.buckets.get(band_key)
+                if not bucket:
+                    continue
+                for i, candidate in enumerate(bucket):
+                    if candidate is entry:
+                        del bucket[i]
+                        break
+                if not bucket:
+                    del self.buckets[band_key]
+
+    def _match(self, keys: List[str], signature: Optional[List[int]],
+               exact: Dict = None, buckets: Dict = None) -> Optional[str]:
+        exact = self.exact if exact is None else exact
+        buckets = self.buckets if buckets is None else buckets
+        for key in keys:
+            if key in exact:
+                return f"duplicate {key.split(':', 1)[0]}"
+        if signature:
+            candidates = {}
+            for band_key in self._band_keys(signature):
+                for entry in buckets.get(band_key, ()):
+                    candidates[id(entry)] = entry
+            for entry in candidates.values():
+                if similarity(signature, entry['signature']) >= self.threshold:
+                    return 'near duplicate'
+        return None
+
+    def check(self, story: Dict[str, Any]) -> Optional[str]:
+        """Why `story` is a duplicate ('duplicate url', 'duplicate story', 'duplicate title',
+        'near duplicate') or None"""
+        with self._lock:
+            return self._match(exact_keys(story), self.hasher.signature(story_text(story)))
+
+    def filter(self, stories: List[Dict[str, Any]], remember: bool = False) -> List[Dict[str, Any]]:
+        """Stories that are new, also dropping repeats within the batch.
+
+        With remember=False the seen-set is left alone, so the caller can call
+        remember() once the stories have actually been archived.
+        """
+        kept = []
+        batch_exact, batch_buckets = {}, {}
+        with self._lock:
+            for story in stories:
+                keys = exact_keys(story)
+                signature = self.hasher.signature(story_text(story))
+                if self._match(keys, signature) or self._match(keys, signature, batch_exact, batch_buckets):
+                    continue
+                self._index({'keys': keys, 'signature': signature}, batch_exact, batch_buckets)
+                kept.append(story)
+        if remember:
+            self.remember(kept)
+        return kept
+
+    def remember(self, stories: List[Dict[str, Any]]) -> None:
+        """Add stories to the persistent seen-set (one append, whatever the batch size)"""
+        if not stories:
+            return
+        with self._lock:
+            added = []
+            for story in stories:
+                entry = {'keys': exact_keys(story), 'signature': self.hasher.signature(story_text(story))}
+                self.entries.append(entry)
+                self._index(entry)
+                added.append(entry)
+            while len(self.entries) > self.max_entries:
+                self._forget(self.entries.popleft())
+            if self._disk_entries + len(added) > 2 * self.max_entries:
+                self.save()
+            else:
+                self._append(added)
+
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'entries': entries}) + '\n')
+            self._disk_entries += len(entries)
+        except OSError as e:
+            print(f"Error saving seen stories: {e}")
+
+    def save(self) -> None:
+        """Rewrite the file with just the entries in memory (compaction)"""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'entries': list(self.entries)}) + '\n')
+            os.replace(tmp_path, self.path)
+            self._disk_entries = len(self.entries)
+        except OSError as e:
+            print(f"Error saving seen stories: {e}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
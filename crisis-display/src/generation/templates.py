@@ -0,0 +1,326 @@
+from string import Template
+from typing import Any, Dict, List
+
+# Bump whenever template text changes, so cached generations are invalidated
+TEMPLATE_VERSION = 1
+
+
+def compile_format(text: str) -> str:
+    """Turn string.Template syntax ($name, ${name}, $$) into a str.format string"""
+    pieces = []
+    position = 0
+    for match in Template.pattern.finditer(text):
+        pieces.append(text[position:match.start()].replace('{', '{{').replace('}', '}}'))
+        if match.group('escaped') is not None:
+            pieces.append('$')
+        elif match.group('invalid') is not None:
+            raise ValueError(f"Invalid placeholder in template: {text!r}")
+        else:
+            pieces.append('{%s}' % (match.group('named') or match.group('braced')))
+        position = match.end()
+    pieces.append(text[position:].replace('{', '{{').replace('}', '}}'))
+    return ''.join(pieces)
+
+
+class SlotTemplate:
+    """A string.Template-style pattern whose slots are filled by random picks.
+
+    Slots given as lists are picked with rng.choice, (lo, hi) tuples with
+    rng.randint. `defaults` fill caller fields that come in empty. The text
+    is compiled to a str.format string up front, which renders faster than
+    Template.substitute.
+    """
+
+    __slots__ = ('text', 'format_text', 'choices', 'ranges', 'defaults')
+
+    def __init__(self, text: str, defaults: Dict[str, str] = None, **slots):
+        self.text = text
+        self.format_text = compile_format(text)
+        self.choices = tuple((name, tuple(values)) for name, values in slots.items() if not isinstance(values, tuple))
+        self.ranges = tuple((name, values) for name, values in slots.items() if isinstance(values, tuple))
+        self.defaults = tuple((defaults or {}).items())
+
+    def render(self, rng, **fields) -> str:
+        for name, default in self.defaults:
+            if not fields.get(name):
+                fields[name] = default
+        for name, values in self.choices:
+            fields[name] = rng.choice(values)
+        for name, (lo, hi) in self.ranges:
+            fields[name] = rng.randint(lo, hi)
+        return self.format_text.format_map(fields)
+
+
+HEADLINE_TEMPLATES = {
+    'politics': [
+        SlotTemplate("Local Officials Make ${adj} Decision To ${verb} ${title}",
+                     adj=['Bold', 'Historic', 'Unprecedented'], verb=['Consider', 'Think About', 'Ponder']),
+        SlotTemplate("In Move That Stunned ${who}, Politicians ${verb} Plans Regarding ${title}",
+                     who=['Absolutely No One', 'Experts', 'Local Residents'], verb=['Announce', 'Declare', 'Proclaim']),
+        SlotTemplate("${title} Described As '${label}' By People Who Should Know Better",
+                     label=['Most Important Issue Of Our Time', 'Game-Changer', 'Paradigm Shift'])
+    ],
+    'technology': [
+        SlotTemplate("New Technology Promises To ${verb} How We ${how} ${title}",
+                     verb=['Revolutionize', 'Transform', 'Completely Change'],
+                     how=['Think About', 'Interact With', 'Experience']),
+        SlotTemplate("Startup Raises ${amount} For ${title} - Something That Already Existed",
+                     amount=['$50 Million', '$100 Million', 'Undisclosed Amount']),
+        SlotTemplate("Experts Agree ${title} Is '${label}' Despite Having No Idea What It Is",
+                     label=['The Future', 'Disruptive Innovation', 'Game-Changer'])
+    ],
+    'science': [
+        SlotTemplate("Study Reveals ${adj} Connection Between ${title} And ${other}",
+                     adj=['Shocking', 'Surprising', 'Mind-Blowing'],
+                     other=['Things We Already Knew', 'Common Sense', 'Reality']),
+        SlotTemplate("Scientists Discover ${title} Is, In Fact, ${what}",
+                     what=['Real', 'True', 'Actually A Thing']),
+        SlotTemplate("Research Shows ${title} ${verb} In Findings That ${finding}",
+                     verb=['Matters', 'Is Important', 'Exists'],
+                     finding=['Confirm Obvious', 'State The Obvious', 'Tell Us What We Already Know'])
+    ],
+    'sports': [
+        SlotTemplate("Athletes ${adj} By Discovery That ${title} ${verb}",
+                     adj=['Shocked', 'Amazed', 'Stunned'], verb=['Affects Performance', 'Is Important', 'Matters']),
+        SlotTemplate("Study Shows ${title} ${verb} Athletic Performance In Ways Everyone Already Knew",
+                     verb=['Helps', 'Hurts', 'Changes']),
+        SlotTemplate("Sports World Reacts To ${title} With ${reaction}",
+                     reaction=['Surprise', 'Shock', 'Complete Lack Of Surprise'])
+    ],
+    'entertainment': [
+        SlotTemplate("${title} ${verb} According To People Who Get Paid To Say That",
+                     verb=['Changes Everything', 'Redefines Genre', 'Sets New Standard']),
+        SlotTemplate("Critics Describe ${title} As '${label}' In Reviews That Sound Like Every Other Review",
+                     label=['Masterpiece', 'Game-Changer', 'Revolutionary']),
+        SlotTemplate("Industry Insiders Agree ${title} Is '${label}' For Reasons That Remain Unclear",
+                     label=['The Future', 'What People Want', 'Revolutionary'])
+    ],
+    'business': [
+        SlotTemplate("CEOs ${adj} By Discovery That ${title} ${verb}",
+                     adj=['Stunned', 'Shocked', 'Completely Surprised'],
+                     verb=['Affects Profits', 'Matters To Shareholders', 'Changes Everything']),
+        SlotTemplate("Market Reacts To ${title} With ${reaction}",
+                     reaction=['Wild Enthusiasm', 'Complete Indifference', 'Predictable Panic']),
+        SlotTemplate("Business Experts Agree ${title} Is '${label}' Despite Nobody Understanding What It Is",
+                     label=['Game-Changer', 'Paradigm Shift', 'Revolutionary'])
+    ],
+    'finance': [
+        SlotTemplate("Wall Street ${adj} By ${title} In Move That ${verb}",
+                     adj=['Stunned', 'Shocked', 'Completely Amazed'],
+                     verb=['Changes Everything', 'Changes Nothing', 'Changes Something Slightly']),
+        SlotTemplate("Financial Experts Describe ${title} As '${label}' Development In Market That Does What It Always Does",
+                     label=['Historic', 'Unprecedented', 'Completely Expected']),
+        SlotTemplate("Investors React To ${title} With ${reaction} Despite Having No Idea What Just Happened",
+                     reaction=['Optimism', 'Panic', 'Utter Confusion'])
+    ],
+    'health': [
+        SlotTemplate("Medical Community ${adj} By Discovery That ${title} ${verb}",
+                     adj=['Stunned', 'Shocked', 'Completely Amazed'],
+                     verb=['Affects Health', 'Matters', 'Is Actually True']),
+        SlotTemplate("Study Shows ${title} ${verb} Health In Ways Everyone Already Knew",
+                     verb=['Helps', 'Hurts', 'Changes']),
+        SlotTemplate("Health Experts Agree ${title} Is '${label}' In Findings That Surprise Absolutely No One",
+                     label=['Revolutionary', 'Game-Changer', 'Exactly What We Expected'])
+    ],
+    'world': [
+        SlotTemplate("Global Leaders ${adj} By ${title} In Development That ${verb}",
+                     adj=['Stunned', 'Shocked', 'Completely Surprised'],
+                     verb=['Changes Everything', 'Changes Nothing', 'Was Inevitable']),
+        SlotTemplate("International Community Reacts To ${title} With ${reaction}",
+                     reaction=['Concern', 'Indifference', 'Complete Surprise']),
+        SlotTemplate("World Experts Agree ${title} Is '${label}' Despite It Happening Regularly",
+                     label=['Historic', 'Unprecedented', 'Business As Usual'])
+    ]
+}
+
+# Sentence appended to the category's opening template; ${buzzword} is filled by the engine
+OPENING_TEMPLATES = {
+    'politics': SlotTemplate("${base} The initiative involves a ${buzzword} that stakeholders believe will lead to optimal outcomes through synergistic engagement."),
+    'technology': SlotTemplate("${base} The ${buzzword} solution leverages cutting-edge technology to disrupt traditional workflows while maximizing user engagement."),
+    'business': SlotTemplate("${base} The announcement sent shockwaves through Wall Street, with investors scrambling to adjust their portfolios in response to ${content}.",
+                             defaults={'content': 'market conditions'}),
+    'finance': SlotTemplate("${base} Market analysts were completely stunned by the development, describing it as '${label}' in a sector that rarely sees ${content}.",
+                            defaults={'content': 'surprising developments'},
+                            label=['unprecedented', 'shocking', 'surprising']),
+    'health': SlotTemplate("${base} Medical researchers were amazed by the findings, which could revolutionize how we approach ${content}.",
+                           defaults={'content': 'healthcare'}),
+    'world': SlotTemplate("${base} Global leaders scrambled to respond to the breaking news about ${content}, calling emergency meetings to address the situation.",
+                          defaults={'content': 'international developments'}),
+    'sports': SlotTemplate("${base} The sports world was rocked by the revelation, with coaches and athletes alike struggling to comprehend how ${content} might affect performance.",
+                           defaults={'content': 'this development'}),
+    'entertainment': SlotTemplate("${base} Industry insiders were buzzing about the news, with many calling it '${label}' in a field that desperately needs something to talk about.",
+                                  label=['groundbreaking', 'revolutionary', 'game-changing']),
+    'general': SlotTemplate("${base} The findings, published in a prestigious journal, have important implications for our understanding of things we already understood.")
+}
+
+BODY_TEMPLATES = {
+    'politics': [
+        SlotTemplate("The announcement, which took approximately ${minutes} minutes to deliver, was met with ${reaction} from residents who have grown accustomed to ${habit}.",
+                     minutes=(30, 90), reaction=['cautious optimism', 'utter indifference', 'complete surprise'],
+                     habit=['delayed responses', 'empty promises', 'political theater']),
+        SlotTemplate("Mayor Thompson explained that this proactive approach to potentially addressing ${content} represents a bold step forward in municipal governance, even though no specific timeline was provided for when actual consideration might begin.",
+                     defaults={'content': 'community issues'}),
+        SlotTemplate("Opposition parties criticized the plan as '${verdict}', suggesting that forming a committee to consider discussing issues might set an unrealistic precedent for taking action.",
+                     verdict=['too ambitious', 'not ambitious enough', 'exactly what you would expect'])
+    ],
+    'technology': [
+        SlotTemplate("The new platform, which requires ${apps} separate apps and a monthly subscription, adds several additional steps to processes that previously took seconds to complete.",
+                     apps=(2, 5)),
+        SlotTemplate("Investors have poured $$${amount} million into the venture, citing the enormous potential of convincing people they need solutions to problems they didn't know they had.",
+                     amount=(10, 100)),
+        SlotTemplate("Early adopters report being '${feeling}' in equal measure, with many praising the innovation while struggling to understand what it actually does.",
+                     feeling=['impressed', 'confused', 'both'])
+    ],
+    'science': [
+        SlotTemplate("The ${years}-year study followed ${participants} participants, ${percent}% of whom were included in at least one study during the research period.",
+                     years=(3, 10), participants=(1000, 10000), percent=(60, 95)),
+        SlotTemplate("Researchers noted that participants who ${did} were ${percent}% more likely to be cited in subsequent studies about people who ${do}.",
+                     did=['read the most studies', 'breathed air', 'existed'], percent=(200, 500),
+                     do=['read studies', 'breathe air', 'exist']),
+        SlotTemplate("The scientific community has hailed the findings as '${first}' and '${second}', with calls for additional funding to study why studies require so much funding.",
+                     first=['revolutionary', 'obvious', 'both'], second=['groundbreaking', 'predictable', 'expected'])
+    ],
+    'sports': [
+        SlotTemplate("The discovery has sent shockwaves through the athletic community, with players reportedly ${reaction} by the revelation that ${content} might affect performance.",
+                     defaults={'content': 'basic athletic principles'},
+                     reaction=['stunned', 'amazed', 'completely unfazed']),
+        SlotTemplate("Coaches are already incorporating these findings into training regimens, adding ${drills} new drills to practice sessions that already last ${hours} hours.",
+                     drills=(1, 4), hours=(2, 6)),
+        SlotTemplate("League officials are considering rule changes based on the research, though insiders suggest any changes will be implemented ${when}.",
+                     when=['immediately', 'after extensive study', 'never'])
+    ],
+    'entertainment': [
+        SlotTemplate("Industry insiders are calling the development '${label}' in a field that desperately needs something to talk about.",
+                     label=['game-changing', 'revolutionary', 'exactly like everything else']),
+        SlotTemplate("Experts predict this will ${change} for the next ${months} months, at which point something else will become the thing that changes everything.",
+                     change=['change everything', 'change nothing', 'change something slightly'], months=(6, 24)),
+        SlotTemplate("Fans have reacted with ${reaction}, with many taking to social media to express opinions that will be completely forgotten by tomorrow.",
+                     reaction=['enthusiasm', 'indifference', 'confusion'])
+    ],
+    'business': [
+        SlotTemplate("The announcement, which took approximately ${minutes} minutes to deliver, was met with ${reaction} from investors who have grown accustomed to ${habit}.",
+                     minutes=(15, 60), reaction=['wild enthusiasm', 'complete indifference', 'market panic'],
+                     habit=['corporate jargon', 'empty promises', 'quarterly earnings calls']),
+        SlotTemplate("CEO Thompson explained that this proactive approach to potentially addressing ${content} represents a bold step forward in corporate governance, even though no specific timeline was provided for when actual profits might begin.",
+                     defaults={'content': 'market conditions'}),
+        SlotTemplate("Market analysts criticized the plan as '${verdict}', suggesting that forming a committee to consider discussing quarterly results might set an unrealistic precedent for taking action.",
+                     verdict=['too ambitious', 'not ambitious enough', 'exactly what you would expect'])
+    ],
+    'finance': [
+        SlotTemplate("The financial markets reacted with ${reaction} to the development, with traders reportedly ${action} in response to ${content}.",
+                     defaults={'content': 'market news'},
+                     reaction=['wild optimism', 'utter panic', 'complete confusion'],
+                     action=['buying everything', 'selling everything', 'doing nothing']),
+        SlotTemplate("Wall Street experts explained that this represents either a ${scale} in the ongoing saga of numbers going up and down for reasons nobody understands.",
+                     scale=['major turning point', 'minor inconvenience', 'complete non-event']),
+        SlotTemplate("Federal Reserve officials are considering policy changes based on the news, though insiders suggest any changes will be implemented ${when}.",
+                     when=['immediately', 'after extensive study', 'never'])
+    ],
+    'health': [
+        SlotTemplate("The medical community was ${reaction} by the discovery, with doctors reportedly ${action}.",
+                     reaction=['stunned', 'shocked', 'completely amazed'],
+                     action=['reconsidering everything', 'confirming what they already knew', 'asking for more funding']),
+        SlotTemplate("The ${years}-year study followed ${participants} participants, ${percent}% of whom were ${outcome}.",
+                     years=(5, 15), participants=(500, 5000), percent=(60, 95),
+                     outcome=['surprised by the findings', 'not surprised at all', 'confused by the methodology']),
+        SlotTemplate("Health experts are calling for ${call}, though most agree that ${content} probably ${verdict}.",
+                     defaults={'content': 'this health issue'},
+                     call=['immediate action', 'more research', 'a balanced approach'],
+                     verdict=['matters', 'doesnt matter', 'might matter slightly'])
+    ],
+    'world': [
+        SlotTemplate("Global leaders gathered to discuss the development, which has been described as '${label}' by people who get paid to describe things as historic.",
+                     label=['historic', 'unprecedented', 'business as usual']),
+        SlotTemplate("The international community reacted with ${reaction} to the news, with many nations ${action}.",
+                     reaction=['concern', 'indifference', 'complete surprise'],
+                     action=['calling for action', 'ignoring it completely', 'forming committees']),
+        SlotTemplate("United Nations officials are considering a resolution regarding ${content}, though insiders suggest any resolution will be ${outcome}.",
+                     defaults={'content': 'global issues'},
+                     outcome=['immediately implemented', 'ignored completely', 'vetoed by major powers'])
+    ],
+    'general': [
+        SlotTemplate("The situation, which has been developing for ${years} years, has finally reached the point where people are talking about it, at least until something more interesting happens.",
+                     years=(1, 10)),
+        SlotTemplate("Experts agree that this represents either a ${scale} in the ongoing saga of things that happen.",
+                     scale=['major turning point', 'minor inconvenience', 'complete non-event']),
+        SlotTemplate("Further research is planned, though most expect the findings to confirm what everyone already suspected all along.")
+    ]
+}
+
+
+def expert(name: str, affiliation: str, quote: str) -> Dict[str, str]:
+    return {'expert': name, 'affiliation': affiliation, 'quote': quote}
+
+
+EXPERT_QUOTES: Dict[str, List[Dict[str, Any]]] = {
+    'politics': [
+        expert('Dr. Patricia Roberts', 'Institute for Political Satire Studies',
+               'This represents a paradigm shift in governmental procrastination. We\'re moving from ignoring problems to actively ignoring them in a more structured way.'),
+        expert('Jennifer Walsh', 'Municipal Governance Institute',
+               'The formation of a committee to consider discussing issues is truly groundbreaking. It\'s like democracy, but with more meetings.')
+    ],
+    'technology': [
+        expert('Dr. Christopher Chen', 'Silicon Valley Analyst',
+               'This is exactly what the market was missing - a way to monetize simplicity by making it feel exclusive and complicated.'),
+        expert('Mark Stevens', 'Tech Innovation Lab',
+               'The beauty of this solution is that it creates problems that only it can solve, which is the essence of disruptive innovation.')
+    ],
+    'science': [
+        expert('Dr. Emily Watson', 'Institute of Obvious Conclusions',
+               'This research confirms what we suspected All along - things are, in fact, the way they are. The implications are staggering.'),
+        expert('Dr. Robert Miller', 'Center for Academic Research',
+               'Our findings suggest a self-perpetuating cycle of study-reading that could revolutionize how we conduct future studies about study-reading patterns.')
+    ],
+    'sports': [
+        expert('Coach Michael Richardson', 'Sports Analytics Institute',
+               'This represents a paradigm shift in athletic performance analysis. We\'re moving from simply watching games to actually understanding why athletes win by not winning at all.'),
+        expert('Jessica Martinez', 'Athletic Performance Journal',
+               'The data shows that teams who practice less tend to have better injury outcomes, in findings that have stunned the sports medicine community.')
+    ],
+    'music': [
+        expert('Dr. David Chen', 'Music Industry Weekly',
+               'The trend toward silence in music production reflects a fundamental shift in how artists express creativity, or rather, the lack thereof.'),
+        expert('Maria Rodriguez', 'Audio Engineering Magazine',
+               'Artists are increasingly using technology to create sounds that never existed, which is either revolutionary or deeply confusing to everyone involved.')
+    ],
+    'world': [
+        expert('Dr. James Wilson', 'Global Affairs Institute',
+               'International diplomacy increasingly resembles a reality show where everyone knows the script but pretends to be improvising.'),
+        expert('Dr. Sarah Thompson', 'World Policy Forum',
+               'Global events are, in fact, occurring in various locations simultaneously, which suggests either unprecedented coordination or widespread coincidence.')
+    ],
+    'business': [
+        expert('Dr. Michael Thompson', 'Harvard Business Review',
+               'This represents a paradigm shift in corporate strategy. We\'re moving from ignoring market trends to actively ignoring them in a more structured way.'),
+        expert('Jennifer Walsh', 'Wall Street Analytics',
+               'The beauty of this business model is that it creates problems that only it can solve, which is the essence of disruptive innovation.')
+    ],
+    'finance': [
+        expert('Dr. Robert Chen', 'Federal Reserve Institute',
+               'This represents either unprecedented coordination or widespread coincidence in financial markets, depending on who you ask.'),
+        expert('Sarah Martinez', 'Investment Weekly',
+               'The data suggests that money goes up and down for reasons that make sense only in retrospect, which is the essence of financial analysis.')
+    ],
+    'health': [
+        expert('Dr. Emily Watson', 'Medical Journal Today',
+               'This research confirms what doctors suspected all along - health is, in fact, affected by things that affect health.'),
+        expert('Dr. Richard Kim', 'Global Health Organization',
+               'Our findings suggest a self-perpetuating cycle of health advice that could revolutionize how we give health advice about giving health advice.')
+    ]
+}
+
+AUTHORS = {
+    'politics': ['Patricia Roberts', 'Jennifer Walsh', 'Tom Harris'],
+    'technology': ['Dr. Christopher Chen', 'Mark Stevens', 'Lisa Chang'],
+    'science': ['Dr. Emily Watson', 'Dr. Robert Miller', 'Dr. Jennifer Lee', 'Dr. Richard Kim'],
+    'sports': ['Coach Michael Richardson', 'Jessica Martinez', 'Chris Johnson'],
+    'music': ['Dr. David Chen', 'Maria Rodriguez', 'Emily Taylor', 'Justin Timberlake'],
+    'world': ['Dr. James Wilson', 'Sarah Thompson', 'Michael Davis', 'Anna Petrova'],
+    'business': ['Dr. Michael Thompson', 'Jennifer Walsh', 'Tom Anderson'],
+    'finance': ['Dr. Robert Chen', 'Sarah Martinez', 'Mark Johnson'],
+    'health': ['Dr. Emily Watson', 'Dr. Richard Kim', 'Lisa Davis'],
+    'entertainment': ['Dr. David Chen', 'Maria Rodriguez', 'Emily Taylor'],
+    'advice': ['Gabby Thompson'],
+    'mens_dating': ['Guy Breux'],
+    'womens_dating': ['Gabby Thompson']
+}
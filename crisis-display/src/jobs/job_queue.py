@@ -0,0 +1,341 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT,
+    params TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'queued',
+    progress TEXT NOT NULL DEFAULT '{}',
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    owner TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_active_key ON jobs(key) WHERE status IN ('queued', 'running');
+"""
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+# Columns added after the first release; older databases get them on open
+ADDED_COLUMNS = {'owner': 'TEXT', 'lease_expires_at': 'REAL'}
+
+
+def process_owner() -> str:
+    """host:pid of this process, recorded on the jobs it claims"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def owner_is_dead(owner: Optional[str]) -> bool:
+    """True only when `owner` is a process on this host that no longer exists"""
+    host, _, pid = (owner or '').rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit() or os.name != 'posix':
+        # Another machine (or no way to check): only its lease can tell
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        pass
+    return False
+
+
+def wait_for_job(get_job: Callable[[str], Optional[Dict[str, Any]]], job_id: str,
+                 timeout: float = 120, poll_interval: float = 2.0) -> Optional[Dict[str, Any]]:
+    """Poll get_job(job_id) until the job leaves the queue or `timeout` seconds pass.
+
+    Returns the job as last seen. get_job can be JobQueue.get or a client of
+    the /api/jobs/<id> endpoint.
+    """
+    deadline = time.time() + timeout
+    job = get_job(job_id)
+    while job is not None and job.get('status') in ACTIVE_STATUSES and time.time() < deadline:
+        time.sleep(max(0.0, min(poll_interval, deadline - time.time())))
+        job = get_job(job_id)
+    return job
+
+
+def job_outcome(job: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """A finished job's result, or {'success': False, 'message'} if it failed, is missing or is still going"""
+    if job is None or 'status' not in job:
+        return {'success': False, 'message': (job or {}).get('error', 'Job not found')}
+    if job['status'] == 'done':
+        return job['result']
+    if job['status'] == 'failed':
+        return {'success': False, 'message': job.get('error') or 'Job failed'}
+    return {'success': False, 'message': f"Job {job['id']} still {job['status']}"}
+
+
+class JobQueue:
+    """Persistent FIFO of jobs in SQLite.
+
+    Jobs move queued → running → done/failed. A job enqueued with a `key`
+    while another job with the same key is still queued or running is not
+    added; the existing job is returned instead, so duplicate requests
+    coalesce onto the work already in flight.
+
+    Claiming a job records its owner (host:pid) and a lease of
+    `lease_seconds`, which the owner keeps renewing while it works. Only a
+    job whose lease ran out, or whose owner process is gone, is put back in
+    the queue, so several processes can share one database.
+    """
+
+    def __init__(self, db_path: str, keep_finished: int = 500, lease_seconds: float = 60):
+        self.db_path = db_path
+        self.keep_finished = keep_finished
+        self.lease_seconds = lease_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        # One connection per thread; sqlite3 connections can't be shared safely
+        self._local = threading.local()
+        # Set whenever a job is enqueued so an idle worker wakes up immediately
+        self.wakeup = threading.Event()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(jobs)")}
+        for name, kind in ADDED_COLUMNS.items():
+            if name not in columns:
+                conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {kind}")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; multi-statement updates use explicit BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['progress'] = json.loads(job['progress'])
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        return job
+
+    def enqueue(self, kind: str, params: Dict[str, Any] = None, key: str = None) -> Tuple[Dict[str, Any], bool]:
+        """Add a job; returns (job, created). created is False when it coalesced onto an active job"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if key is not None:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE key = ? AND status IN (?, ?)", (key, *ACTIVE_STATUSES)
+                ).fetchone()
+                if row is not None:
+                    conn.execute("COMMIT")
+                    return self._to_dict(row), False
+
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO jobs (id, kind, key, params, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, key, json.dumps(params or {}), time.time())
+            )
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        self.wakeup.set()
+        return self._to_dict(row), True
+
+    def claim(self, owner: str = None) -> Optional[Dict[str, Any]]:
+        """Mark the oldest queued job running under `owner` and return it (None if the queue is empty)"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ?, owner = ?, lease_expires_at = ? WHERE id = ?",
+                (now, owner or process_owner(), now + self.lease_seconds, row['id'])
+            )
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (row['id'],)).fetchone()
+            conn.execute("COMMIT")
+            return self._to_dict(job)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        self._connection().execute("UPDATE jobs SET progress = ? WHERE id = ?", (json.dumps(progress), job_id))
+
+    def renew(self, job_id: str, owner: str = None) -> bool:
+        """Extend the lease on a running job; False if `owner` no longer holds it"""
+        cursor = self._connection().execute(
+            "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND status = 'running' AND owner = ?",
+            (time.time() + self.lease_seconds, job_id, owner or process_owner())
+        )
+        return cursor.rowcount == 1
+
+    def _finish(self, job_id: str, owner: Optional[str], assignments: str, values: Tuple) -> None:
+        # With an owner, a job that was requeued and taken over meanwhile is left to its new owner
+        query = f"UPDATE jobs SET {assignments}, finished_at = ?, lease_expires_at = NULL WHERE id = ?"
+        params = values + (time.time(), job_id)
+        if owner is not None:
+            query += " AND owner = ?"
+            params += (owner,)
+        self._connection().execute(query, params)
+        self._prune()
+
+    def complete(self, job_id: str, result: Dict[str, Any], owner: str = None) -> None:
+        self._finish(job_id, owner, "status = 'done', result = ?", (json.dumps(result),))
+
+    def fail(self, job_id: str, error: str, owner: str = None) -> None:
+        self._finish(job_id, owner, "status = 'failed', error = ?", (error,))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def wait(self, job_id: str, timeout: float, poll_interval: float = 0.2) -> Optional[Dict[str, Any]]:
+        """The job once it is done or failed, or as it stands after `timeout` seconds"""
+        return wait_for_job(self.get, job_id, timeout, poll_interval)
+
+    def requeue_abandoned(self) -> int:
+        """Put running jobs whose lease expired or whose owner died back in the queue"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            rows = conn.execute(
+                "SELECT id, owner, lease_expires_at FROM jobs WHERE status = 'running'"
+            ).fetchall()
+            # Rows from before leases were recorded have none; treat them as expired
+            abandoned = [row['id'] for row in rows
+                         if row['lease_expires_at'] is None or row['lease_expires_at'] < now
+                         or owner_is_dead(row['owner'])]
+            conn.executemany(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, owner = NULL, lease_expires_at = NULL "
+                "WHERE id = ?", [(job_id,) for job_id in abandoned]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(abandoned)
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def _prune(self) -> None:
+        # Keep only the most recent finished jobs so the table doesn't grow forever
+        self._connection().execute(
+            "DELETE FROM jobs WHERE status IN ('done', 'failed') AND id NOT IN ("
+            "SELECT id FROM jobs WHERE status IN ('done', 'failed') ORDER BY finished_at DESC LIMIT ?)",
+            (self.keep_finished,)
+        )
+
+
+class JobWorker:
+    """Background thread that runs queued jobs one at a time.
+
+    `handlers` maps a job kind to fn(params, report_progress) returning a
+    JSON-serializable result; an exception marks the job failed. While a job
+    runs, its lease is renewed every third of the queue's lease time.
+    """
+
+    def __init__(self, job_queue: JobQueue, handlers: Dict[str, Callable[..., Dict[str, Any]]],
+                 poll_interval: float = 5.0, owner: str = None):
+        self.queue = job_queue
+        self.handlers = handlers
+        self.poll_interval = poll_interval
+        self.owner = owner or process_owner()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._requeue_abandoned()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='job-worker', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        self._stop.set()
+        self.queue.wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _requeue_abandoned(self) -> None:
+        try:
+            requeued = self.queue.requeue_abandoned()
+        except sqlite3.Error as e:
+            print(f"Error requeueing abandoned jobs: {e}")
+            return
+        if requeued:
+            print(f"🔁 Requeued {requeued} interrupted job(s)")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # Clear before claiming so an enqueue that races the claim still wakes us
+            self.queue.wakeup.clear()
+            # Jobs of workers that died since we last looked, in any process
+            self._requeue_abandoned()
+            try:
+                job = self.queue.claim(self.owner)
+            except sqlite3.Error as e:
+                print(f"Error claiming job: {e}")
+                job = None
+            if job is None:
+                self.queue.wakeup.wait(self.poll_interval)
+                continue
+            self.run_job(job)
+
+    def run_job(self, job: Dict[str, Any]) -> None:
+        handler = self.handlers.get(job['kind'])
+        if handler is None:
+            self.queue.fail(job['id'], f"No handler for job kind '{job['kind']}'", owner=self.owner)
+            return
+
+        def report_progress(progress: Dict[str, Any]) -> None:
+            self.queue.update_progress(job['id'], progress)
+
+        done = threading.Event()
+
+        def keep_lease() -> None:
+            while not done.wait(self.queue.lease_seconds / 3):
+                try:
+                    self.queue.renew(job['id'], self.owner)
+                except sqlite3.Error as e:
+                    print(f"Error renewing lease on job {job['id']}: {e}")
+
+        heartbeat = threading.Thread(target=keep_lease, name='job-lease', daemon=True)
+        heartbeat.start()
+        try:
+            result = handler(job['params'], report_progress)
+            self.queue.complete(job['id'], result or {}, owner=self.owner)
+        except Exception as e:
+            print(f"Error running job {job['id']}: {e}")
+            self.queue.fail(job['id'], str(e) or type(e).__name__, owner=self.owner)
+        finally:
+            done.set()
+            heartbeat.join()
@@ -0,0 +1,154 @@
+import threading
+import time
+from typing import Any, Dict, Iterator, List
+
+from generation.fingerprint import StoryDeduplicator
+from .pipeline import Pipeline, Stage
+
+INGEST_STAGES = ['fetch', 'normalize', 'dedupe', 'satirize', 'enrich_image', 'persist']
+
+
+def normalize_story(story: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim fields and fill defaults on a formatted upstream story"""
+    normalized = {key: value.strip() if isinstance(value, str) else value for key, value in story.items()}
+    normalized['title'] = ' '.join((normalized.get('title') or '').split())
+    normalized['category'] = (normalized.get('category') or 'general').lower()
+    return normalized
+
+
+class IngestRun:
+    """fetch → normalize → dedupe → satirize → enrich_image → persist for one refresh.
+
+    satirize and persist take micro-batches of up to `batch_size` stories
+    (whatever has queued up), so a batch is one archive commit and one
+    seen-set append. Batches big enough to be worth it are spread over
+    `generation_workers` processes, with one pool kept for the whole run.
+    When the pipeline keeps up, batches stay small and articles still show
+    up as soon as they are written.
+
+    With new_only, each category's fetch cursor is only stored once the run
+    has gone through without losing a story after the fetch (a failed
+    generation, stage error or failed commit); otherwise the next run reads
+    the same stories again and the seen-set skips the ones already archived.
+    `timings` and `errors` collect per-category fetch results like
+    NewsDataAPI.fetch_many.
+    """
+
+    def __init__(self, news_api, satire_engine, archive_manager, deduplicator=None,
+                 new_only: bool = True, limit: int = 10, queue_size: int = 16, fetch_workers: int = 4,
+                 batch_size: int = 32, generation_workers: int = None):
+        self.news_api = news_api
+        self.satire_engine = satire_engine
+        self.archive_manager = archive_manager
+        self.deduplicator = deduplicator
+        self.new_only = new_only
+        self.limit = limit
+        self.generation_workers = generation_workers
+        self.timings = {}
+        self.errors = {}
+        self._seen_this_run = StoryDeduplicator()
+        self._featured_done = False
+        self._lock = threading.Lock()
+        # Cursors from fetch_new_pending, stored by commit_cursors once the run is through
+        self.pending_cursors = []
+        self.lost = 0
+        self.pipeline = Pipeline([
+            Stage('fetch', self.fetch, workers=fetch_workers),
+            Stage('normalize', self.normalize),
+            Stage('dedupe', self.dedupe),
+            Stage('satirize', self.satirize, batch_size=batch_size),
+            Stage('enrich_image', self.enrich_image),
+            Stage('persist', self.persist, batch_size=batch_size)
+        ], queue_size=queue_size)
+
+    def fetch(self, category):
+        name = category or 'all'
+        started = time.perf_counter()
+        try:
+            if not self.new_only:
+                return self.news_api.fetch_category(category, limit=self.limit)
+            stories, pending = self.news_api.fetch_new_pending(category, limit=self.limit)
+            if pending:
+                with self._lock:
+                    self.pending_cursors.append(pending)
+            return stories
+        except Exception as e:
+            self.errors[name] = str(e)
+            raise
+        finally:
+            self.timings[name] = round(time.perf_counter() - started, 3)
+
+    def normalize(self, story):
+        story = normalize_story(story)
+        return [story] if story['title'] or story.get('url') else []
+
+    def dedupe(self, story):
+        # Stories seen on earlier runs, then copies within this run
+        if self.deduplicator is not None and self.deduplicator.check(story):
+            return []
+        if self._seen_this_run.check(story):
+            return []
+        self._seen_this_run.remember([story])
+        return [story]
+
+    def satirize(self, stories):
+        articles = self.satire_engine.generate_batch(stories, workers=self.generation_workers)
+        items = [{'story': story, 'article': article}
+                 for story, article in zip(stories, articles) if article is not None]
+        self._count_lost(len(stories) - len(items))
+        return items
+
+    def enrich_image(self, item):
+        # Same rule as batch_generate_satire: only the run's first article gets an image
+        article = item['article']
+        with self._lock:
+            featured = not self._featured_done
+            self._featured_done = True
+        if featured:
+            article['image_url'] = self.satire_engine.generate_featured_image(article['headline'], article['category'])
+        else:
+            article['image_url'] = None
+        return [item]
+
+    def persist(self, items):
+        results = self.archive_manager.add_articles([item['article'] for item in items])
+        self._count_lost(sum(1 for result in results if result['reason'] == 'commit failed'))
+        if self.deduplicator is not None:
+            self.deduplicator.remember([item['story'] for item, result in zip(items, results) if result['added']])
+        return [dict(result, headline=item['article'].get('headline'), category=item['article'].get('category'))
+                for item, result in zip(items, results)]
+
+    def _count_lost(self, count: int) -> None:
+        if count:
+            with self._lock:
+                self.lost += count
+
+    def run(self, categories: List[str]) -> Iterator[Dict[str, Any]]:
+        """Yield {'id', 'added', 'reason', 'headline', 'category'} per article as it is archived.
+
+        The fetch cursors are committed once the last result has been yielded.
+        """
+        try:
+            yield from self.pipeline.run(categories or [None])
+        finally:
+            # The generation pool lives for one run
+            self.satire_engine.close_pool()
+        self.commit_cursors()
+
+    def commit_cursors(self) -> bool:
+        """Store the pending fetch cursors, unless a story was lost after fetching"""
+        stage_errors = sum(stage['errors'] for stage in self.pipeline.report()['stages']
+                           if stage['stage'] != 'fetch')
+        if self.lost or stage_errors:
+            print(f"Keeping fetch cursors: {self.lost} stories lost, {stage_errors} stage errors this run")
+            return False
+        for pending in self.pending_cursors:
+            self.news_api.commit_cursor(pending)
+        self.pending_cursors = []
+        return True
+
+    def report(self) -> Dict[str, Any]:
+        report = self.pipeline.report()
+        report['fetch_timings'] = dict(self.timings)
+        report['fetch_errors'] = dict(self.errors)
+        return report
@@ -0,0 +1,192 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class StageStats:
+    """Per-stage counters: items in/out, errors, busy time and wall time"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.last_error = None
+        self.busy_seconds = 0.0
+        self.max_latency = 0.0
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, outputs: int, error: str = None, items: int = 1) -> None:
+        with self._lock:
+            self.items_in += items
+            self.items_out += outputs
+            self.busy_seconds += seconds
+            self.max_latency = max(self.max_latency, seconds)
+            if error:
+                self.errors += 1
+                self.last_error = error
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            end = self.finished_at or time.perf_counter()
+            wall = end - self.started_at if self.started_at else 0.0
+            return {
+                'stage': self.name,
+                'items_in': self.items_in,
+                'items_out': self.items_out,
+                'errors': self.errors,
+                'last_error': self.last_error,
+                'avg_latency_ms': round(self.busy_seconds / self.items_in * 1000, 2) if self.items_in else 0.0,
+                'max_latency_ms': round(self.max_latency * 1000, 2),
+                'throughput_per_s': round(self.items_out / wall, 1) if wall > 0 else 0.0,
+                'wall_seconds': round(wall, 3)
+            }
+
+
+class Stage:
+    """One pipeline step: fn(item) returns an iterable of 0..n output items.
+
+    `workers` threads run fn concurrently (output order is then not kept),
+    which suits I/O-bound steps like fetching.
+
+    With batch_size > 1, fn gets a list instead: whatever is already queued,
+    up to batch_size items, waiting at most `linger` seconds for more. Steps
+    with a fixed cost per call (a commit, a file write) then pay it once per
+    batch, and batches only grow when the stage is falling behind.
+    """
+
+    def __init__(self, name: str, fn: Callable[[Any], Iterable[Any]], workers: int = 1,
+                 batch_size: int = 1, linger: float = 0.05):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.batch_size = batch_size
+        self.linger = linger
+
+
+class Pipeline:
+    """Stages connected by bounded queues, each running in its own thread(s).
+
+    run(source) is a generator: items come out of the last stage as soon as
+    they clear it, while earlier stages keep working on the rest. A full
+    queue blocks the stage feeding it, so a slow stage throttles the ones
+    before it instead of buffering everything in memory.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 16):
+        self.stages = stages
+        self.queue_size = queue_size
+        self.stats = [StageStats(stage.name) for stage in stages]
+        self.started_at = None
+        self.finished_at = None
+
+    def _put(self, q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _feed(self, source: Iterable[Any], out_q: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for item in source:
+                if not self._put(out_q, item, stop):
+                    return
+        finally:
+            self._put(out_q, _DONE, stop)
+
+    def _work(self, stage: Stage, stats: StageStats, in_q: queue.Queue, out_q: queue.Queue,
+              stop: threading.Event, remaining: List[int], lock: threading.Lock) -> None:
+        while not stop.is_set():
+            try:
+                item = in_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                # Let sibling workers see the end marker too; the last one passes it on
+                in_q.put(_DONE)
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    stats.finished_at = time.perf_counter()
+                    self._put(out_q, _DONE, stop)
+                return
+
+            items = 1
+            if stage.batch_size > 1:
+                item = self._collect(stage, in_q, item)
+                items = len(item)
+
+            started = time.perf_counter()
+            outputs, error = [], None
+            try:
+                outputs = list(stage.fn(item) or ())
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                print(f"Error in pipeline stage {stage.name}: {error}")
+            stats.record(time.perf_counter() - started, len(outputs), error, items=items)
+            for output in outputs:
+                if not self._put(out_q, output, stop):
+                    return
+
+    def _collect(self, stage: Stage, in_q: queue.Queue, first: Any) -> List[Any]:
+        """A batch starting with `first`: more items while they keep coming, up to the stage's batch size"""
+        batch = [first]
+        deadline = time.perf_counter() + stage.linger
+        while len(batch) < stage.batch_size:
+            try:
+                item = in_q.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            if item is _DONE:
+                # Handled on the next get, after this batch
+                in_q.put(_DONE)
+                break
+            batch.append(item)
+        return batch
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """Yield the last stage's outputs as they are produced"""
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(source, queues[0], stop), daemon=True)]
+        self.started_at = time.perf_counter()
+        for i, (stage, stats) in enumerate(zip(self.stages, self.stats)):
+            stats.started_at = self.started_at
+            remaining, lock = [stage.workers], threading.Lock()
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work, args=(stage, stats, queues[i], queues[i + 1], stop, remaining, lock),
+                    name=f"pipeline-{stage.name}", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            # Also reached when the consumer stops early: wind the stages down
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=1)
+            self.finished_at = time.perf_counter()
+
+    def report(self) -> Dict[str, Any]:
+        """Per-stage throughput/latency plus total wall time"""
+        end = self.finished_at or time.perf_counter()
+        return {
+            'seconds': round(end - self.started_at, 3) if self.started_at else 0.0,
+            'stages': [stats.snapshot() for stats in self.stats]
+        }
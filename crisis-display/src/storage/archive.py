@@ -1,91 +1,371 @@
-import json
 import os
+import threading
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from .backends import JournalBackend, ProcessLock
+from .mmap_store import LazyArticle
+from .search_index import SearchIndex, article_fields
+from .views import TimelineView, category_key
+
+def normalize_id(article_id) -> str:
+    """Canonical key for an article id; 8958 and "8958" are the same article"""
+    return str(article_id).strip()
+
+def index_article(index: SearchIndex, article: Dict[str, Any]) -> None:
+    """Add an article to the search index without pinning a lazily-decoded body in memory"""
+    source = article.decoded() if isinstance(article, LazyArticle) else article
+    index.add(article, fields=article_fields(source))
+
+class ArchiveSnapshot:
+    """The archive at one generation: articles, id index and timeline views.
+    
+    Never modified once published, so readers can use it without locking;
+    writers build a new snapshot and swap it in.
+    """
+    
+    def __init__(self, articles: List[Dict[str, Any]], id_index: Dict[str, Dict[str, Any]],
+                 timeline: TimelineView, category_views: Dict[str, TimelineView], generation: int):
+        self.articles = articles
+        self.id_index = id_index
+        self.timeline = timeline
+        self.category_views = category_views
+        self.generation = generation
+    
+    @classmethod
+    def build(cls, articles: List[Dict[str, Any]], generation: int = 0) -> 'ArchiveSnapshot':
+        """Index a full article list from scratch"""
+        # First occurrence of an id wins, like a scan would
+        id_index: Dict[str, Dict[str, Any]] = {}
+        by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for article in articles:
+            id_index.setdefault(normalize_id(dict.get(article, 'id')), article)
+            by_category.setdefault(category_key(article), []).append(article)
+        category_views = {name: TimelineView(items) for name, items in by_category.items()}
+        return cls(articles, id_index, TimelineView(articles), category_views, generation)
+    
+    def with_added(self, batch: List[Dict[str, Any]]) -> 'ArchiveSnapshot':
+        """Copy of this snapshot with `batch` appended; only the touched views are copied"""
+        id_index = dict(self.id_index)
+        timeline = self.timeline.copy()
+        category_views = dict(self.category_views)
+        copied = set()
+        for article in batch:
+            id_index[normalize_id(article.get('id'))] = article
+            timeline.insert(article)
+            name = category_key(article)
+            if name not in copied:
+                category_views[name] = category_views[name].copy() if name in category_views else TimelineView()
+                copied.add(name)
+            category_views[name].insert(article)
+        return ArchiveSnapshot(self.articles + batch, id_index, timeline, category_views, self.generation + 1)
+    
+    def with_removed(self, kept: List[Dict[str, Any]], removed: List[Dict[str, Any]]) -> 'ArchiveSnapshot':
+        """Copy of this snapshot holding `kept`, with `removed` taken out of the index and views"""
+        id_index = dict(self.id_index)
+        timeline = self.timeline.copy()
+        category_views = dict(self.category_views)
+        copied = set()
+        for article in removed:
+            key = normalize_id(dict.get(article, 'id'))
+            if id_index.get(key) is article:
+                del id_index[key]
+            timeline.remove(article)
+            name = category_key(article)
+            if name not in category_views:
+                continue
+            if name not in copied:
+                category_views[name] = category_views[name].copy()
+                copied.add(name)
+            category_views[name].remove(article)
+        for name in copied:
+            if not category_views[name]:
+                del category_views[name]
+        return ArchiveSnapshot(kept, id_index, timeline, category_views, self.generation + 1)
+
+
 class ArchiveManager:
-    def __init__(self, storage_path: str = None):
+    """Article archive that is safe to share between threads.
+    
+    Reads go to the current ArchiveSnapshot and never wait on writers. Writes
+    are serialized by a lock: the change is persisted first, then a new
+    snapshot is published, so memory never shows articles the file lacks.
+    
+    With shared=True several processes (e.g. gunicorn workers) can use the
+    same storage: writes also take a file lock and first apply what the
+    other processes wrote, and refresh() picks up their writes between
+    requests by reading only what was appended to the journal.
+    """
+    
+    def __init__(self, storage_path: str = None, backend=None, shared: bool = False):
         self.storage_path = storage_path or os.path.join(os.path.dirname(__file__), '..', '..', 'data')
         self.articles_file = os.path.join(self.storage_path, 'articles.json')
         
         # Create data directory if it doesn't exist
         os.makedirs(self.storage_path, exist_ok=True)
         
-        # Load existing articles
-        self.articles = self.load_articles()
+        # Snapshot + append-only journal unless a different backend is plugged in
+        self.backend = backend or JournalBackend(self.storage_path)
+        
+        # One writer at a time; held across the disk write so file order matches memory order
+        self._write_lock = threading.Lock()
+        self.shared = shared
+        self._process_lock = ProcessLock(os.path.join(self.storage_path, 'articles.lock')) if shared else None
+        
+        # Load existing articles, with timestamp-ordered views so reads never sort
+        with self._process_lock or nullcontext():
+            self._snapshot = ArchiveSnapshot.build(self.load_articles())
+        
+        # Full-text index, built on the first query and updated incrementally after that.
+        # SearchIndex mutates in place, so it has its own lock.
+        self._search_index = None
+        self._index_lock = threading.Lock()
+    
+    @property
+    def snapshot(self) -> ArchiveSnapshot:
+        """Current published state; hold on to it to read several things consistently"""
+        return self._snapshot
+    
+    # Read-only views of the current snapshot
+    @property
+    def articles(self) -> List[Dict[str, Any]]:
+        return self._snapshot.articles
+    
+    @property
+    def id_index(self) -> Dict[str, Dict[str, Any]]:
+        return self._snapshot.id_index
+    
+    @property
+    def timeline(self) -> TimelineView:
+        return self._snapshot.timeline
+    
+    @property
+    def category_views(self) -> Dict[str, TimelineView]:
+        return self._snapshot.category_views
+    
+    @property
+    def generation(self) -> int:
+        """Bumped on every write so caches can tell when their copy is stale"""
+        return self._snapshot.generation
     
     def load_articles(self) -> List[Dict[str, Any]]:
         """Load articles from storage"""
         try:
-            if os.path.exists(self.articles_file):
-                with open(self.articles_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return []
+            return self.backend.load()
         except Exception as e:
             print(f"Error loading articles: {e}")
             return []
     
+    @contextmanager
+    def _writing(self):
+        """Hold the write lock(s); in shared mode, first catch up with other processes"""
+        with self._write_lock, self._process_lock or nullcontext():
+            if self.shared:
+                self._apply_changes()
+            yield
+    
+    def _apply_changes(self) -> bool:
+        """Publish what other processes wrote since we last looked (write lock held)"""
+        try:
+            change = self.backend.changes() if hasattr(self.backend, 'changes') else None
+        except Exception as e:
+            print(f"Error reading archive changes: {e}")
+            return False
+        if change is None:
+            return False
+        
+        kind, articles = change
+        snapshot = self._snapshot
+        if kind == 'append':
+            batch, batch_keys = [], set()
+            for article in articles:
+                key = normalize_id(article.get('id'))
+                if key in snapshot.id_index or key in batch_keys:
+                    continue
+                batch.append(article)
+                batch_keys.add(key)
+            if not batch:
+                return False
+            self._snapshot = snapshot.with_added(batch)
+            self._index_articles(batch)
+        else:
+            self._snapshot = ArchiveSnapshot.build(articles, snapshot.generation + 1)
+            # Deletions can't be applied incrementally; rebuild the index on the next search
+            with self._index_lock:
+                self._search_index = None
+        return True
+    
+    def refresh(self) -> bool:
+        """Pick up articles written by other processes (shared mode). Returns True if anything changed."""
+        if not self.shared:
+            return False
+        # A local writer catches up on its own; don't make readers queue behind it
+        if not self._write_lock.acquire(blocking=False):
+            return False
+        try:
+            return self._apply_changes()
+        finally:
+            self._write_lock.release()
+    
     def save_articles(self) -> bool:
-        """Save articles to storage"""
+        """Save the full article list to storage"""
+        with self._writing():
+            return self._save(self._snapshot.articles)
+    
+    def _save(self, articles: List[Dict[str, Any]]) -> bool:
         try:
-            with open(self.articles_file, 'w', encoding='utf-8') as f:
-                json.dump(self.articles, f, indent=2, ensure_ascii=False)
-            return True
+            return self.backend.save(articles)
         except Exception as e:
             print(f"Error saving articles: {e}")
             return False
     
+    def _index_articles(self, articles: List[Dict[str, Any]]) -> None:
+        with self._index_lock:
+            if self._search_index is not None:
+                for article in articles:
+                    index_article(self._search_index, article)
+    
     def add_article(self, article: Dict[str, Any]) -> bool:
         """Add a new article to the archive"""
         try:
-            # Check if article already exists
-            existing_ids = [a.get('id') for a in self.articles]
-            article_id = article.get('id')
+            with self._writing():
+                # Check if article already exists
+                article_id = article.get('id')
+                snapshot = self._snapshot
+                
+                if normalize_id(article_id) in snapshot.id_index:
+                    print(f"⚠️  Article {article_id} already exists, skipping")
+                    return False
+                
+                # Add timestamp if not present
+                if 'timestamp' not in article:
+                    article['timestamp'] = datetime.now().isoformat()
+                
+                print(f"➕ Adding article: {article.get('headline', 'No headline')[:50]}...")
+                updated = snapshot.with_added([article])
+                try:
+                    success = self.backend.append([article], updated.articles)
+                except Exception as e:
+                    print(f"Error appending article: {e}")
+                    success = False
+                if not success:
+                    print(f"❌ Failed to save article")
+                    return False
+                
+                self._snapshot = updated
+                self._index_articles([article])
             
-            if article_id in existing_ids:
-                print(f"⚠️  Article {article_id} already exists, skipping")
-                return False
+            print(f"✅ Article saved. Total articles: {len(updated.articles)}")
+            return True
+        except Exception as e:
+            print(f"Error adding article: {e}")
+            return False
+    
+    def validate_article(self, article: Any) -> Optional[str]:
+        """Return why an article can't be stored, or None if it is valid"""
+        if not isinstance(article, dict):
+            return 'not an article object'
+        if article.get('id') in (None, ''):
+            return 'missing id'
+        if not article.get('headline'):
+            return 'missing headline'
+        return None
+    
+    def add_articles(self, articles) -> List[Dict[str, Any]]:
+        """Add a batch of articles with a single durable commit.
+        
+        Returns one result per input item: {'id', 'added', 'reason'}.
+        """
+        results = []
+        batch = []
+        batch_keys = set()
+        
+        with self._writing():
+            snapshot = self._snapshot
             
-            # Add timestamp if not present
-            if 'timestamp' not in article:
-                article['timestamp'] = datetime.now().isoformat()
+            # Validate and dedupe the whole batch before touching the archive
+            for article in articles:
+                reason = self.validate_article(article)
+                article_id = article.get('id') if isinstance(article, dict) else None
+                key = normalize_id(article_id)
+                if reason is None and (key in snapshot.id_index or key in batch_keys):
+                    reason = 'duplicate'
+                
+                if reason is None:
+                    if 'timestamp' not in article:
+                        article['timestamp'] = datetime.now().isoformat()
+                    batch.append(article)
+                    batch_keys.add(key)
+                results.append({'id': article_id, 'added': reason is None, 'reason': reason})
             
-            print(f"➕ Adding article: {article.get('headline', 'No headline')[:50]}...")
-            self.articles.append(article)
+            if not batch:
+                return results
+            
+            updated = snapshot.with_added(batch)
+            try:
+                success = self.backend.append(batch, updated.articles)
+            except Exception as e:
+                print(f"Error committing batch: {e}")
+                success = False
             
-            success = self.save_articles()
             if success:
-                print(f"✅ Article saved. Total articles: {len(self.articles)}")
-            else:
-                print(f"❌ Failed to save article")
-                
-            return success
-        except Exception as e:
-            print(f"Error adding article: {e}")
-            return False
+                # Readers switch to the new state all at once
+                self._snapshot = updated
+                self._index_articles(batch)
+        
+        if success:
+            print(f"✅ Committed {len(batch)} articles. Total articles: {len(updated.articles)}")
+        else:
+            # Nothing was published, so memory still matches what is on disk
+            for result in results:
+                if result['added']:
+                    result['added'] = False
+                    result['reason'] = 'commit failed'
+            print(f"❌ Failed to commit batch of {len(batch)} articles")
+        
+        return results
     
     def search_articles(self, query: str = "", category: str = None, limit: int = 10) -> List[Dict[str, Any]]:
         """Search articles by query and/or category"""
         try:
-            filtered_articles = self.articles
-            
-            # Filter by category
-            if category:
-                filtered_articles = [a for a in filtered_articles if a.get('category', '').lower() == category.lower()]
-            
-            # Filter by query (search in headline and content)
+            # Ranked full-text search when there is a query
             if query:
-                query = query.lower()
-                filtered_articles = [a for a in filtered_articles if 
-                    query in a.get('headline', '').lower() or 
-                    query in a.get('opening_paragraph', '').lower()]
-            
-            # Sort by timestamp (newest first)
-            filtered_articles.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+                return self.search_ranked(query, category=category, limit=limit)
             
-            # Limit results
-            return filtered_articles[:limit]
+            # Views are already in timestamp order, so this is just a slice
+            if category:
+                view = self.category_views.get(category.lower())
+                return view.newest(limit) if view else []
+            return self.timeline.newest(limit)
+        except Exception as e:
+            print(f"Error searching articles: {e}")
+            return []
+    
+    def get_search_index(self) -> SearchIndex:
+        """Return the full-text index, building it on first use"""
+        with self._index_lock:
+            if self._search_index is None:
+                index = SearchIndex()
+                for article in self._snapshot.articles:
+                    index_article(index, article)
+                self._search_index = index
+            return self._search_index
+    
+    def search_ranked(self, query: str, category: str = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Full-text search over headline, body and quotes, ranked by BM25"""
+        try:
+            index = self.get_search_index()
+            with self._index_lock:
+                ranked = index.search(query)
+            results = []
+            for article, score in ranked:
+                if category and article.get('category', '').lower() != category.lower():
+                    continue
+                results.append(article)
+                if len(results) >= limit:
+                    break
+            return results
         except Exception as e:
             print(f"Error searching articles: {e}")
             return []
@@ -93,11 +373,7 @@ class ArchiveManager:
     def get_article_by_id(self, article_id) -> Optional[Dict[str, Any]]:
         """Get a specific article by ID"""
         try:
-            for article in self.articles:
-                # Convert both to string for comparison
-                if str(article.get('id')) == str(article_id):
-                    return article
-            return None
+            return self.id_index.get(normalize_id(article_id))
         except Exception as e:
             print(f"Error getting article by ID: {e}")
             return None
@@ -105,17 +381,9 @@ class ArchiveManager:
     def get_related_articles(self, article: Dict[str, Any], limit: int = 3) -> List[Dict[str, Any]]:
         """Get related articles based on category"""
         try:
-            category = article.get('category', '')
-            current_id = article.get('id')
-            
-            # Get articles from same category (excluding current)
-            related = [a for a in self.articles 
-                       if a.get('category', '').lower() == category.lower() 
-                       and a.get('id') != current_id]
-            
-            # Sort by timestamp and limit
-            related.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            return related[:limit]
+            # Newest articles from the same category (excluding current)
+            view = self.category_views.get(category_key(article))
+            return view.newest(limit, exclude_id=article.get('id')) if view else []
         except Exception as e:
             print(f"Error getting related articles: {e}")
             return []
@@ -123,8 +391,7 @@ class ArchiveManager:
     def get_latest_articles(self, limit: int = 6) -> List[Dict[str, Any]]:
         """Get the latest articles"""
         try:
-            sorted_articles = sorted(self.articles, key=lambda x: x.get('timestamp', ''), reverse=True)
-            return sorted_articles[:limit]
+            return self.timeline.newest(limit)
         except Exception as e:
             print(f"Error getting latest articles: {e}")
             return []
@@ -132,11 +399,7 @@ class ArchiveManager:
     def get_categories(self) -> List[str]:
         """Get all unique categories"""
         try:
-            categories = set()
-            for article in self.articles:
-                if article.get('category'):
-                    categories.add(article.get('category').lower())
-            return sorted(list(categories))
+            return sorted(name for name, view in self.category_views.items() if name and len(view))
         except Exception as e:
             print(f"Error getting categories: {e}")
             return []
@@ -151,13 +414,27 @@ class ArchiveManager:
             from datetime import datetime, timedelta
             cutoff_date = datetime.now() - timedelta(days=days)
             
-            original_count = len(self.articles)
-            self.articles = [a for a in self.articles 
-                           if datetime.fromisoformat(a.get('timestamp', '').replace('Z', '+00:00')) > cutoff_date]
-            
-            deleted_count = original_count - len(self.articles)
-            if deleted_count > 0:
-                self.save_articles()
+            with self._writing():
+                snapshot = self._snapshot
+                kept, removed = [], []
+                for a in snapshot.articles:
+                    if datetime.fromisoformat(a.get('timestamp', '').replace('Z', '+00:00')) > cutoff_date:
+                        kept.append(a)
+                    else:
+                        removed.append(a)
+                
+                deleted_count = len(removed)
+                if deleted_count == 0:
+                    return 0
+                
+                # Only the removed entries leave the index, views and search index
+                if not self._save(kept):
+                    return 0
+                self._snapshot = snapshot.with_removed(kept, removed)
+                with self._index_lock:
+                    if self._search_index is not None:
+                        for article in removed:
+                            self._search_index.remove(normalize_id(article.get('id')))
             
             return deleted_count
         except Exception as e:
@@ -167,21 +444,22 @@ class ArchiveManager:
     def get_stats(self) -> Dict[str, Any]:
         """Get archive statistics"""
         try:
+            snapshot = self._snapshot
             stats = {
-                'total_articles': len(self.articles),
-                'categories': self.get_categories(),
+                'total_articles': len(snapshot.articles),
+                'categories': sorted(name for name, view in snapshot.category_views.items() if name and len(view)),
                 'latest_article': None,
                 'articles_by_category': {}
             }
             
             # Count articles by category
-            for article in self.articles:
+            for article in snapshot.articles:
                 category = article.get('category', 'unknown')
                 stats['articles_by_category'][category] = stats['articles_by_category'].get(category, 0) + 1
             
             # Get latest article
-            if self.articles:
-                latest = max(self.articles, key=lambda x: x.get('timestamp', ''))
+            if snapshot.articles:
+                latest = snapshot.timeline.newest(1)[0]
                 stats['latest_article'] = {
                     'headline': latest.get('headline', ''),
                     'timestamp': latest.get('timestamp', ''),
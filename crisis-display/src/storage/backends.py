@@ -0,0 +1,224 @@
+import json
+import os
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, so shared mode can't be used there
+    fcntl = None
+
+
+def atomic_write_json(path: str, data: Any, indent: int = 2) -> None:
+    """Write JSON to a temp file, fsync it and rename it over path"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime, size) of a file, or None if it doesn't exist; changes when the file is rewritten"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class ProcessLock:
+    """Exclusive flock on a lock file, so writes from several processes take turns"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self) -> 'ProcessLock':
+        if fcntl is None:
+            raise RuntimeError("Shared archive mode needs fcntl (not available on this platform)")
+        self._file = open(self.path, 'a')
+        fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+class JSONFileBackend:
+    """Stores the whole archive as a single JSON array, rewritten on every save"""
+
+    def __init__(self, storage_path: str):
+        self.articles_file = os.path.join(storage_path, 'articles.json')
+        # Snapshot file as of our last load/save; anything else means another process wrote it
+        self.signature = None
+
+    def load(self, repair: bool = True) -> List[Dict[str, Any]]:
+        """Load all articles from the snapshot file"""
+        # Taken before reading: if the file is replaced mid-read, the next check sees it
+        self.signature = file_signature(self.articles_file)
+        return self.read_snapshot()
+
+    def read_snapshot(self) -> List[Dict[str, Any]]:
+        if os.path.exists(self.articles_file):
+            with open(self.articles_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return []
+
+    def save(self, articles: List[Dict[str, Any]]) -> bool:
+        """Rewrite the snapshot file with the full article list"""
+        self.write_snapshot(articles)
+        self.signature = file_signature(self.articles_file)
+        return True
+
+    def write_snapshot(self, articles: List[Dict[str, Any]]) -> None:
+        atomic_write_json(self.articles_file, articles)
+
+    def changes(self) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """What other processes wrote since our last load/save.
+
+        Returns None when nothing changed, ('append', new_articles) when
+        articles were only added, or ('reload', all_articles).
+        """
+        if file_signature(self.articles_file) == self.signature:
+            return None
+        return 'reload', self.load(repair=False)
+
+    def append(self, new_articles: List[Dict[str, Any]], articles: List[Dict[str, Any]]) -> bool:
+        """Persist newly added articles (articles already contains them)"""
+        return self.save(articles)
+
+
+def record_articles(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Articles added by one journal record; older journals wrote one 'article' per record"""
+    if record.get('op') != 'add':
+        return []
+    if 'articles' in record:
+        return record['articles'] or []
+    return [record['article']] if record.get('article') else []
+
+
+class JournalBackend(JSONFileBackend):
+    """Snapshot in articles.json plus an append-only JSON-lines journal.
+
+    Each insert (or batch of inserts) appends one line to the journal, so its
+    cost does not depend on archive size. A torn line is discarded on replay,
+    which makes every batch all-or-nothing. Once the journal holds
+    `compact_every` records it is folded into a fresh snapshot and truncated.
+    """
+
+    def __init__(self, storage_path: str, compact_every: int = 500):
+        super().__init__(storage_path)
+        self.journal_file = os.path.join(storage_path, 'articles.journal.jsonl')
+        self.compact_every = compact_every
+        self.journal_entries = 0
+        # Bytes of the journal already applied; a longer journal means new records
+        self.journal_offset = 0
+        # Compaction swaps in a fresh journal file, so a new inode means start over
+        self.journal_inode = None
+
+    def load(self, repair: bool = True) -> List[Dict[str, Any]]:
+        """Load the snapshot and replay the journal on top of it.
+
+        With repair, a torn final record is cut off the file. Only do that
+        while holding the write lock: in shared mode the "torn" line may be
+        another process's append in progress.
+        """
+        articles = super().load()
+        self.journal_entries = 0
+        self.journal_offset = 0
+        journal_signature = file_signature(self.journal_file)
+        self.journal_inode = journal_signature[0] if journal_signature else None
+        if journal_signature is None:
+            return articles
+
+        known_ids = {a.get('id') for a in articles}
+        valid_bytes = 0
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError('unterminated record')
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    # A torn final line from a crash mid-append; nothing after it was committed
+                    print(f"⚠️  Dropping incomplete journal record in {self.journal_file}")
+                    break
+                valid_bytes += len(line)
+                self.journal_entries += 1
+                for article in record_articles(record):
+                    # Entries can already be in the snapshot if we crashed mid-compaction
+                    if article.get('id') in known_ids:
+                        continue
+                    known_ids.add(article.get('id'))
+                    articles.append(article)
+
+        # Cut off a torn tail so the next append starts on a clean line
+        if repair and valid_bytes < os.path.getsize(self.journal_file):
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(valid_bytes)
+        self.journal_offset = valid_bytes
+        return articles
+
+    def changes(self) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """Like JSONFileBackend.changes, but appends are read from the journal tail only"""
+        # Compaction always replaces the snapshot file first, so this catches it
+        if file_signature(self.articles_file) != self.signature:
+            return 'reload', self.load(repair=False)
+        journal_signature = file_signature(self.journal_file)
+        if journal_signature is None:
+            return None if self.journal_inode is None else ('reload', self.load(repair=False))
+        inode, _, size = journal_signature
+        if inode != self.journal_inode or size < self.journal_offset:
+            return 'reload', self.load(repair=False)
+        if size == self.journal_offset:
+            return None
+
+        new_articles = []
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self.journal_offset)
+            for line in f:
+                # A line without its newline is still being written; pick it up next time
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    break
+                self.journal_offset += len(line)
+                self.journal_entries += 1
+                new_articles.extend(record_articles(record))
+        return 'append', new_articles
+
+    def save(self, articles: List[Dict[str, Any]]) -> bool:
+        """Write a fresh snapshot and reset the journal (compaction)"""
+        super().save(articles)
+        # Replaced rather than truncated, so other processes can tell it's a new journal
+        tmp_path = f"{self.journal_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_file)
+        self.journal_inode = os.stat(self.journal_file).st_ino
+        self.journal_entries = 0
+        self.journal_offset = 0
+        return True
+
+    def append(self, new_articles: List[Dict[str, Any]], articles: List[Dict[str, Any]]) -> bool:
+        """Append one journal record, compacting when the journal gets long"""
+        line = json.dumps({'op': 'add', 'articles': new_articles}, ensure_ascii=False)
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+            # Writers are serialized and catch up before writing, so this is our own record's end
+            st = os.fstat(f.fileno())
+            self.journal_offset = st.st_size
+            self.journal_inode = st.st_ino
+        self.journal_entries += 1
+
+        if self.journal_entries >= self.compact_every:
+            return self.save(articles)
+        return True
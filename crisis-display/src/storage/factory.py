@@ -0,0 +1,22 @@
+import os
+
+from .archive import ArchiveManager
+from .mmap_store import MmapBackend
+from .sqlite_archive import SQLiteArchiveManager
+
+
+def open_archive(storage_path: str = None, shared: bool = None):
+    """The archive the environment selects, so the app and the CLIs share one store.
+
+    ARCHIVE_BACKEND=sqlite uses SQLiteArchiveManager and ARCHIVE_BACKEND=mmap
+    the memory-mapped pack; anything else is articles.json plus its journal.
+    ARCHIVE_SHARED=1 lets several processes share a file archive; callers
+    that always run next to another process pass shared=True instead.
+    """
+    backend = os.environ.get('ARCHIVE_BACKEND')
+    if backend == 'sqlite':
+        return SQLiteArchiveManager(storage_path)
+    if storage_path is None:
+        storage_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+    return ArchiveManager(storage_path, backend=MmapBackend(storage_path) if backend == 'mmap' else None,
+                          shared=os.environ.get('ARCHIVE_SHARED') == '1' if shared is None else shared)
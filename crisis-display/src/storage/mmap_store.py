@@ -0,0 +1,353 @@
+import json
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .backends import JournalBackend, file_signature
+
+# articles.pack layout (little-endian):
+#   header   magic, version, article count, offset/length of the column block
+#   index    one fixed-width entry per article: (listing offset, listing length, body offset, body length)
+#   heap     each article's listing record and body record as compact JSON
+#   columns  {"id": [...], "category": [...], "timestamp": [...]}, one JSON object
+MAGIC = b'CRSA'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIQQ4x')
+INDEX_ENTRY = struct.Struct('<QIQI')
+
+# Always in memory: what the id index and timeline views are built from
+COLUMN_FIELDS = ('id', 'category', 'timestamp')
+# Decoded together the first time a listing page needs one of them
+LISTING_FIELDS = frozenset(('headline', 'byline', 'opening_paragraph', 'image_url'))
+
+_LISTING = 1
+_BODY = 2
+
+
+def split_article(article: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """(columns, listing record, body record) of a plain article"""
+    columns, listing, body = {}, {}, {}
+    for key, value in article.items():
+        # A null column means "no such field", so an explicit None is kept in the body
+        if key in COLUMN_FIELDS and value is not None:
+            columns[key] = value
+        elif key in LISTING_FIELDS:
+            listing[key] = value
+        else:
+            body[key] = value
+    return columns, listing, body
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class PackedArticles:
+    """Read side of an articles.pack file, memory-mapped.
+
+    Only the column block is decoded up front; listing and body records are
+    sliced out of the map and decoded per article when asked for. The last
+    `body_cache_size` decoded bodies are kept in an LRU, so an article page
+    that reads several body fields decodes its body once without every body
+    ever read staying in memory.
+    """
+
+    def __init__(self, path: str, body_cache_size: int = 256):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.count, columns_offset, columns_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} article pack")
+        self.columns = json.loads(self._map[columns_offset:columns_offset + columns_length])
+        self.body_cache_size = body_cache_size
+        self._bodies = OrderedDict()
+        self._bodies_lock = threading.Lock()
+
+    def _entry(self, position: int) -> Tuple[int, int, int, int]:
+        return INDEX_ENTRY.unpack_from(self._map, HEADER.size + position * INDEX_ENTRY.size)
+
+    def listing(self, position: int) -> Dict[str, Any]:
+        offset, length, _, _ = self._entry(position)
+        return json.loads(self._map[offset:offset + length])
+
+    def body(self, position: int) -> Dict[str, Any]:
+        _, _, offset, length = self._entry(position)
+        return json.loads(self._map[offset:offset + length])
+
+    def cached_body(self, position: int) -> Dict[str, Any]:
+        """body(position) through the LRU; the record is shared, so don't modify it"""
+        with self._bodies_lock:
+            body = self._bodies.get(position)
+            if body is not None:
+                self._bodies.move_to_end(position)
+                return body
+        body = self.body(position)
+        with self._bodies_lock:
+            self._bodies[position] = body
+            while len(self._bodies) > self.body_cache_size:
+                self._bodies.popitem(last=False)
+        return body
+
+    def raw(self, position: int) -> Tuple[bytes, bytes]:
+        """Encoded (listing, body) records, for copying into a new pack without decoding"""
+        listing_offset, listing_length, body_offset, body_length = self._entry(position)
+        return (self._map[listing_offset:listing_offset + listing_length],
+                self._map[body_offset:body_offset + body_length])
+
+    def articles(self) -> List['LazyArticle']:
+        columns = [self.columns[field] for field in COLUMN_FIELDS]
+        articles = []
+        for position, (article_id, category, timestamp) in enumerate(zip(*columns)):
+            resident = {'id': article_id, 'category': category, 'timestamp': timestamp}
+            if article_id is None or category is None or timestamp is None:
+                # A null column means the article didn't have that field
+                resident = {field: value for field, value in resident.items() if value is not None}
+            articles.append(LazyArticle(self, position, resident))
+        return articles
+
+
+class LazyArticle(dict):
+    """An article from a pack that decodes its fields on first access.
+
+    It holds id, category and timestamp, plus the listing record (headline,
+    byline, opening paragraph, image) once a listing field has been read.
+    Body fields are looked up in the pack's body LRU each time and never
+    stored on the article, so a large archive doesn't grow in memory as its
+    pages are visited. Anything that looks at the whole article (iteration,
+    items(), ==, JSON) sees a freshly decoded plain dict, so it behaves like
+    the dict it stands for.
+
+    Assigning a field stores it on the article, where it wins over the pack.
+    Removing one decodes the whole article into it first. Change nested
+    values (lists, quotes) by assigning a new value, not in place.
+    """
+
+    __slots__ = ('_pack', '_position', '_decoded', '_changed')
+
+    def __init__(self, pack: PackedArticles, position: int, resident: Dict[str, Any]):
+        super().__init__(resident)
+        self._pack = pack
+        self._position = position
+        # Parts of the record merged into the dict: the listing when read, the body only before a removal
+        self._decoded = 0
+        self._changed = False
+
+    def _merge(self, part: int) -> None:
+        if self._decoded & part:
+            return
+        record = self._pack.listing(self._position) if part == _LISTING else self._pack.body(self._position)
+        for key, value in record.items():
+            # Values set since loading win over what is on disk
+            dict.setdefault(self, key, value)
+        self._decoded |= part
+
+    def _lookup(self, key) -> Tuple[bool, Any]:
+        """(found, value) of a field, wherever it currently lives"""
+        if dict.__contains__(self, key):
+            return True, dict.__getitem__(self, key)
+        if key in LISTING_FIELDS:
+            self._merge(_LISTING)
+            if dict.__contains__(self, key):
+                return True, dict.__getitem__(self, key)
+        if not self._decoded & _BODY:
+            body = self._pack.cached_body(self._position)
+            if key in body:
+                return True, body[key]
+        return False, None
+
+    def _materialize(self) -> None:
+        """Merge everything into the dict, before a change the pack can't express (a removal)"""
+        self._merge(_LISTING)
+        self._merge(_BODY)
+        self._changed = True
+
+    def decoded(self) -> Dict[str, Any]:
+        """The full article as a plain dict, without keeping the decoded fields on this object"""
+        article = {}
+        if not self._decoded & _LISTING:
+            article.update(self._pack.listing(self._position))
+        if not self._decoded & _BODY:
+            article.update(self._pack.body(self._position))
+        article.update(dict.items(self))
+        return article
+
+    def raw_records(self):
+        """Encoded (listing, body) records if nothing has changed since loading, else None"""
+        if self._changed:
+            return None
+        return self._pack.raw(self._position)
+
+    def __missing__(self, key):
+        found, value = self._lookup(key)
+        if found:
+            return value
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        found, value = self._lookup(key)
+        return value if found else default
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key)[0]
+
+    def __setitem__(self, key, value) -> None:
+        dict.__setitem__(self, key, value)
+        self._changed = True
+
+    def update(self, *args, **kwargs) -> None:
+        dict.update(self, *args, **kwargs)
+        self._changed = True
+
+    def setdefault(self, key, default=None):
+        found, value = self._lookup(key)
+        if found:
+            return value
+        self[key] = default
+        return default
+
+    def __delitem__(self, key) -> None:
+        self._materialize()
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self._materialize()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        self._materialize()
+        dict.clear(self)
+
+    def __bool__(self) -> bool:
+        # Every packed article has at least its id; no need to decode to find out
+        return True
+
+    def __len__(self) -> int:
+        return len(self.decoded())
+
+    def __iter__(self):
+        return iter(self.decoded())
+
+    def keys(self):
+        return self.decoded().keys()
+
+    def values(self):
+        return self.decoded().values()
+
+    def items(self):
+        return self.decoded().items()
+
+    def copy(self) -> Dict[str, Any]:
+        return self.decoded()
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        # Positions in one pack are distinct articles
+        if isinstance(other, LazyArticle) and other._pack is self._pack:
+            return other._position == self._position
+        if not isinstance(other, dict):
+            return NotImplemented
+        if isinstance(other, LazyArticle):
+            other = other.decoded()
+        return self.decoded() == other
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.decoded())
+
+    def __reduce__(self):
+        # Copies and pickles are plain dicts
+        return dict, (self.copy(),)
+
+
+def write_pack(path: str, articles: Iterable[Dict[str, Any]]) -> int:
+    """Write articles to a new pack at path (atomically); returns the article count.
+
+    Unchanged articles from another pack are copied as raw bytes, so
+    compaction doesn't decode the whole archive.
+    """
+    articles = list(articles)
+    tmp_path = f"{path}.tmp"
+    columns = {field: [] for field in COLUMN_FIELDS}
+    index = bytearray()
+
+    with open(tmp_path, 'wb') as f:
+        # Header and index are filled in once the heap has been written
+        f.seek(HEADER.size + len(articles) * INDEX_ENTRY.size)
+        for article in articles:
+            raw = article.raw_records() if isinstance(article, LazyArticle) else None
+            if raw is not None:
+                listing, body = raw
+                resident = dict(dict.items(article))
+            else:
+                plain = article.decoded() if isinstance(article, LazyArticle) else article
+                resident, listing_record, body_record = split_article(plain)
+                listing, body = _encode(listing_record), _encode(body_record)
+            for field in COLUMN_FIELDS:
+                columns[field].append(resident.get(field))
+
+            listing_offset = f.tell()
+            f.write(listing)
+            body_offset = f.tell()
+            f.write(body)
+            index += INDEX_ENTRY.pack(listing_offset, len(listing), body_offset, len(body))
+
+        columns_offset = f.tell()
+        encoded_columns = _encode(columns)
+        f.write(encoded_columns)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(articles), columns_offset, len(encoded_columns)))
+        f.write(index)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(articles)
+
+
+class MmapBackend(JournalBackend):
+    """JournalBackend whose snapshot is a memory-mapped articles.pack.
+
+    Loading decodes only the id/category/timestamp columns; each article is
+    a LazyArticle that reads the rest from the map when it is used. New
+    articles still go to an append-only journal until compaction folds them
+    into a fresh pack. On first use the JSON archive (articles.json plus its
+    journal) is imported; those files are left as they were.
+
+    Compaction replaces the pack while it is mapped, which needs POSIX
+    rename semantics (not Windows).
+    """
+
+    def __init__(self, storage_path: str, compact_every: int = 500):
+        super().__init__(storage_path, compact_every=compact_every)
+        self.storage_path = storage_path
+        self.legacy_files = (self.articles_file, self.journal_file)
+        self.articles_file = os.path.join(storage_path, 'articles.pack')
+        self.journal_file = os.path.join(storage_path, 'articles.pack.journal.jsonl')
+
+    def read_snapshot(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.articles_file):
+            if not any(os.path.exists(path) for path in self.legacy_files):
+                return []
+            # Read-only replay: the JSON archive's torn tail (if any) is its own to repair
+            count = write_pack(self.articles_file, JournalBackend(self.storage_path).load(repair=False))
+            self.signature = file_signature(self.articles_file)
+            print(f"📦 Imported {count} articles from the JSON archive into {self.articles_file}")
+        return PackedArticles(self.articles_file).articles()
+
+    def write_snapshot(self, articles: List[Dict[str, Any]]) -> None:
+        write_pack(self.articles_file, articles)
@@ -0,0 +1,135 @@
+import math
+import re
+from typing import List, Dict, Any, Tuple
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'to', 'was', 'were', 'will', 'with'
+}
+
+# Headline matches count for more than body matches
+FIELD_WEIGHTS = {
+    'headline': 3,
+    'opening_paragraph': 2,
+    'body_paragraphs': 1,
+    'expert_quotes': 1
+}
+
+
+def stem(word: str) -> str:
+    """Light suffix-stripping stemmer (plurals, -ing, -ed, -ly, ...)"""
+    if len(word) <= 3:
+        return word
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith('sses'):
+        return word[:-2]
+    for suffix in ('ingly', 'edly', 'ment', 'ness', 'ing', 'ed', 'ly'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            break
+    if word.endswith('s') and not word.endswith('ss') and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split into words, drop stopwords and stem"""
+    return [stem(t) for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def article_fields(article: Dict[str, Any]) -> Dict[str, str]:
+    """Pull the searchable text out of an article"""
+    quotes = article.get('expert_quotes') or []
+    return {
+        'headline': article.get('headline') or '',
+        'opening_paragraph': article.get('opening_paragraph') or '',
+        'body_paragraphs': ' '.join(p for p in (article.get('body_paragraphs') or []) if isinstance(p, str)),
+        'expert_quotes': ' '.join(
+            f"{q.get('quote', '')} {q.get('expert', '')}" for q in quotes if isinstance(q, dict)
+        )
+    }
+
+
+class SearchIndex:
+    """In-memory inverted index over articles, ranked with BM25"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_terms: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, article: Dict[str, Any], fields: Dict[str, str] = None) -> None:
+        """Index an article, replacing any earlier version with the same id.
+
+        `fields` is the article's searchable text if the caller already has it
+        (default: article_fields(article)).
+        """
+        doc_key = str(article.get('id'))
+        if doc_key in self.documents:
+            self.remove(doc_key)
+
+        terms: Dict[str, int] = {}
+        for field, text in (fields or article_fields(article)).items():
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenize(text):
+                terms[term] = terms.get(term, 0) + weight
+
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[doc_key] = tf
+
+        length = sum(terms.values())
+        self.doc_terms[doc_key] = terms
+        self.doc_lengths[doc_key] = length
+        self.documents[doc_key] = article
+        self.total_length += length
+
+    def remove(self, article_id) -> None:
+        """Drop an article from the index"""
+        doc_key = str(article_id)
+        terms = self.doc_terms.pop(doc_key, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            docs = self.postings.get(term)
+            if docs is not None:
+                docs.pop(doc_key, None)
+                if not docs:
+                    del self.postings[term]
+
+        self.total_length -= self.doc_lengths.pop(doc_key)
+        del self.documents[doc_key]
+
+    def search(self, query: str, limit: int = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Return (article, score) pairs for the query, best match first"""
+        query_terms = set(tokenize(query))
+        if not query_terms or not self.documents:
+            return []
+
+        doc_count = len(self.documents)
+        avg_length = self.total_length / doc_count or 1
+        scores: Dict[str, float] = {}
+
+        for term in query_terms:
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_key, tf in docs.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_key] / avg_length)
+                scores[doc_key] = scores.get(doc_key, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.documents[doc_key], score) for doc_key, score in ranked]
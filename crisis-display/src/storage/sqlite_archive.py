@@ -0,0 +1,382 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from .archive import normalize_id
+from .search_index import SearchIndex
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    category_label TEXT,
+    timestamp TEXT NOT NULL DEFAULT '',
+    headline TEXT NOT NULL DEFAULT '',
+    opening_paragraph TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_id ON articles(id);
+CREATE INDEX IF NOT EXISTS idx_articles_category_timestamp ON articles(category, timestamp);
+CREATE INDEX IF NOT EXISTS idx_articles_timestamp ON articles(timestamp);
+"""
+
+# Newest first; ties keep insertion order like the stable sort in ArchiveManager
+NEWEST_FIRST = "ORDER BY timestamp DESC, seq ASC"
+
+
+class SQLiteArchiveManager:
+    """ArchiveManager backed by SQLite, with indexed category/timestamp reads"""
+
+    def __init__(self, storage_path: str = None, db_file: str = 'articles.db'):
+        self.storage_path = storage_path or os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+        self.db_path = os.path.join(self.storage_path, db_file)
+
+        # Create data directory if it doesn't exist
+        os.makedirs(self.storage_path, exist_ok=True)
+
+        # One connection per thread; sqlite3 connections can't be shared safely
+        self._local = threading.local()
+
+        # Bumped on every write so caches can tell when their copy is stale
+        self.generation = 0
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+
+        # Full-text index, built on the first query and updated incrementally after that.
+        # The lock also covers writes, so the index, generation and seen state move together.
+        self._search_index = None
+        self._index_lock = threading.Lock()
+
+        # Newest row and row count that the index and generation reflect
+        self._seen_seq, self._seen_count = self._table_state(conn)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _table_state(conn: sqlite3.Connection) -> tuple:
+        return conn.execute("SELECT COALESCE(MAX(seq), 0), COUNT(*) FROM articles").fetchone()
+
+    def refresh(self) -> bool:
+        """Catch up with commits made by other processes. Returns True if anything changed.
+
+        PRAGMA data_version only changes when another connection commits, so
+        the common case is one cheap pragma. New rows are added to the search
+        index; deletions drop it so it is rebuilt on the next search. Either
+        way the generation is bumped so page caches move on.
+        """
+        try:
+            conn = self._connection()
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == getattr(self._local, 'data_version', None):
+                return False
+            self._local.data_version = version
+
+            with self._index_lock:
+                if not self._catch_up(conn):
+                    return False
+                self.generation += 1
+            return True
+        except Exception as e:
+            print(f"Error refreshing archive: {e}")
+            return False
+
+    def _catch_up(self, conn: sqlite3.Connection) -> bool:
+        """Bring the search index and seen state up to the table (index lock held).
+
+        Covers our own commits as well as other connections', so a write is
+        never applied a second time by the next refresh().
+        """
+        max_seq, count = self._table_state(conn)
+        if (max_seq, count) == (self._seen_seq, self._seen_count):
+            return False
+        rows = conn.execute("SELECT data FROM articles WHERE seq > ?", (self._seen_seq,)).fetchall()
+        if self._search_index is not None:
+            if count != self._seen_count + len(rows):
+                # Someone else deleted rows; rebuild on the next search
+                self._search_index = None
+            else:
+                for row in rows:
+                    self._search_index.add(json.loads(row[0]))
+        self._seen_seq, self._seen_count = max_seq, count
+        return True
+
+    def _query(self, sql: str, params=()) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    @staticmethod
+    def _row_values(article: Dict[str, Any]) -> tuple:
+        return (
+            normalize_id(article.get('id')),
+            (article.get('category') or '').lower(),
+            article.get('category', 'unknown'),
+            article.get('timestamp', ''),
+            article.get('headline', ''),
+            article.get('opening_paragraph', ''),
+            json.dumps(article, ensure_ascii=False),
+        )
+
+    def _insert(self, conn: sqlite3.Connection, article: Dict[str, Any]) -> bool:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO articles "
+            "(id, category, category_label, timestamp, headline, opening_paragraph, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._row_values(article)
+        )
+        return cursor.rowcount == 1
+
+    def load_articles(self) -> List[Dict[str, Any]]:
+        """Load all articles in insertion order"""
+        try:
+            return self._query("SELECT data FROM articles ORDER BY seq")
+        except Exception as e:
+            print(f"Error loading articles: {e}")
+            return []
+
+    def save_articles(self) -> bool:
+        """Writes are committed as they happen, so there is nothing to flush"""
+        return True
+
+    def add_article(self, article: Dict[str, Any]) -> bool:
+        """Add a new article to the archive"""
+        try:
+            # Add timestamp if not present
+            if 'timestamp' not in article:
+                article['timestamp'] = datetime.now().isoformat()
+
+            conn = self._connection()
+            with self._index_lock:
+                with conn:
+                    added = self._insert(conn, article)
+                if added and self._catch_up(conn):
+                    self.generation += 1
+
+            if not added:
+                print(f"⚠️  Article {article.get('id')} already exists, skipping")
+                return False
+
+            print(f"✅ Article saved: {article.get('headline', 'No headline')[:50]}...")
+            return True
+        except Exception as e:
+            print(f"Error adding article: {e}")
+            return False
+
+    def validate_article(self, article: Any) -> Optional[str]:
+        """Return why an article can't be stored, or None if it is valid"""
+        if not isinstance(article, dict):
+            return 'not an article object'
+        if article.get('id') in (None, ''):
+            return 'missing id'
+        if not article.get('headline'):
+            return 'missing headline'
+        return None
+
+    def add_articles(self, articles) -> List[Dict[str, Any]]:
+        """Add a batch of articles in a single transaction.
+
+        Returns one result per input item: {'id', 'added', 'reason'}.
+        """
+        articles = list(articles)
+        results = []
+        try:
+            conn = self._connection()
+            with self._index_lock:
+                with conn:
+                    for article in articles:
+                        reason = self.validate_article(article)
+                        article_id = article.get('id') if isinstance(article, dict) else None
+                        if reason is None:
+                            if 'timestamp' not in article:
+                                article['timestamp'] = datetime.now().isoformat()
+                            if not self._insert(conn, article):
+                                reason = 'duplicate'
+                        results.append({'id': article_id, 'added': reason is None, 'reason': reason})
+                if any(r['added'] for r in results) and self._catch_up(conn):
+                    self.generation += 1
+        except Exception as e:
+            print(f"Error committing batch: {e}")
+            for result in results:
+                if result['added']:
+                    result['added'] = False
+                    result['reason'] = 'commit failed'
+        return results
+
+    def search_articles(self, query: str = "", category: str = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search articles by query and/or category"""
+        try:
+            # Ranked full-text search when there is a query
+            if query:
+                return self.search_ranked(query, category=category, limit=limit)
+
+            clauses = []
+            params = []
+
+            if category:
+                clauses.append("category = ?")
+                params.append(category.lower())
+
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            params.append(limit)
+            return self._query(f"SELECT data FROM articles {where} {NEWEST_FIRST} LIMIT ?", params)
+        except Exception as e:
+            print(f"Error searching articles: {e}")
+            return []
+
+    def get_search_index(self) -> SearchIndex:
+        """Return the full-text index, building it on first use"""
+        with self._index_lock:
+            if self._search_index is None:
+                index = SearchIndex()
+                for article in self.load_articles():
+                    index.add(article)
+                self._search_index = index
+            return self._search_index
+
+    def search_ranked(self, query: str, category: str = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Full-text search over headline, body and quotes, ranked by BM25"""
+        try:
+            index = self.get_search_index()
+            with self._index_lock:
+                hits = index.search(query)
+            results = []
+            for article, score in hits:
+                if category and (article.get('category') or '').lower() != category.lower():
+                    continue
+                results.append(article)
+                if len(results) >= limit:
+                    break
+            return results
+        except Exception as e:
+            print(f"Error searching articles: {e}")
+            return []
+
+    def get_article_by_id(self, article_id) -> Optional[Dict[str, Any]]:
+        """Get a specific article by ID"""
+        try:
+            rows = self._query("SELECT data FROM articles WHERE id = ?", (normalize_id(article_id),))
+            return rows[0] if rows else None
+        except Exception as e:
+            print(f"Error getting article by ID: {e}")
+            return None
+
+    def get_related_articles(self, article: Dict[str, Any], limit: int = 3) -> List[Dict[str, Any]]:
+        """Get related articles based on category"""
+        try:
+            return self._query(
+                f"SELECT data FROM articles WHERE category = ? AND id != ? {NEWEST_FIRST} LIMIT ?",
+                ((article.get('category') or '').lower(), normalize_id(article.get('id')), limit)
+            )
+        except Exception as e:
+            print(f"Error getting related articles: {e}")
+            return []
+
+    def get_latest_articles(self, limit: int = 6) -> List[Dict[str, Any]]:
+        """Get the latest articles"""
+        try:
+            return self._query(f"SELECT data FROM articles {NEWEST_FIRST} LIMIT ?", (limit,))
+        except Exception as e:
+            print(f"Error getting latest articles: {e}")
+            return []
+
+    def get_categories(self) -> List[str]:
+        """Get all unique categories"""
+        try:
+            rows = self._connection().execute(
+                "SELECT DISTINCT category FROM articles WHERE category != '' ORDER BY category"
+            ).fetchall()
+            return [row[0] for row in rows]
+        except Exception as e:
+            print(f"Error getting categories: {e}")
+            return []
+
+    def get_article_count(self) -> int:
+        """Get total number of articles"""
+        try:
+            return self._connection().execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        except Exception as e:
+            print(f"Error counting articles: {e}")
+            return 0
+
+    def delete_old_articles(self, days: int = 30) -> int:
+        """Delete articles older than specified days"""
+        try:
+            from datetime import timedelta
+            cutoff_date = datetime.now() - timedelta(days=days)
+
+            conn = self._connection()
+            rows = conn.execute("SELECT id, timestamp FROM articles").fetchall()
+            stale = [(article_id,) for article_id, timestamp in rows
+                     if datetime.fromisoformat(timestamp.replace('Z', '+00:00')) <= cutoff_date]
+
+            if not stale:
+                return 0
+            with self._index_lock:
+                with conn:
+                    deleted = conn.executemany("DELETE FROM articles WHERE id = ?", stale).rowcount
+                # Our own deletions are applied to the index in place
+                self._seen_count -= deleted
+                if self._search_index is not None:
+                    for (article_id,) in stale:
+                        self._search_index.remove(article_id)
+                changed = self._catch_up(conn)
+                if deleted or changed:
+                    self.generation += 1
+
+            return deleted
+        except Exception as e:
+            print(f"Error deleting old articles: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get archive statistics"""
+        try:
+            conn = self._connection()
+            stats = {
+                'total_articles': self.get_article_count(),
+                'categories': self.get_categories(),
+                'latest_article': None,
+                'articles_by_category': {}
+            }
+
+            # Count articles by category
+            for label, count in conn.execute(
+                "SELECT category_label, COUNT(*) FROM articles GROUP BY category_label"
+            ):
+                stats['articles_by_category'][label] = count
+
+            # Get latest article
+            latest = self.get_latest_articles(limit=1)
+            if latest:
+                stats['latest_article'] = {
+                    'headline': latest[0].get('headline', ''),
+                    'timestamp': latest[0].get('timestamp', ''),
+                    'category': latest[0].get('category', '')
+                }
+
+            return stats
+        except Exception as e:
+            print(f"Error getting stats: {e}")
+            return {}
+
+
+def migrate_json_archive(articles: List[Dict[str, Any]], manager: SQLiteArchiveManager) -> Dict[str, int]:
+    """Import an existing article list into a SQLite archive in one transaction"""
+    results = manager.add_articles(articles)
+    added = sum(1 for r in results if r['added'])
+    return {
+        'read': len(results),
+        'imported': added,
+        'skipped': len(results) - added
+    }
@@ -0,0 +1,70 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any, Iterable
+
+
+# dict.get rather than article.get: a lazily decoded article always has these
+# fields resident, and this skips its lookup hook on the startup path
+def timestamp_key(article: Dict[str, Any]) -> str:
+    return dict.get(article, 'timestamp') or ''
+
+
+def category_key(article: Dict[str, Any]) -> str:
+    return (dict.get(article, 'category') or '').lower()
+
+
+class TimelineView:
+    """Articles kept in ascending timestamp order with bisect insertion.
+
+    Equal timestamps are stored newest-insert-first, so reading the view
+    backwards matches a stable newest-first sort of the insertion order.
+    """
+
+    def __init__(self, articles: Iterable[Dict[str, Any]] = ()):
+        articles = list(articles)
+        articles.reverse()
+        keys = [timestamp_key(a) for a in articles]
+        order = sorted(range(len(articles)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.articles = [articles[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def copy(self) -> 'TimelineView':
+        """Shallow copy that can be modified without touching this view"""
+        view = TimelineView()
+        view.keys = list(self.keys)
+        view.articles = list(self.articles)
+        return view
+
+    def insert(self, article: Dict[str, Any]) -> None:
+        key = timestamp_key(article)
+        i = bisect_left(self.keys, key)
+        self.keys.insert(i, key)
+        self.articles.insert(i, article)
+
+    def remove(self, article: Dict[str, Any]) -> None:
+        key = timestamp_key(article)
+        lo = bisect_left(self.keys, key)
+        hi = bisect_right(self.keys, key)
+        for i in range(lo, hi):
+            if self.articles[i] is article:
+                del self.keys[i]
+                del self.articles[i]
+                return
+
+    def newest(self, limit: int, exclude_id=None) -> List[Dict[str, Any]]:
+        """Return up to `limit` articles, newest first"""
+        if limit <= 0:
+            return []
+        if exclude_id is None:
+            return self.articles[:-limit - 1:-1]
+
+        result = []
+        for article in reversed(self.articles):
+            if article.get('id') == exclude_id:
+                continue
+            result.append(article)
+            if len(result) >= limit:
+                break
+        return result
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Stress test: concurrent readers and writers against one ArchiveManager.
+Readers check that every snapshot they see is internally consistent; at the
+end the archive is reloaded from disk and compared with the in-memory view.
+
+With --processes N, N processes instead share one archive in shared mode,
+each writing and refreshing; afterwards every process must see exactly what
+is on disk.
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from storage.archive import ArchiveManager, normalize_id
+from storage.backends import JournalBackend
+
+CATEGORIES = ['politics', 'technology', 'science', 'sports', 'world']
+
+
+def make_article(writer, i, old=False):
+    # "old" articles are the ones delete_old_articles will prune
+    age = timedelta(days=90) if old else timedelta(seconds=random.randint(0, 86400))
+    return {
+        'id': f"w{writer}-{i}",
+        'headline': f"Writer {writer} files story {i} about the committee",
+        'opening_paragraph': "Officials confirmed the committee would consider the matter eventually.",
+        'category': random.choice(CATEGORIES),
+        'timestamp': (datetime.now() - age).isoformat()
+    }
+
+
+def check_snapshot(snapshot):
+    """Return a description of the first inconsistency in a snapshot, or None"""
+    if len(snapshot.timeline) != len(snapshot.articles):
+        return f"timeline has {len(snapshot.timeline)} articles, list has {len(snapshot.articles)}"
+    if len(snapshot.id_index) != len(snapshot.articles):
+        return f"id index has {len(snapshot.id_index)} entries, list has {len(snapshot.articles)}"
+    if sum(len(view) for view in snapshot.category_views.values()) != len(snapshot.articles):
+        return "category views don't add up to the article count"
+    keys = snapshot.timeline.keys
+    if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+        return "timeline out of order"
+    for article in snapshot.timeline.newest(20):
+        if snapshot.id_index.get(normalize_id(article.get('id'))) is not article:
+            return f"article {article.get('id')} in timeline but not in id index"
+    return None
+
+
+def reader(archive, stop, errors, counts):
+    while not stop.is_set():
+        problem = check_snapshot(archive.snapshot)
+        if problem:
+            errors.append(problem)
+        archive.search_articles("", category=random.choice(CATEGORIES), limit=12)
+        archive.search_articles("committee", limit=5)
+        archive.get_stats()
+        counts['reads'] += 1
+
+
+def writer(archive, writer_id, per_writer, batch_size, errors):
+    i = 0
+    while i < per_writer:
+        if batch_size > 1 and random.random() < 0.5:
+            batch = [make_article(writer_id, i + k, old=random.random() < 0.1)
+                     for k in range(min(batch_size, per_writer - i))]
+            results = archive.add_articles(batch)
+            if not all(r['added'] for r in results):
+                errors.append(f"writer {writer_id}: batch insert rejected {results}")
+            i += len(batch)
+        else:
+            if not archive.add_article(make_article(writer_id, i, old=random.random() < 0.1)):
+                errors.append(f"writer {writer_id}: insert of w{writer_id}-{i} failed")
+            i += 1
+
+
+def pruner_loop(archive, rounds=10):
+    for _ in range(rounds):
+        archive.delete_old_articles(days=30)
+        time.sleep(0.05)
+
+
+def run(readers, writers, per_writer, batch_size, compact_every):
+    storage = tempfile.mkdtemp(prefix='stress-archive-')
+    try:
+        archive = ArchiveManager(storage, backend=JournalBackend(storage, compact_every=compact_every))
+        stop = threading.Event()
+        errors, counts = [], {'reads': 0}
+
+        reader_threads = [threading.Thread(target=reader, args=(archive, stop, errors, counts))
+                          for _ in range(readers)]
+        writer_threads = [threading.Thread(target=writer, args=(archive, w, per_writer, batch_size, errors))
+                          for w in range(writers)]
+        pruner = threading.Thread(target=pruner_loop, args=(archive,))
+
+        started = time.perf_counter()
+        for thread in reader_threads + writer_threads + [pruner]:
+            thread.start()
+        for thread in writer_threads + [pruner]:
+            thread.join()
+        stop.set()
+        for thread in reader_threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        # One last prune so the expected set doesn't depend on timing
+        archive.delete_old_articles(days=30)
+
+        problem = check_snapshot(archive.snapshot)
+        if problem:
+            errors.append(f"final snapshot: {problem}")
+
+        reloaded = ArchiveManager(storage)
+        memory_ids = [a['id'] for a in archive.articles]
+        disk_ids = [a['id'] for a in reloaded.articles]
+        if memory_ids != disk_ids:
+            errors.append(f"disk has {len(disk_ids)} articles, memory has {len(memory_ids)} "
+                          f"(or the order differs)")
+        if len(set(memory_ids)) != len(memory_ids):
+            errors.append("duplicate ids in the archive")
+
+        print(f"{writers} writers x {per_writer} articles, {readers} readers: "
+              f"{len(memory_ids)} kept, {counts['reads']:,} read passes in {elapsed:.2f}s")
+        return errors
+    finally:
+        shutil.rmtree(storage, ignore_errors=True)
+
+
+def process_worker(storage, worker_id, per_writer, compact_every, start, results):
+    random.seed(worker_id)
+    archive = ArchiveManager(storage, backend=JournalBackend(storage, compact_every=compact_every), shared=True)
+    start.wait()
+    for i in range(per_writer):
+        if random.random() < 0.3:
+            archive.add_articles([make_article(worker_id, i * 2), make_article(worker_id, i * 2 + 1)])
+        else:
+            archive.add_article(make_article(worker_id, i * 2))
+        # Like a request hitting this worker between writes
+        archive.refresh()
+        problem = check_snapshot(archive.snapshot)
+        if problem:
+            results.put((worker_id, f"worker {worker_id}: {problem}"))
+    start.wait()  # every process has finished writing
+    archive.refresh()
+    results.put((worker_id, [a['id'] for a in archive.articles]))
+
+
+def run_processes(processes, per_writer, compact_every):
+    storage = tempfile.mkdtemp(prefix='stress-archive-')
+    try:
+        start = multiprocessing.Barrier(processes)
+        results = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=process_worker,
+                                           args=(storage, w, per_writer, compact_every, start, results))
+                   for w in range(processes)]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+
+        errors, views = [], {}
+        while len(views) < processes:
+            worker_id, payload = results.get(timeout=120)
+            if isinstance(payload, str):
+                errors.append(payload)
+            else:
+                views[worker_id] = payload
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+        disk_ids = sorted(a['id'] for a in ArchiveManager(storage).articles)
+        for worker_id, ids in sorted(views.items()):
+            if sorted(ids) != disk_ids:
+                errors.append(f"worker {worker_id} sees {len(ids)} articles, disk has {len(disk_ids)}")
+        if len(set(disk_ids)) != len(disk_ids):
+            errors.append("duplicate ids on disk")
+
+        print(f"{processes} processes x {per_writer} writes: {len(disk_ids)} articles in {elapsed:.2f}s")
+        return errors
+    finally:
+        shutil.rmtree(storage, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress ArchiveManager with concurrent readers and writers")
+    parser.add_argument("--readers", type=int, default=8, help="Reader threads")
+    parser.add_argument("--writers", type=int, default=4, help="Writer threads")
+    parser.add_argument("--per-writer", type=int, default=250, help="Articles written per writer")
+    parser.add_argument("--batch-size", type=int, default=5, help="Max articles per add_articles call")
+    parser.add_argument("--compact-every", type=int, default=50, help="Journal records between compactions")
+    parser.add_argument("--processes", type=int, default=0, help="Share one archive across this many processes")
+
+    args = parser.parse_args()
+    random.seed(42)
+
+    if args.processes:
+        errors = run_processes(args.processes, args.per_writer, args.compact_every)
+    else:
+        errors = run(args.readers, args.writers, args.per_writer, args.batch_size, args.compact_every)
+    if errors:
+        for error in errors[:20]:
+            print(f"❌ {error}")
+        print(f"❌ {len(errors)} consistency errors")
+        sys.exit(1)
+    print("✅ Memory and disk stayed consistent")
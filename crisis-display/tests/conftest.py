@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Same import layout as app.py and the CLI scripts
+sys.path.insert(0, os.path.join(BASE_DIR, 'src'))
+sys.path.insert(0, BASE_DIR)
+
+
+def make_article(article_id, category='world', timestamp='2024-01-01T12:00:00', **fields):
+    article = {
+        'id': article_id,
+        'headline': f"Committee to form committee on story {article_id}",
+        'opening_paragraph': "Officials confirmed the matter would be considered eventually.",
+        'body_paragraphs': [f"Body of story {article_id}."],
+        'category': category,
+        'timestamp': timestamp
+    }
+    article.update(fields)
+    return article
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return str(tmp_path)
+
+
+class StubNewsServer:
+    """Local stand-in for the newsdata.io endpoint, on its own thread.
+
+    `respond(params)` returns (status, payload[, headers[, delay]]) for a
+    request's query params; every request's params are kept in `requests`.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = dict(parse_qsl(urlsplit(self.path).query))
+                with stub._lock:
+                    stub.requests.append(params)
+                status, payload, headers, delay = (tuple(stub.respond(params)) + ({}, 0))[:4]
+                if delay:
+                    time.sleep(delay)
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/1/news"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def news_server():
+    """Start a StubNewsServer; set its `respond` in the test"""
+    server = StubNewsServer(lambda params: (200, {'status': 'success', 'results': []}))
+    yield server
+    server.close()
+
+
+def news_result(link, title=None, category='world', pub_date='2024-01-01 12:00:00'):
+    """One raw newsdata.io result"""
+    return {'title': title or f"Story at {link}", 'link': link, 'content': 'Details to follow.',
+            'source_id': 'wire', 'category': [category], 'pubDate': pub_date}
@@ -0,0 +1,30 @@
+from storage.archive import ArchiveManager
+from storage.factory import open_archive
+from storage.mmap_store import MmapBackend
+from storage.sqlite_archive import SQLiteArchiveManager
+
+
+def test_default_is_the_journal_archive(storage, monkeypatch):
+    monkeypatch.delenv('ARCHIVE_BACKEND', raising=False)
+    monkeypatch.delenv('ARCHIVE_SHARED', raising=False)
+    archive = open_archive(storage)
+    assert isinstance(archive, ArchiveManager)
+    assert not isinstance(archive.backend, MmapBackend)
+    assert not archive.shared
+
+
+def test_backend_and_sharing_come_from_the_environment(storage, monkeypatch):
+    monkeypatch.setenv('ARCHIVE_BACKEND', 'mmap')
+    monkeypatch.setenv('ARCHIVE_SHARED', '1')
+    archive = open_archive(storage)
+    assert isinstance(archive.backend, MmapBackend)
+    assert archive.shared
+
+    monkeypatch.setenv('ARCHIVE_BACKEND', 'sqlite')
+    assert isinstance(open_archive(storage), SQLiteArchiveManager)
+
+
+def test_callers_can_require_sharing(storage, monkeypatch):
+    monkeypatch.delenv('ARCHIVE_BACKEND', raising=False)
+    monkeypatch.delenv('ARCHIVE_SHARED', raising=False)
+    assert open_archive(storage, shared=True).shared
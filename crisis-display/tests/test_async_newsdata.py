@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip('httpx')
+from api.async_newsdata import AsyncNewsDataAPI, ingest_stream
+from api.disk_cache import DiskResponseCache
+from generation.fingerprint import StoryDeduplicator
+from generation.satire_engine import SatireEngine
+from storage.archive import ArchiveManager
+
+
+def raw_story(n, category='world'):
+    return {'title': f"Story {n}", 'description': 'Something happened.', 'source_id': 'wire',
+            'category': [category], 'pubDate': f"2024-01-01 10:0{n}:00", 'link': f"https://example.com/{n}"}
+
+
+def test_cache_reads_happen_off_the_event_loop(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), offline=True)
+    api = AsyncNewsDataAPI(cache=cache)
+    for n, category in enumerate(('world', 'science')):
+        cache.set(api.query_params({'category': category}, 'us', 10), {'results': [raw_story(n, category)]})
+
+    threads = []
+    get = cache.get
+    cache.get = lambda params: threads.append(threading.current_thread()) or get(params)
+
+    result = asyncio.run(api.fetch_many_async([{'category': 'world'}, {'category': 'science'}]))
+    assert result['errors'] == {}
+    assert sorted(a['category'] for a in result['articles']) == ['science', 'world']
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_offline_miss_is_reported_per_query(tmp_path):
+    api = AsyncNewsDataAPI(cache=DiskResponseCache(str(tmp_path), offline=True))
+    result = asyncio.run(api.fetch_many_async([{'category': 'world'}]))
+    assert result['articles'] == []
+    assert 'Offline mode' in result['errors']['world']
+
+
+class OneResultFeed:
+    def __init__(self, articles):
+        self.articles = articles
+
+    async def stream(self, queries, country='us', limit=10):
+        for query in queries:
+            yield {'query': query, 'articles': self.articles, 'error': None, 'seconds': 0.0}
+
+
+class FlakyEngine(SatireEngine):
+    """Fails on every story whose title mentions 'fail'"""
+
+    def generate_satire_article(self, original_article, use_cache=True):
+        if 'fail' in original_article['title']:
+            raise RuntimeError('generation failed')
+        return super().generate_satire_article(original_article, use_cache=use_cache)
+
+
+def test_failed_generations_do_not_shift_stories(storage):
+    stories = AsyncNewsDataAPI().format_articles([raw_story(1), raw_story(2), raw_story(3)])
+    stories[0]['title'] = 'Story 1 will fail'
+    archive = ArchiveManager(storage)
+    dedup = StoryDeduplicator()
+
+    async def run():
+        return [result async for result in ingest_stream(OneResultFeed(stories), [{'category': 'world'}],
+                                                         FlakyEngine(), archive, deduplicator=dedup)]
+
+    [summary] = asyncio.run(run())
+    assert summary['added'] == 2
+    assert [a['original_title'] for a in archive.articles] == ['Story 2', 'Story 3']
+    assert sum(1 for a in archive.articles if a.get('image_url')) == 1
+    # The story that failed is not remembered, so the next run tries it again
+    assert dedup.check(stories[0]) is None
+    assert dedup.check(stories[1]) and dedup.check(stories[2])
@@ -0,0 +1,73 @@
+import json
+import os
+from datetime import datetime
+
+from conftest import make_article
+from storage.archive import ArchiveManager, ArchiveSnapshot
+from storage.backends import JournalBackend
+
+
+def test_batch_is_one_journal_record(storage):
+    archive = ArchiveManager(storage)
+    results = archive.add_articles([make_article('a1'), make_article('a2'), make_article('a1'),
+                                    {'id': 'a3'}, 'not an article'])
+
+    assert [r['added'] for r in results] == [True, True, False, False, False]
+    assert [r['reason'] for r in results[2:]] == ['duplicate', 'missing headline', 'not an article object']
+    with open(os.path.join(storage, 'articles.journal.jsonl')) as f:
+        assert len(f.readlines()) == 1
+    assert [a['id'] for a in ArchiveManager(storage).articles] == ['a1', 'a2']
+
+
+def test_failed_commit_publishes_nothing(storage):
+    class FailingBackend(JournalBackend):
+        def append(self, new_articles, articles):
+            return False
+
+    archive = ArchiveManager(storage, backend=FailingBackend(storage))
+    results = archive.add_articles([make_article('a1')])
+
+    assert results == [{'id': 'a1', 'added': False, 'reason': 'commit failed'}]
+    assert archive.get_article_count() == 0
+    assert archive.generation == 0
+
+
+def test_single_article_journal_records_still_replay(storage):
+    # Journals written before batch inserts hold one 'article' per record
+    with open(os.path.join(storage, 'articles.journal.jsonl'), 'w') as f:
+        f.write(json.dumps({'op': 'add', 'article': make_article('old')}) + '\n')
+        f.write(json.dumps({'op': 'add', 'articles': [make_article('new')]}) + '\n')
+
+    archive = ArchiveManager(storage, shared=True)
+    assert [a['id'] for a in archive.articles] == ['old', 'new']
+
+    # The tail reader used by shared mode understands both as well
+    with open(os.path.join(storage, 'articles.journal.jsonl'), 'a') as f:
+        f.write(json.dumps({'op': 'add', 'article': make_article('later')}) + '\n')
+    assert archive.refresh()
+    assert archive.get_article_by_id('later') is not None
+
+
+def test_deleting_old_articles_only_touches_their_views(storage):
+    archive = ArchiveManager(storage)
+    recent = datetime.now().isoformat()
+    archive.add_articles([make_article('old1', timestamp='2000-01-01T00:00:00'),
+                          make_article('new1', timestamp=recent),
+                          make_article('old2', category='science', timestamp='2000-01-02T00:00:00'),
+                          make_article('new2', category='sports', timestamp=recent)])
+    before = archive.snapshot
+
+    assert archive.delete_old_articles(days=30) == 2
+
+    after = archive.snapshot
+    rebuilt = ArchiveSnapshot.build(after.articles)
+    assert [a['id'] for a in after.articles] == ['new1', 'new2']
+    assert set(after.id_index) == set(rebuilt.id_index) == {'new1', 'new2'}
+    assert after.timeline.articles == rebuilt.timeline.articles
+    assert {name: view.articles for name, view in after.category_views.items()} == \
+        {name: view.articles for name, view in rebuilt.category_views.items()}
+    # A category with nothing deleted keeps its view; one left empty is dropped
+    assert after.category_views['sports'] is before.category_views['sports']
+    assert 'science' not in after.category_views
+    assert after.generation == before.generation + 1
+    assert archive.get_article_by_id('old1') is None
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from conftest import make_article
+
+app_module = pytest.importorskip('app')
+from build_static import build_site, MANIFEST_NAME
+
+
+def test_incremental_rebuild_only_renders_changed_pages(storage, tmp_path):
+    flask_app = app_module.create_app(data_dir=storage, warm_up=False)
+    archive = flask_app.extensions['components'].archive_manager
+    archive.add_article(make_article('a1', timestamp='2024-01-01T10:00:00'))
+    out = str(tmp_path / 'build')
+
+    first = build_site(flask_app, archive, out)
+    assert first['failed'] == []
+    assert os.path.exists(os.path.join(out, 'article', 'a1', 'index.html'))
+    assert os.path.exists(os.path.join(out, MANIFEST_NAME))
+
+    second = build_site(flask_app, archive, out)
+    assert second['rendered'] == 0
+    assert second['skipped'] == first['pages']
+
+    archive.add_article(make_article('a2', category='science', timestamp='2024-01-02T10:00:00'))
+    third = build_site(flask_app, archive, out)
+    # Home, /category/science and the new article; other pages are unchanged
+    assert 0 < third['rendered'] < third['pages']
+    assert os.path.exists(os.path.join(out, 'article', 'a2', 'index.html'))
+
+
+def test_sample_data_mode_through_the_app_proxy(storage, tmp_path):
+    flask_app = app_module.create_app(data_dir=storage, warm_up=False)
+    # Modules missing: every component is None
+    flask_app.extensions['components'] = app_module.Components(storage, available=False)
+
+    summary = build_site(flask_app, app_module.archive_manager, str(tmp_path / 'build'))
+    assert summary['failed'] == []
+    assert summary['rendered'] == summary['pages'] > 0
@@ -0,0 +1,39 @@
+import pytest
+
+from conftest import make_article
+
+app_module = pytest.importorskip('app')
+
+
+def make_worker(storage):
+    """One gunicorn-style worker: its own app and its own in-memory archive"""
+    flask_app = app_module.create_app(data_dir=storage, warm_up=False)
+    return flask_app, flask_app.extensions['components']
+
+
+def test_etag_is_the_same_across_workers(storage):
+    writer, writer_components = make_worker(storage)
+    writer_components.archive_manager.add_article(make_article('a1', timestamp='2024-01-01T10:00:00'))
+    writer_components.archive_manager.add_article(make_article('a2', timestamp='2024-01-02T10:00:00'))
+
+    # Loaded from disk, so its generation differs from the writer's
+    reader, reader_components = make_worker(storage)
+    assert reader_components.archive_manager.generation != writer_components.archive_manager.generation
+
+    for path in ('/', '/article/a1', '/category/world', '/api/latest'):
+        etag = writer.test_client().get(path).headers['ETag']
+        assert reader.test_client().get(path).headers['ETag'] == etag
+        response = reader.test_client().get(path, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+
+def test_etag_changes_when_the_page_content_does(storage):
+    flask_app, components = make_worker(storage)
+    components.archive_manager.add_article(make_article('a1', timestamp='2024-01-01T10:00:00'))
+    client = flask_app.test_client()
+    etag = client.get('/').headers['ETag']
+
+    components.archive_manager.add_article(make_article('a2', timestamp='2024-01-02T10:00:00'))
+    response = client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
@@ -0,0 +1,131 @@
+from api.cursors import CursorStore, is_known
+from api.newsdata import NewsDataAPI
+from generation.fingerprint import StoryDeduplicator
+from generation.satire_engine import SatireEngine
+from pipeline.ingest import IngestRun
+from storage.archive import ArchiveManager
+
+
+class FakeFeed(NewsDataAPI):
+    """newsdata.io stand-in: newest first, `limit` per page, nextPage = link of the page's last story"""
+
+    def __init__(self, tmp_path):
+        super().__init__(cursors=CursorStore(str(tmp_path / 'cursors.json')))
+        self.stories = []
+        self.requests = 0
+
+    def publish(self, *names, pub_date=None):
+        for name in names:
+            stamp = pub_date or f"2024-01-01 10:{len(self.stories):02d}:00"
+            self.stories.insert(0, {'title': name, 'link': f"https://example.com/{name}",
+                                    'pubDate': stamp, 'category': ['world']})
+
+    def _get_payload(self, params):
+        self.requests += 1
+        start = 0
+        if params.get('page'):
+            start = [s['link'] for s in self.stories].index(params['page']) + 1
+        page = self.stories[start:start + params['size']]
+        more = start + params['size'] < len(self.stories)
+        return {'results': page, 'nextPage': page[-1]['link'] if page and more else None}
+
+
+def titles(articles):
+    return [a['title'] for a in articles]
+
+
+def test_only_new_stories_come_back(tmp_path):
+    feed = FakeFeed(tmp_path)
+    feed.publish('a', 'b', 'c')
+    assert titles(feed.fetch_new('world', limit=10)) == ['c', 'b', 'a']
+    assert feed.fetch_new('world', limit=10) == []
+
+    feed.publish('d', 'e')
+    assert titles(feed.fetch_new('world', limit=10)) == ['e', 'd']
+
+
+def test_gap_left_by_a_short_page_budget_is_closed_next_run(tmp_path):
+    feed = FakeFeed(tmp_path)
+    feed.publish('old')
+    feed.fetch_new('world', limit=2)
+
+    backlog = [f"s{i}" for i in range(10)]
+    feed.publish(*backlog)
+    first = feed.fetch_new('world', limit=2, max_pages=3)
+    assert titles(first) == ['s9', 's8', 's7', 's6', 's5', 's4']
+    cursor = feed.cursors.get('us:world')
+    assert cursor['next_page'] and cursor['last_links'] == ['https://example.com/old']
+
+    feed.publish('late')
+    second = feed.fetch_new('world', limit=2, max_pages=4)
+    assert sorted(titles(second)) == sorted(['late', 's3', 's2', 's1', 's0'])
+    assert feed.fetch_new('world', limit=2) == []
+    assert not feed.cursors.get('us:world').get('next_page')
+
+
+def test_gap_still_open_keeps_old_boundary(tmp_path):
+    feed = FakeFeed(tmp_path)
+    feed.publish('old')
+    feed.fetch_new('world', limit=1)
+    feed.publish(*[f"s{i}" for i in range(6)])
+
+    seen = []
+    for _ in range(4):
+        seen += titles(feed.fetch_new('world', limit=1, max_pages=2))
+    assert sorted(seen) == sorted(f"s{i}" for i in range(6))
+
+
+def test_same_second_stories_are_told_apart_by_link(tmp_path):
+    feed = FakeFeed(tmp_path)
+    feed.publish('a', 'b', pub_date='2024-01-01 10:00:00')
+    assert sorted(titles(feed.fetch_new('world', limit=10))) == ['a', 'b']
+
+    feed.publish('c', pub_date='2024-01-01 10:00:00')
+    assert titles(feed.fetch_new('world', limit=10)) == ['c']
+    assert feed.fetch_new('world', limit=10) == []
+
+
+def test_cursor_from_before_last_links_still_matches():
+    cursor = {'last_pub_date': '2024-01-01 10:00:00', 'last_link': 'https://example.com/a', 'next_page': None}
+    assert is_known({'url': 'https://example.com/a', 'published_date': '2024-01-01 10:00:00'}, cursor)
+    assert is_known({'url': 'https://example.com/z', 'published_date': '2024-01-01 09:00:00'}, cursor)
+    assert not is_known({'url': 'https://example.com/b', 'published_date': '2024-01-01 10:00:00'}, cursor)
+
+
+def test_pending_cursor_only_moves_when_committed(tmp_path):
+    feed = FakeFeed(tmp_path)
+    feed.publish('a', 'b')
+    feed.fetch_new(limit=5)
+    feed.publish('c')
+
+    articles, pending = feed.fetch_new_pending(limit=5)
+    assert titles(articles) == ['c']
+    assert titles(feed.fetch_new_pending(limit=5)[0]) == ['c']
+    feed.commit_cursor(pending)
+    assert feed.fetch_new(limit=5) == []
+
+
+class FailingEngine(SatireEngine):
+    def generate_satire_article(self, original_article, use_cache=True):
+        if original_article['title'] == 'c':
+            raise RuntimeError('generation failed')
+        return super().generate_satire_article(original_article, use_cache=use_cache)
+
+
+def test_run_that_loses_a_story_keeps_the_cursor(tmp_path):
+    feed = FakeFeed(tmp_path)
+    archive = ArchiveManager(str(tmp_path / 'archive'))
+    dedup = StoryDeduplicator()
+    feed.publish('a', 'b')
+    list(IngestRun(feed, SatireEngine(), archive, deduplicator=dedup).run(['world']))
+    feed.publish('c', 'd')
+
+    failed = IngestRun(feed, FailingEngine(), archive, deduplicator=dedup)
+    assert [r['added'] for r in failed.run(['world'])] == [True]
+    assert failed.lost == 1
+
+    # The next run sees c and d again; d is already archived and skipped
+    retry = IngestRun(feed, SatireEngine(), archive, deduplicator=dedup)
+    assert [r['added'] for r in retry.run(['world'])] == [True]
+    assert sorted(a['original_title'] for a in archive.articles) == ['a', 'b', 'c', 'd']
+    assert feed.fetch_new('world', limit=10) == []
@@ -0,0 +1,28 @@
+from api.disk_cache import DiskResponseCache, cache_key
+
+
+def test_key_ignores_order_api_key_and_case_of_case_insensitive_params():
+    assert cache_key({'category': 'World', 'country': 'US', 'apikey': 'a'}) == \
+        cache_key({'country': 'us', 'category': 'world ', 'apikey': 'b'})
+
+
+def test_page_tokens_differing_only_in_case_are_different_queries():
+    assert cache_key({'category': 'world', 'page': 'AbC123'}) != cache_key({'category': 'world', 'page': 'abc123'})
+
+
+def test_entries_expire_unless_offline(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), ttl=0)
+    cache.set({'category': 'world'}, {'results': []}, etag='"v1"')
+    entry = cache.get({'category': 'world'})
+    assert entry['etag'] == '"v1"'
+    assert not cache.is_fresh(entry)
+    assert DiskResponseCache(str(tmp_path), ttl=0, offline=True).is_fresh(entry)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), max_entries=2)
+    for page in ('p1', 'p2', 'p3'):
+        cache.set({'page': page}, {'results': [page]})
+    assert cache.get({'page': 'p1'}) is None
+    assert cache.get({'page': 'p3'})['payload'] == {'results': ['p3']}
+    assert cache.evictions == 1
@@ -0,0 +1,37 @@
+import time
+
+from conftest import news_result
+from api.newsdata import NewsDataAPI
+from api.resilience import RetryPolicy
+
+DELAYS = {'politics': 0.3, 'science': 0.3, 'business': 0.3}
+
+
+def respond(params):
+    category = params.get('category')
+    if category == 'broken':
+        return 400, {'status': 'error', 'results': {'message': 'bad category'}}
+    results = [news_result(f"https://example.com/{category}/1", category=category),
+               # Syndicated: every category carries the same wire story
+               news_result('https://example.com/wire/shared', category=category)]
+    return 200, {'status': 'success', 'results': results}, {}, DELAYS.get(category, 0)
+
+
+def test_fetch_many_against_a_stub_server(news_server):
+    news_server.respond = respond
+    api = NewsDataAPI(base_url=news_server.url, retry_policy=RetryPolicy(max_retries=0))
+
+    started = time.perf_counter()
+    result = api.fetch_many(['politics', 'science', 'business', 'broken'])
+    elapsed = time.perf_counter() - started
+
+    links = [article['url'] for article in result['articles']]
+    assert links == ['https://example.com/politics/1', 'https://example.com/wire/shared',
+                     'https://example.com/science/1', 'https://example.com/business/1']
+    assert set(result['timings']) == {'politics', 'science', 'business', 'broken'}
+    assert all(result['timings'][name] >= 0.3 for name in DELAYS)
+    assert list(result['errors']) == ['broken']
+    assert '400' in result['errors']['broken']
+    # Concurrent: about the slowest category, nowhere near the 0.9s sum
+    assert elapsed < 0.75
+    assert {params['category'] for params in news_server.requests} == set(DELAYS) | {'broken'}
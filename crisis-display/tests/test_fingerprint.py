@@ -0,0 +1,87 @@
+import hashlib
+import json
+
+from generation.fingerprint import StoryDeduplicator, exact_keys, story_fingerprint
+
+BODY = ("The city council voted on Tuesday to postpone a decision on the new bridge until "
+        "engineers finish a second study of the river crossing and its costs.")
+
+
+def story(n, title=None, content=BODY, url=None):
+    return {'title': title or f"Council delays bridge vote again pending study number {n}",
+            'content': content, 'url': url or f"https://news.example.com/story-{n}?utm_source=x"}
+
+
+def test_syndicated_copy_is_a_duplicate():
+    dedup = StoryDeduplicator()
+    dedup.remember([story(1)])
+    assert dedup.check(story(1)) == 'duplicate url'
+    assert dedup.check(story(1, url='https://other.example.org/copy')) == 'duplicate story'
+    assert dedup.check(story(1, url='https://other.example.org/copy',
+                             content=BODY.replace('Tuesday', 'Wednesday'))) == 'near duplicate'
+
+
+def test_generic_titles_alone_are_not_duplicates():
+    dedup = StoryDeduplicator()
+    dedup.remember([story(1, title='Live updates', content='Markets fell sharply on the open.')])
+    assert dedup.check(story(2, title='Live updates', content='Storm makes landfall in Florida.')) is None
+    # No body either (free plan placeholder): too little to go on besides the url
+    placeholder = 'ONLY AVAILABLE IN PAID PLANS'
+    dedup.remember([story(3, title='Live updates', content=placeholder)])
+    assert dedup.check(story(4, title='Live updates', content=placeholder)) is None
+    assert 'title' not in ''.join(exact_keys(story(4, title='Live updates', content=placeholder)))
+
+
+def test_batch_filter_drops_repeats_within_the_batch():
+    dedup = StoryDeduplicator()
+    kept = dedup.filter([story(1), story(1, url='https://mirror.example.net/1'), story(2, content='Other news.')])
+    assert len(kept) == 2
+    assert len(dedup) == 0
+
+
+def test_fingerprint_is_the_normalized_url_hash():
+    expected = hashlib.sha1(b'news.example.com/story-1').hexdigest()
+    assert story_fingerprint(story(1)) == expected
+
+
+def test_remember_appends_one_line_per_call(tmp_path):
+    path = str(tmp_path / 'seen.json')
+    dedup = StoryDeduplicator(path)
+    dedup.remember([story(1), story(2)])
+    dedup.remember([story(3)])
+    with open(path) as f:
+        assert [len(json.loads(line)['entries']) for line in f] == [2, 1]
+
+    reloaded = StoryDeduplicator(path)
+    assert len(reloaded) == 3
+    assert reloaded.check(story(2)) == 'duplicate url'
+
+
+def test_single_object_file_is_read_and_rewritten(tmp_path):
+    path = tmp_path / 'seen.json'
+    old = StoryDeduplicator()
+    old.remember([story(1)])
+    path.write_text(json.dumps({'version': 1, 'entries': list(old.entries)}))
+
+    dedup = StoryDeduplicator(str(path))
+    assert dedup.check(story(1)) == 'duplicate url'
+    dedup.remember([story(2)])
+    assert len(StoryDeduplicator(str(path))) == 2
+
+
+def test_cap_forgets_oldest_and_compacts(tmp_path):
+    path = str(tmp_path / 'seen.json')
+    dedup = StoryDeduplicator(path, max_entries=3)
+    for n in range(8):
+        dedup.remember([story(n, content=f"Unrelated story body number {n} about something else entirely here.")])
+
+    assert len(dedup) == 3
+    assert dedup.check(story(0)) is None
+    assert dedup.check(story(7)) == 'duplicate url'
+    # Nothing of the forgotten stories is left in the indexes
+    assert len(dedup.exact) == sum(len(entry['keys']) for entry in dedup.entries)
+    assert sum(len(bucket) for bucket in dedup.buckets.values()) == 3 * dedup.bands
+
+    with open(path) as f:
+        assert sum(len(json.loads(line)['entries']) for line in f) <= 2 * 3
+    assert [e['keys'] for e in StoryDeduplicator(path, max_entries=3).entries] == [e['keys'] for e in dedup.entries]
@@ -0,0 +1,109 @@
+from generation.fingerprint import StoryDeduplicator
+from generation.satire_engine import MIN_PARALLEL_BATCH, SatireEngine
+from pipeline.ingest import IngestRun
+from pipeline.pipeline import Pipeline, Stage
+from storage.archive import ArchiveManager
+
+
+class FakeFeed:
+    def __init__(self, count):
+        self.count = count
+
+    def fetch_new_pending(self, category, limit=10):
+        return self.fetch_new(category, limit), None
+
+    def commit_cursor(self, pending):
+        pass
+
+    def fetch_new(self, category, limit=10):
+        return [{'title': f"Regional council approves plan number {n} for the new harbour bridge",
+                 'content': f"The vote on plan {n} was unanimous after a short debate.",
+                 'url': f"https://example.com/{category}/{n}", 'category': category, 'source': 'wire'}
+                for n in range(self.count)]
+
+
+class SpyArchive(ArchiveManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commits = []
+
+    def add_articles(self, articles):
+        self.commits.append(len(articles))
+        return super().add_articles(articles)
+
+
+class SpyDeduplicator(StoryDeduplicator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.appends = 0
+
+    def remember(self, stories):
+        self.appends += 1
+        super().remember(stories)
+
+
+def test_batched_stage_gets_lists_and_passes_everything_on():
+    batches = []
+
+    def collect(items):
+        batches.append(list(items))
+        return items
+
+    pipeline = Pipeline([Stage('double', lambda n: [n * 2]),
+                         Stage('collect', collect, batch_size=4, linger=0.2)])
+    assert sorted(pipeline.run(range(10))) == [n * 2 for n in range(10)]
+    assert all(1 <= len(batch) <= 4 for batch in batches)
+    assert sum(len(batch) for batch in batches) == 10
+    stats = {stage['stage']: stage for stage in pipeline.report()['stages']}
+    assert stats['collect']['items_in'] == 10
+
+
+def test_persist_commits_once_per_batch(storage):
+    archive = SpyArchive(storage)
+    dedup = SpyDeduplicator()
+    run = IngestRun(FakeFeed(12), SatireEngine(), archive, deduplicator=dedup, batch_size=32)
+
+    results = list(run.run(['world']))
+
+    assert len(results) == 12 and all(result['added'] for result in results)
+    assert sum(archive.commits) == 12
+    assert len(archive.commits) < 12
+    assert dedup.appends == len(archive.commits)
+    assert len(dedup) == 12
+    assert sum(1 for article in archive.articles if article.get('image_url')) == 1
+
+
+def test_rerun_skips_remembered_stories(storage):
+    archive = ArchiveManager(storage)
+    dedup = StoryDeduplicator()
+    list(IngestRun(FakeFeed(5), SatireEngine(), archive, deduplicator=dedup).run(['world']))
+
+    again = list(IngestRun(FakeFeed(5), SatireEngine(), archive, deduplicator=dedup).run(['world']))
+    assert again == []
+    assert len(archive.articles) == 5
+
+
+def test_small_batches_stay_serial_and_the_pool_is_reused():
+    engine = SatireEngine()
+    stories = FakeFeed(MIN_PARALLEL_BATCH).fetch_new('world')
+    try:
+        assert all(engine.generate_batch(stories[:4], workers=2))
+        assert engine._pool is None
+
+        assert all(engine.generate_batch(stories, workers=2))
+        pool = engine._pool
+        assert pool is not None
+        assert all(engine.generate_batch(stories, workers=2))
+        assert engine._pool is pool
+    finally:
+        engine.close_pool()
+    assert engine._pool is None
+
+
+def test_run_shuts_its_generation_pool_down(storage):
+    engine = SatireEngine()
+    run = IngestRun(FakeFeed(2 * MIN_PARALLEL_BATCH), engine, ArchiveManager(storage),
+                    batch_size=MIN_PARALLEL_BATCH, generation_workers=2)
+    results = list(run.run(['world']))
+    assert len(results) > MIN_PARALLEL_BATCH and all(result['added'] for result in results)
+    assert engine._pool is None
@@ -0,0 +1,102 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from jobs.job_queue import JobQueue, JobWorker, job_outcome, wait_for_job
+
+
+def test_wait_returns_once_the_job_finishes(storage):
+    queue = JobQueue(os.path.join(storage, 'jobs.db'))
+    job, _ = queue.enqueue('refresh')
+
+    def finish():
+        queue.complete(queue.claim()['id'], {'success': True, 'message': 'ok'})
+
+    timer = threading.Timer(0.1, finish)
+    timer.start()
+    try:
+        job = queue.wait(job['id'], timeout=5, poll_interval=0.02)
+    finally:
+        timer.join()
+    assert job['status'] == 'done'
+    assert job_outcome(job) == {'success': True, 'message': 'ok'}
+
+
+def test_wait_gives_up_after_timeout(storage):
+    queue = JobQueue(os.path.join(storage, 'jobs.db'))
+    job, _ = queue.enqueue('refresh')
+
+    job = queue.wait(job['id'], timeout=0.05, poll_interval=0.01)
+    assert job['status'] == 'queued'
+    assert job_outcome(job)['success'] is False
+
+
+def test_outcome_of_failed_and_missing_jobs(storage):
+    queue = JobQueue(os.path.join(storage, 'jobs.db'))
+    job, _ = queue.enqueue('refresh')
+    queue.fail(queue.claim()['id'], 'upstream down')
+
+    assert job_outcome(queue.wait(job['id'], timeout=1)) == {'success': False, 'message': 'upstream down'}
+    # What the /api/jobs endpoint returns for an unknown id
+    missing = wait_for_job(lambda job_id: {'error': 'Job not found'}, 'nope', timeout=1)
+    assert job_outcome(missing) == {'success': False, 'message': 'Job not found'}
+
+
+def test_second_worker_leaves_a_live_job_alone(storage):
+    db_path = os.path.join(storage, 'jobs.db')
+    started, release = threading.Event(), threading.Event()
+    runs = []
+
+    def refresh(params, report_progress):
+        runs.append(threading.current_thread().name)
+        started.set()
+        release.wait(5)
+        return {'success': True, 'message': 'ok'}
+
+    # Two processes' worth of workers, each with its own connection to the db
+    first = JobWorker(JobQueue(db_path, lease_seconds=0.3), {'refresh': refresh}, poll_interval=0.05, owner='a')
+    second = JobWorker(JobQueue(db_path, lease_seconds=0.3), {'refresh': refresh}, poll_interval=0.05, owner='b')
+    job, _ = first.queue.enqueue('refresh')
+    first.start()
+    try:
+        assert started.wait(2)
+        second.start()
+        # Several lease periods: the heartbeat keeps the job with its owner
+        time.sleep(1)
+        assert second.queue.get(job['id'])['status'] == 'running'
+        assert len(runs) == 1
+        release.set()
+        assert second.queue.wait(job['id'], timeout=5, poll_interval=0.02)['status'] == 'done'
+    finally:
+        release.set()
+        first.stop()
+        second.stop()
+    assert len(runs) == 1
+
+
+def test_expired_lease_is_requeued(storage):
+    queue = JobQueue(os.path.join(storage, 'jobs.db'), lease_seconds=0.05)
+    job, _ = queue.enqueue('refresh')
+    queue.claim('elsewhere:1')
+
+    assert queue.requeue_abandoned() == 0
+    time.sleep(0.06)
+    assert queue.requeue_abandoned() == 1
+    assert queue.get(job['id'])['status'] == 'queued'
+    # The old owner reporting late does not overwrite the job's new run
+    queue.complete(job['id'], {'success': True}, owner='elsewhere:1')
+    assert queue.get(job['id'])['status'] == 'queued'
+
+
+def test_job_of_a_dead_process_is_requeued(storage):
+    queue = JobQueue(os.path.join(storage, 'jobs.db'))
+    job, _ = queue.enqueue('refresh')
+    child = subprocess.Popen([sys.executable, '-c', 'pass'])
+    child.wait()
+    queue.claim(f"{socket.gethostname()}:{child.pid}")
+
+    assert queue.requeue_abandoned() == 1
+    assert queue.get(job['id'])['status'] == 'queued'
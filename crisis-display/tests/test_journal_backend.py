@@ -0,0 +1,58 @@
+import json
+import os
+
+from conftest import make_article
+from storage.archive import ArchiveManager
+from storage.backends import JournalBackend
+
+
+def test_append_goes_to_journal_and_replays(storage):
+    archive = ArchiveManager(storage)
+    assert archive.add_article(make_article('a1'))
+    assert archive.add_article(make_article('a2'))
+
+    assert not os.path.exists(os.path.join(storage, 'articles.json'))
+    with open(os.path.join(storage, 'articles.journal.jsonl')) as f:
+        assert len(f.readlines()) == 2
+
+    reloaded = ArchiveManager(storage)
+    assert [a['id'] for a in reloaded.articles] == ['a1', 'a2']
+
+
+def test_torn_final_record_is_dropped_and_cut(storage):
+    archive = ArchiveManager(storage)
+    archive.add_article(make_article('a1'))
+    journal = os.path.join(storage, 'articles.journal.jsonl')
+    with open(journal, 'a') as f:
+        f.write('{"op": "add", "articles": [{"id": "half')
+
+    reloaded = ArchiveManager(storage)
+    assert [a['id'] for a in reloaded.articles] == ['a1']
+    with open(journal) as f:
+        assert f.read().endswith('\n')
+
+    # The next append starts on a clean line
+    assert reloaded.add_article(make_article('a2'))
+    assert [a['id'] for a in ArchiveManager(storage).articles] == ['a1', 'a2']
+
+
+def test_compaction_folds_journal_into_snapshot(storage):
+    archive = ArchiveManager(storage, backend=JournalBackend(storage, compact_every=3))
+    for i in range(4):
+        archive.add_article(make_article(f"a{i}"))
+
+    with open(os.path.join(storage, 'articles.json')) as f:
+        assert [a['id'] for a in json.load(f)] == ['a0', 'a1', 'a2']
+    with open(os.path.join(storage, 'articles.journal.jsonl')) as f:
+        assert len(f.readlines()) == 1
+    assert [a['id'] for a in ArchiveManager(storage).articles] == ['a0', 'a1', 'a2', 'a3']
+
+
+def test_journal_entries_already_in_snapshot_are_skipped(storage):
+    # A crash between writing the snapshot and resetting the journal
+    backend = JournalBackend(storage)
+    backend.append([make_article('a1')], [])
+    with open(os.path.join(storage, 'articles.json'), 'w') as f:
+        json.dump([make_article('a1')], f)
+
+    assert [a['id'] for a in JournalBackend(storage).load()] == ['a1']
@@ -0,0 +1,94 @@
+import json
+import os
+import pickle
+
+from conftest import make_article
+from storage.archive import ArchiveManager
+from storage.mmap_store import LISTING_FIELDS, MmapBackend, PackedArticles, write_pack
+
+
+def packed(storage, articles, **kwargs):
+    path = os.path.join(storage, 'articles.pack')
+    write_pack(path, articles)
+    return PackedArticles(path, **kwargs).articles()
+
+
+def test_round_trip_matches_the_plain_articles(storage):
+    source = [make_article('a1', expert_quotes=[{'expert': 'Dr. X', 'quote': 'Indeed.'}]),
+              make_article('a2', category=None)]
+    articles = packed(storage, source)
+
+    assert articles == source
+    assert json.loads(json.dumps(articles)) == source
+    assert [dict(article) for article in articles] == source
+    assert pickle.loads(pickle.dumps(articles[0])) == source[0]
+    assert 'category' in articles[1] and articles[1]['category'] is None
+
+
+def test_body_fields_are_not_kept_on_the_article(storage):
+    article = packed(storage, [make_article('a1')])[0]
+
+    assert article['body_paragraphs'] == ['Body of story a1.']
+    assert article.get('headline').startswith('Committee')
+    assert not dict.__contains__(article, 'body_paragraphs')
+    # The listing record is small and read by every list page, so it stays
+    assert all(dict.__contains__(article, field) for field in LISTING_FIELDS & set(make_article('a1')))
+    assert article.get('missing', 'default') == 'default'
+
+
+def test_body_cache_is_bounded(storage):
+    articles = packed(storage, [make_article(f"a{n}") for n in range(10)], body_cache_size=3)
+    for article in articles:
+        article['body_paragraphs']
+    assert len(articles[0]._pack._bodies) == 3
+
+
+def test_changes_win_over_the_pack(storage):
+    first, second = packed(storage, [make_article('a1'), make_article('a2')])
+    assert first.raw_records() is not None
+
+    first['body_paragraphs'] = ['Rewritten.']
+    assert first['body_paragraphs'] == ['Rewritten.']
+    assert first.raw_records() is None
+
+    assert second.pop('opening_paragraph').startswith('Officials')
+    assert 'opening_paragraph' not in second
+    assert second['body_paragraphs'] == ['Body of story a2.']
+
+
+def test_compaction_folds_the_journal_into_a_new_pack(storage):
+    archive = ArchiveManager(storage, backend=MmapBackend(storage, compact_every=2))
+    archive.add_articles([make_article('a1')])
+    archive.add_articles([make_article('a2')])
+    archive.add_articles([make_article('a3')])
+
+    pack = PackedArticles(os.path.join(storage, 'articles.pack'))
+    assert pack.columns['id'] == ['a1', 'a2']
+    reloaded = ArchiveManager(storage, backend=MmapBackend(storage, compact_every=2))
+    assert [a['id'] for a in reloaded.articles] == ['a1', 'a2', 'a3']
+    assert reloaded.get_article_by_id('a2')['body_paragraphs'] == ['Body of story a2.']
+
+
+def test_first_use_imports_the_json_archive_with_its_journal(storage):
+    # A compacted snapshot plus records still in the journal
+    json_archive = ArchiveManager(storage)
+    json_archive.add_articles([make_article('a1'), make_article('a2')])
+    json_archive.save_articles()
+    json_archive.add_article(make_article('a3'))
+    with open(os.path.join(storage, 'articles.journal.jsonl'), 'a') as f:
+        # A record in the older single-article format
+        f.write(json.dumps({'op': 'add', 'article': make_article('a4')}) + '\n')
+
+    archive = ArchiveManager(storage, backend=MmapBackend(storage))
+    assert [a['id'] for a in archive.articles] == ['a1', 'a2', 'a3', 'a4']
+    assert archive.get_article_by_id('a4')['headline'] == make_article('a4')['headline']
+    # The JSON archive is left alone
+    assert [a['id'] for a in ArchiveManager(storage).articles] == ['a1', 'a2', 'a3', 'a4']
+
+
+def test_first_use_with_only_a_journal(storage):
+    ArchiveManager(storage).add_article(make_article('a1'))
+    assert not os.path.exists(os.path.join(storage, 'articles.json'))
+
+    archive = ArchiveManager(storage, backend=MmapBackend(storage))
+    assert [a['id'] for a in archive.articles] == ['a1']
@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+
+from conftest import news_result
+from api.newsdata import NewsDataAPI
+from api.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+OK = (200, {'status': 'success', 'results': [news_result('https://example.com/1')]})
+
+
+def scripted(*responses):
+    """respond() that plays `responses` in order, then keeps repeating the last one"""
+    remaining = list(responses)
+
+    def respond(params):
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+    return respond
+
+
+class RecordingPolicy(RetryPolicy):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.delays = []
+
+    def delay(self, attempt, retry_after=None):
+        delay = super().delay(attempt, retry_after)
+        self.delays.append((attempt, retry_after, delay))
+        return delay
+
+
+def test_backs_off_on_throttling_and_server_errors(news_server):
+    news_server.respond = scripted((429, {}, {'Retry-After': '0'}), (503, {}), OK)
+    policy = RecordingPolicy(backoff_base=0.01)
+    api = NewsDataAPI(base_url=news_server.url, retry_policy=policy)
+
+    assert [a['url'] for a in api.fetch_category('world')] == ['https://example.com/1']
+    assert len(news_server.requests) == 3
+    # Retry-After wins over our own backoff; after that, jitter under base * 2^attempt
+    assert policy.delays[0] == (0, '0', 0.0)
+    attempt, _, delay = policy.delays[1]
+    assert attempt == 1 and 0 <= delay <= 0.02
+    assert api.get_metrics()['retries'] == 2
+    assert api.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_errors_are_not_retried_or_counted_against_upstream(news_server):
+    news_server.respond = scripted((400, {'status': 'error'}))
+    api = NewsDataAPI(base_url=news_server.url, retry_policy=RetryPolicy(backoff_base=0.01))
+
+    with pytest.raises(RuntimeError, match='400'):
+        api.fetch_category('world')
+    assert len(news_server.requests) == 1
+    assert api.circuit_breaker.failures == 0
+
+
+def test_breaker_opens_after_threshold_and_recovers(news_server):
+    news_server.respond = scripted((500, {}), (500, {}), OK)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+    api = NewsDataAPI(base_url=news_server.url, retry_policy=RetryPolicy(max_retries=0),
+                      circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            api.fetch_category('world')
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        api.fetch_category('world')
+    assert len(news_server.requests) == 2
+
+    time.sleep(0.12)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert api.fetch_category('world')
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert api.get_metrics()['short_circuited'] == 1
+
+
+def test_failed_probe_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_lets_a_single_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    start = threading.Barrier(8)
+    allowed = []
+
+    def caller():
+        start.wait()
+        allowed.append(breaker.allow_request())
+
+    threads = [threading.Thread(target=caller) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert allowed.count(True) == 1
+
+    # A probe that never reports back is given up on after another cool-down
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert all(breaker.allow_request() for _ in range(3))
@@ -0,0 +1,36 @@
+import pytest
+
+from generation.satire_engine import SatireEngine
+
+STORY = {'title': 'Senate passes budget after all-night session', 'content': 'Lawmakers voted 51-49.',
+         'category': 'politics', 'url': 'https://example.com/budget', 'source': 'wire'}
+
+app_module = pytest.importorskip('app')
+
+
+def generated(engine):
+    article = engine.generate_satire_article(dict(STORY), use_cache=False)
+    return {k: v for k, v in article.items() if k != 'timestamp'}
+
+
+def test_deterministic_mode_repeats_and_keeps_ids():
+    first = generated(SatireEngine(seed='7', deterministic=True))
+    assert generated(SatireEngine(seed='7', deterministic=True)) == first
+    assert generated(SatireEngine()).get('id') == first['id']
+
+
+def test_unseeded_engines_differ():
+    outputs = {repr(generated(SatireEngine())) for _ in range(5)}
+    assert len(outputs) > 1
+
+
+def test_app_only_seeds_when_asked(storage, monkeypatch):
+    monkeypatch.delenv('SATIRE_SEED', raising=False)
+    monkeypatch.delenv('SATIRE_DETERMINISTIC', raising=False)
+    assert app_module.Components(storage).satire_engine.seed is None
+
+    monkeypatch.setenv('SATIRE_DETERMINISTIC', '1')
+    assert app_module.Components(storage).satire_engine.seed == '0'
+
+    monkeypatch.setenv('SATIRE_SEED', '42')
+    assert app_module.Components(storage).satire_engine.seed == '42'
@@ -0,0 +1,67 @@
+import threading
+
+from conftest import make_article
+from storage.sqlite_archive import SQLiteArchiveManager
+
+
+def test_newest_first_by_category(storage):
+    archive = SQLiteArchiveManager(storage)
+    archive.add_articles([
+        make_article('a1', timestamp='2024-01-01T10:00:00'),
+        make_article('a2', category='science', timestamp='2024-01-03T10:00:00'),
+        make_article('a3', timestamp='2024-01-02T10:00:00'),
+    ])
+
+    assert [a['id'] for a in archive.get_latest_articles()] == ['a2', 'a3', 'a1']
+    assert [a['id'] for a in archive.search_articles(category='World')] == ['a3', 'a1']
+    assert archive.get_categories() == ['science', 'world']
+
+
+def test_ids_are_normalized_like_archive_manager(storage):
+    archive = SQLiteArchiveManager(storage)
+    archive.add_article(make_article(8958))
+
+    assert archive.get_article_by_id('8958')['id'] == 8958
+    assert archive.get_article_by_id(' 8958 ')['id'] == 8958
+    assert not archive.add_article(make_article('8958'))
+
+
+def test_own_writes_bump_generation_once(storage):
+    archive = SQLiteArchiveManager(storage)
+    archive.add_article(make_article('a1'))
+    archive.add_articles([make_article('a2'), make_article('a3')])
+    assert archive.generation == 2
+
+    # Another thread has its own connection, whose data_version did move
+    refreshed = []
+    thread = threading.Thread(target=lambda: refreshed.append(archive.refresh()))
+    thread.start()
+    thread.join()
+    assert refreshed == [False]
+    assert archive.generation == 2
+
+
+def test_refresh_picks_up_other_connections(storage):
+    archive = SQLiteArchiveManager(storage)
+    archive.add_article(make_article('a1'))
+    assert archive.search_ranked('committee')
+
+    other = SQLiteArchiveManager(storage)
+    other.add_article(make_article('a2', headline='Parliament adjourns for lunch'))
+
+    assert archive.refresh()
+    assert archive.generation == 2
+    assert [a['id'] for a in archive.search_ranked('parliament')] == ['a2']
+    assert not archive.refresh()
+
+
+def test_delete_old_articles_updates_index(storage):
+    archive = SQLiteArchiveManager(storage)
+    archive.add_articles([make_article('old', timestamp='2000-01-01T00:00:00'),
+                          make_article('new', timestamp='2999-01-01T00:00:00')])
+    archive.get_search_index()
+
+    assert archive.delete_old_articles(days=30) == 1
+    assert archive.generation == 2
+    assert [a['id'] for a in archive.search_ranked('committee')] == ['new']
+    assert not archive.refresh()
@@ -4,56 +4,52 @@ Simple Daily Automation for OK Crisis News
 Runs automatically every day to generate content and deploy
 """
 
-import requests
 import subprocess
-import time
+import sys
 from datetime import datetime
 import os
 
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crisis-display')
+BUILD_DIR = os.path.join(SITE_DIR, 'build')
+
 def log(message):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] {message}")
 
 def generate_content():
-    """Generate new articles and deploy"""
+    """Generate new articles, pre-render the site and deploy"""
     log("Starting daily content generation...")
     
-    # Start the server first
-    log("Starting server...")
-    os.chdir("web")
-    server_process = subprocess.Popen(["python", "app.py"])
-    time.sleep(10)  # Wait for server to start
+    # Load the site in-process; no server, no waiting for it to boot
+    sys.path.insert(0, SITE_DIR)
+    import app as site
+    from build_static import build_site
+    
+    # Generate new articles
+    log("Generating new articles...")
+    response = site.app.test_client().get("/refresh-news?wait=120")
+    data = response.get_json() or {}
+    if data.get('success'):
+        log(f"SUCCESS: {data.get('message', 'Articles generated')}")
+    else:
+        log(f"FAILED: {data.get('message', 'Unknown error')}")
+    
+    # Pre-render the site
+    log("Building static site...")
+    summary = build_site(site.app, site.app.extensions['components'].archive_manager, BUILD_DIR)
+    log(f"Built {summary['pages']} pages ({summary['rendered']} rendered, {summary['skipped']} unchanged)")
+    
+    # Deploy to surge
+    log("Deploying to Surge...")
+    result = subprocess.run(
+        ['surge', BUILD_DIR, 'okcrisis-news.surge.sh'], 
+        capture_output=True, text=True, timeout=120
+    )
     
-    try:
-        # Generate new articles
-        log("Generating new articles...")
-        response = requests.get("http://localhost:5000/refresh-news", timeout=30)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('success'):
-                log(f"SUCCESS: {data.get('message', 'Articles generated')}")
-            else:
-                log(f"FAILED: {data.get('message', 'Unknown error')}")
-        else:
-            log(f"FAILED: Server returned {response.status_code}")
-        
-        # Deploy to surge
-        log("Deploying to Surge...")
-        result = subprocess.run(
-            ['surge', '--domain', 'okcrisis-news.surge.sh'], 
-            capture_output=True, text=True, timeout=120
-        )
-        
-        if result.returncode == 0:
-            log("SUCCESS: Site deployed to okcrisis-news.surge.sh")
-        else:
-            log(f"FAILED: Deployment error - {result.stderr}")
-            
-    finally:
-        # Stop server
-        server_process.terminate()
-        os.chdir("..")
+    if result.returncode == 0:
+        log("SUCCESS: Site deployed to okcrisis-news.surge.sh")
+    else:
+        log(f"FAILED: Deployment error - {result.stderr}")
     
     log("Daily automation completed!")
 
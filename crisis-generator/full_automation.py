@@ -13,11 +13,16 @@ from datetime import datetime
 import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crisis-display', 'src'))
+from jobs.job_queue import job_outcome, wait_for_job
+
 class NewsSiteAutomation:
     def __init__(self):
         self.base_url = "http://localhost:5000"
         self.surge_domain = "okcrisis-news.surge.sh"
         self.log_file = "automation.log"
+        self.site_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crisis-display')
+        self.build_dir = os.path.join(self.site_dir, 'build')
         
     def log(self, message):
         """Log automation events"""
@@ -37,19 +42,34 @@ class NewsSiteAutomation:
         except:
             return False
     
+    def wait_for_job(self, response, timeout=120):
+        """Poll a queued refresh job until it finishes; returns its result"""
+        data = response.json()
+        if response.status_code != 202:
+            return data
+        self.log(f"⏳ Refresh queued as job {data['job_id']}")
+        return job_outcome(wait_for_job(self.get_job, data['job_id'], timeout))
+    
+    def get_job(self, job_id):
+        return requests.get(f"{self.base_url}/api/jobs/{job_id}", timeout=10).json()
+    
     def generate_articles(self, category=None):
-        """Generate new articles"""
+        """Generate new articles (category may be a list, fetched in parallel)"""
+        if isinstance(category, (list, tuple)):
+            category = ",".join(category)
         self.log(f"🔄 Generating articles{' for ' + category if category else ''}...")
         
         try:
             url = f"{self.base_url}/refresh-news"
-            if category:
+            if category and "," in category:
+                url += f"?categories={category}"
+            elif category:
                 url += f"?category={category}"
                 
-            response = requests.get(url, timeout=30)
+            response = requests.get(url, timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code in (200, 202):
+                data = self.wait_for_job(response)
                 if data.get('success'):
                     self.log(f"✅ {data.get('message', 'Articles generated')}")
                     return True
@@ -91,20 +111,26 @@ class NewsSiteAutomation:
         self.log("🚀 Deploying to Surge...")
         
         try:
-            # Change to web directory
-            os.chdir("web")
+            # Pre-render the site straight to disk (no server needed)
+            build = subprocess.run(
+                [sys.executable, os.path.join(self.site_dir, 'build_static.py'), '--out', self.build_dir],
+                capture_output=True,
+                text=True,
+                timeout=300
+            )
+            if build.returncode != 0:
+                self.log(f"❌ Static build failed: {build.stdout}{build.stderr}")
+                return False
+            self.log(build.stdout.strip().splitlines()[-1] if build.stdout.strip() else "✅ Static build complete")
             
             # Run surge command
             result = subprocess.run(
-                ['surge', '--domain', self.surge_domain], 
+                ['surge', self.build_dir, self.surge_domain], 
                 capture_output=True, 
                 text=True,
                 timeout=120
             )
             
-            # Change back to parent directory
-            os.chdir("..")
-            
             if result.returncode == 0:
                 self.log(f"✅ Deployed successfully to {self.surge_domain}")
                 return True
@@ -172,11 +198,8 @@ class NewsSiteAutomation:
             self.log("❌ Server is not running!")
             return
         
-        # Generate politics articles
-        self.generate_articles("politics")
-        
-        # Generate world articles
-        self.generate_articles("world")
+        # Generate politics and world articles in one parallel refresh
+        self.generate_articles(["politics", "world"])
         
         # Create morning comic
         self.create_comic()
@@ -46,7 +46,7 @@ class VoiceAdmin:
         """Generate new articles"""
         self.speak("Refreshing news and generating new articles...")
         try:
-            response = requests.get(f"{self.base_url}/refresh-news")
+            response = requests.get(f"{self.base_url}/refresh-news?wait=60", timeout=90)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success'):